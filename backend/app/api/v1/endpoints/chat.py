@@ -1,9 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
+from app.core.pagination import keyset_page
 from app.db.models import ChatSession, ChatMessage, Resume, get_session
 
 router = APIRouter()
@@ -26,6 +29,16 @@ class ChatSessionResponse(BaseModel):
     is_active: bool
     messages: List[MessageResponse]
 
+class ChatSessionPage(BaseModel):
+    sessions: List[ChatSessionResponse]  # oldest first
+    prev_cursor: Optional[str] = None  # pass as `before` for earlier sessions
+    next_cursor: Optional[str] = None  # pass as `after` for later sessions
+
+class MessagePage(BaseModel):
+    messages: List[MessageResponse]  # oldest first
+    prev_cursor: Optional[str] = None  # pass as `before` for older messages
+    next_cursor: Optional[str] = None  # pass as `after` for newer messages
+
 @router.post("/sessions/{resume_id}", response_model=ChatSessionResponse)
 async def create_chat_session(
     resume_id: int,
@@ -45,19 +58,64 @@ async def create_chat_session(
     
     return chat_session
 
-@router.get("/sessions/{resume_id}", response_model=List[ChatSessionResponse])
+def recent_messages(db: Session, session_ids: List[int], limit: int) -> Dict[int, List[ChatMessage]]:
+    """The last ``limit`` messages of each session, oldest first, in one query."""
+    position = func.row_number().over(
+        partition_by=ChatMessage.session_id,
+        order_by=(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+    ).label("position")
+    ranked = (
+        select(ChatMessage.id, position)
+        .where(ChatMessage.session_id.in_(session_ids))
+        .subquery()
+    )
+    query = (
+        select(ChatMessage)
+        .join(ranked, ranked.c.id == ChatMessage.id)
+        .where(ranked.c.position <= limit)
+        .order_by(ChatMessage.session_id, ChatMessage.created_at, ChatMessage.id)
+    )
+    messages: Dict[int, List[ChatMessage]] = {session_id: [] for session_id in session_ids}
+    for message in db.exec(query):
+        messages[message.session_id].append(message)
+    return messages
+
+@router.get("/sessions/{resume_id}", response_model=ChatSessionPage)
 async def get_chat_sessions(
     resume_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+    messages: Optional[int] = Query(None, ge=0, le=200, description="Only the last N messages of each session"),
     session: Session = Depends(get_session)
 ):
-    """Get all chat sessions for a resume."""
+    """Get a page of chat sessions for a resume, with their messages.
+
+    Without a cursor this is the latest page, so the newest sessions are
+    always on it; ``prev_cursor`` pages back to older ones.
+
+    Messages are loaded for the whole page at once, so the request makes
+    the same number of queries however many sessions there are.
+    """
     resume = session.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     
     query = select(ChatSession).where(ChatSession.resume_id == resume_id)
-    sessions = session.exec(query).all()
-    return sessions
+    if messages is None:
+        query = query.options(selectinload(ChatSession.messages))
+    page = keyset_page(session, query, ChatSession, limit, before=before, after=after, newest_first=True)
+
+    if messages is None:
+        sessions = page.items
+    else:
+        session_ids = [chat_session.id for chat_session in page.items]
+        recent = recent_messages(session, session_ids, messages) if messages and session_ids else {}
+        sessions = [
+            {**chat_session.model_dump(), "messages": recent.get(chat_session.id, [])}
+            for chat_session in page.items
+        ]
+    return {"sessions": sessions, "prev_cursor": page.prev_cursor, "next_cursor": page.next_cursor}
 
 @router.post("/sessions/{session_id}/messages", response_model=MessageResponse)
 async def create_message(
@@ -89,25 +147,22 @@ async def create_message(
     
     return db_message
 
-@router.get("/sessions/{session_id}/messages", response_model=List[MessageResponse])
+@router.get("/sessions/{session_id}/messages", response_model=MessagePage)
 async def get_messages(
     session_id: int,
-    limit: Optional[int] = 50,
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[str] = None,
+    after: Optional[str] = None,
     session: Session = Depends(get_session)
 ):
-    """Get messages from a chat session."""
+    """Get a page of messages from a chat session; the latest page unless a cursor is given."""
     chat_session = session.get(ChatSession, session_id)
     if not chat_session:
         raise HTTPException(status_code=404, detail="Chat session not found")
     
-    query = (
-        select(ChatMessage)
-        .where(ChatMessage.session_id == session_id)
-        .order_by(ChatMessage.created_at.desc())
-        .limit(limit)
-    )
-    messages = session.exec(query).all()
-    return list(reversed(messages))  # Return in chronological order
+    query = select(ChatMessage).where(ChatMessage.session_id == session_id)
+    page = keyset_page(session, query, ChatMessage, limit, before=before, after=after, newest_first=True)
+    return {"messages": page.items, "prev_cursor": page.prev_cursor, "next_cursor": page.next_cursor}
 
 @router.post("/sessions/{session_id}/close")
 async def close_session(
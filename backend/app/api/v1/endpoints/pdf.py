@@ -1,37 +1,30 @@
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Depends, Request
 from typing import Optional
 from sqlmodel import Session
-from app.db.models import Resume, get_session
-import os
-from app.core.config import settings
+from app.db.models import get_session
+from app.core.file_server import file_server
+from app.core.render_cache import render_cache
+from app.core.thumbnails import thumbnail_renderer
 
 router = APIRouter()
 
 @router.get("/serve-pdf/{resume_id}")
-async def serve_pdf(resume_id: int, session: Session = Depends(get_session)):
+async def serve_pdf(resume_id: int, request: Request, session: Session = Depends(get_session)):
     """Serve a resume PDF file with proper headers."""
-    resume = session.get(Resume, resume_id)
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
-    
-    if not os.path.exists(resume.file_path):
-        raise HTTPException(status_code=404, detail="PDF file not found")
-        
-    filename = os.path.basename(resume.file_path)
-    
     headers = {
-        "Content-Disposition": f'inline; filename="{filename}"',
-        "Content-Type": "application/pdf",
         "Access-Control-Allow-Origin": "http://localhost:3000",
         "Access-Control-Allow-Methods": "GET, OPTIONS",
         "Access-Control-Allow-Headers": "Content-Type, Accept, Origin",
         "Access-Control-Max-Age": "86400",
     }
-    
-    return FileResponse(
-        path=resume.file_path,
-        headers=headers,
-        media_type="application/pdf",
-        filename=filename
-    )
\ No newline at end of file
+
+    return file_server.serve(request, session, "resume", resume_id, headers=headers, media_type="application/pdf")
+
+
+@router.get("/stats", summary="File serving metrics")
+async def file_serving_stats():
+    """Request count, bytes sent, latency, transfer modes and metadata cache hit rate for file downloads."""
+    stats = file_server.stats()
+    stats['thumbnail_cache'] = thumbnail_renderer.stats()
+    stats['render_cache'] = render_cache.stats()
+    return stats
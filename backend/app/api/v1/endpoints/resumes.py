@@ -1,44 +1,42 @@
-from fastapi import APIRouter, HTTPException, Response, Depends, File, UploadFile, Form
-from fastapi.responses import FileResponse, JSONResponse
-from typing import Dict, Any, Optional
-import tempfile
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph
-from reportlab.lib.units import inch
+from fastapi import APIRouter, HTTPException, Request, Response, Depends, File, UploadFile, Form
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, Field
+from dataclasses import asdict
+import asyncio
+import json
+import re
 import os
-import shutil
 import traceback
-from datetime import datetime
-from sqlmodel import Session
+from sqlmodel import Session, select
 
-from app.db.models import Resume, CoverLetter, engine, get_session
+from app.db.models import Resume, CoverLetter, Job, ResumeExtraction, engine, get_session
+from app.core.ats import resume_to_text
+from app.core.cover_letter_pdf import iter_chunks, render_cover_letter_pdf_async
 from app.core.config import settings
+from app.core.jobs import QUEUED, RUNNING, enqueue, notify_job_worker
+from app.core.resume_index import resume_index
+from app.core.render_batch import zip_variants
+from app.core.render_cache import render_cache
+from app.core.blob_store import UPLOAD_DIR, blob_store
+from app.core.file_server import file_server
+from app.core.thumbnails import THUMBNAIL_FORMATS, THUMBNAIL_WIDTHS, ThumbnailError, can_preview, thumbnail_renderer
+from app.core.uploads import StoredUpload
 
 router = APIRouter()
 
-UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "uploads")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-def validate_file(file: UploadFile) -> bool:
-    """Validate file type and size."""
-    allowed_types = ["application/pdf", "application/msword", 
-                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"]
-    max_size = 5 * 1024 * 1024  # 5MB
-
-    content_type = file.content_type
-    if content_type not in allowed_types:
-        raise HTTPException(status_code=400, detail="File type not allowed")
-    
-    # Read file into memory to check size
-    file_data = file.file.read()
-    if len(file_data) > max_size:
-        raise HTTPException(status_code=400, detail="File too large (max 5MB)")
-    
-    # Reset file pointer
-    file.file.seek(0)
-    return True
+# Resume and cover letter uploads
+UPLOAD_MAX_SIZE = 5 * 1024 * 1024  # 5MB
+UPLOAD_MIME_TYPES = (
+    "application/pdf",
+    "application/msword",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+)
+
+async def store_upload(file: UploadFile) -> StoredUpload:
+    """Validate an upload and store it in the blob store (once per distinct content)."""
+    return await blob_store.put_upload(file, max_size=UPLOAD_MAX_SIZE, allowed_mime_types=UPLOAD_MIME_TYPES)
 
 @router.get("/", summary="Resumes root")
 async def resumes_root():
@@ -52,37 +50,24 @@ async def upload_files(
     role: str = Form(...),
     cv: UploadFile = File(...),
     cover_letter: Optional[UploadFile] = File(None),
+    job_description: Optional[str] = Form(None),
     session: Session = Depends(get_session)
 ):
     """Upload resume and optional cover letter files."""
-    folder_path = None
+    stored_paths = []
+    # Blobs this request wrote (not deduplicated ones), released later if the upload fails
+    created_paths = []
     try:
         print(f"Received upload request - name: {name}, email: {email}, role: {role}")
         print(f"CV file: {cv.filename}, content_type: {cv.content_type}")
-        
-        # Validate files
-        validate_file(cv)
-        if cover_letter:
-            validate_file(cover_letter)
-
-        # Create folder structure
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        folder_name = f"{role}_{name.replace(' ', '_')}_{timestamp}"
-        folder_path = os.path.join(UPLOAD_DIR, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
-        print(f"Created directory: {folder_path}")
-
-        # Save resume
-        cv_filename = f"CV_{os.path.basename(cv.filename)}"
-        cv_path = os.path.join(folder_path, cv_filename)
-        
-        print(f"Saving CV to: {cv_path}")
-        contents = await cv.read()
-        with open(cv_path, "wb") as f:
-            f.write(contents)
-        
-        # Reset file pointer for potential reuse
-        await cv.seek(0)
+
+        # Save resume (identical files are stored once)
+        stored_cv = await store_upload(cv)
+        cv_path = stored_cv.path
+        stored_paths.append(cv_path)
+        if stored_cv.created:
+            created_paths.append(cv_path)
+        print(f"Stored CV at {cv_path}: {stored_cv.size} bytes, {stored_cv.mime_type}")
 
         # Create resume record
         db_resume = Resume(
@@ -98,13 +83,13 @@ async def upload_files(
         # Save cover letter if provided
         cl_path = None
         if cover_letter:
-            cl_filename = f"CL_{os.path.basename(cover_letter.filename)}"
-            cl_path = os.path.join(folder_path, cl_filename)
-            print(f"Saving cover letter to: {cl_path}")
-            cl_contents = await cover_letter.read()
-            with open(cl_path, "wb") as f:
-                f.write(cl_contents)
-            
+            stored_cl = await store_upload(cover_letter)
+            cl_path = stored_cl.path
+            stored_paths.append(cl_path)
+            if stored_cl.created:
+                created_paths.append(cl_path)
+            print(f"Stored cover letter at {cl_path}")
+
             # Create cover letter record
             db_cover_letter = CoverLetter(
                 resume_id=db_resume.id,
@@ -113,63 +98,285 @@ async def upload_files(
             session.add(db_cover_letter)
             print(f"Created cover letter record for resume ID: {db_resume.id}")
 
+        # Extraction (and scoring, when a job description was sent) runs in the background
+        enqueue(session, "extract", db_resume.id, {"job_description": job_description},
+                max_attempts=settings.job_max_attempts)
+        for path in stored_paths:
+            if can_preview(path):
+                enqueue(session, "thumbnail", payload={"path": path}, max_attempts=settings.job_max_attempts)
         session.commit()
         print("Database transaction committed successfully")
 
+        # Row ids can be reused after deletes; never serve stale metadata
+        file_server.invalidate("resume", db_resume.id)
+        if cover_letter:
+            file_server.invalidate("cover_letter", db_cover_letter.id)
+
+        notify_job_worker()
+
         return JSONResponse({
             "message": "Files uploaded successfully",
             "cv_path": cv_path,
             "cover_letter_path": cl_path,
-            "resume_id": db_resume.id
+            "resume_id": db_resume.id,
+            "status": db_resume.status,
+            "sha256": stored_cv.sha256
         })
 
     except Exception as e:
-        # Cleanup on error
-        if 'folder_path' in locals():
-            shutil.rmtree(folder_path, ignore_errors=True)
+        # Files this upload wrote are released after a grace period, unless another
+        # request that deduplicated to them has referenced them by then
+        session.rollback()
+        try:
+            for path in created_paths:
+                enqueue(session, "release_blob", payload={"path": path}, max_attempts=settings.job_max_attempts,
+                        delay_seconds=settings.blob_release_grace_seconds)
+            session.commit()
+            notify_job_worker()
+        except Exception as cleanup_error:
+            session.rollback()
+            print(f"Could not schedule release of failed upload files: {cleanup_error}")
+        if isinstance(e, HTTPException):
+            raise
         raise HTTPException(status_code=500, detail=str(e))
 
+def resume_status(session: Session, resume_id: int) -> Dict[str, Any]:
+    resume = session.get(Resume, resume_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    jobs = session.exec(select(Job).where(Job.resume_id == resume_id).order_by(Job.id)).all()
+    return {
+        "resume_id": resume_id,
+        "status": resume.status,
+        "ats_score": resume.ats_score,
+        "pending": any(job.status in (QUEUED, RUNNING) for job in jobs),
+        "jobs": [
+            {
+                "id": job.id,
+                "kind": job.kind,
+                "status": job.status,
+                "attempts": job.attempts,
+                "last_error": job.last_error,
+                "run_after": job.run_after,
+                "finished_at": job.finished_at
+            }
+            for job in jobs
+        ]
+    }
+
+@router.get("/{resume_id}/status", summary="Get (or wait for) the processing status of a resume")
+async def get_resume_status(
+    resume_id: int,
+    wait: float = 0,
+    since: Optional[str] = None
+):
+    """Return the resume's processing status and jobs.
+
+    With ``wait`` the request is held (long-polling) until the status differs
+    from ``since`` (default: the status when the request arrived) or the wait
+    runs out.
+    """
+    def read_status() -> Dict[str, Any]:
+        # A short-lived session per read, so a waiting poll holds no pooled connection
+        with Session(engine) as session:
+            return resume_status(session, resume_id)
+
+    current = await run_in_threadpool(read_status)
+    if since is None:
+        since = current["status"]
+    deadline = asyncio.get_running_loop().time() + min(wait, settings.job_status_max_wait_seconds)
+    while current["status"] == since and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(settings.job_poll_interval_seconds)
+        current = await run_in_threadpool(read_status)
+    return current
+
+@router.get("/{resume_id}/extraction", summary="Get the text and structure extracted from a resume")
+async def get_resume_extraction(resume_id: int, session: Session = Depends(get_session)):
+    """Return the stored extraction of an uploaded resume."""
+    extraction = session.get(ResumeExtraction, resume_id)
+    if not extraction:
+        raise HTTPException(status_code=404, detail="Resume extraction not found")
+    return {
+        "resume_id": resume_id,
+        "text": extraction.text,
+        "resume": json.loads(extraction.structured),
+        "extracted_at": extraction.extracted_at
+    }
+
+class ATSScoreRequest(BaseModel):
+    job_description: str
+    # Structured resume JSON (as edited in the frontend) or plain resume text
+    resume: Optional[Dict[str, Any]] = None
+    resume_text: Optional[str] = None
+
+@router.post("/{resume_id}/ats-score", summary="Score a resume against a job description")
+def score_resume(
+    resume_id: int,
+    request: ATSScoreRequest,
+    session: Session = Depends(get_session)
+):
+    """Compute the ATS keyword-match score for a resume and store it on the resume."""
+    resume = session.get(Resume, resume_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    resume_text = request.resume_text or resume_to_text(request.resume or {})
+    if not resume_text.strip():
+        raise HTTPException(status_code=400, detail="Provide resume or resume_text to score")
+
+    resume_index.refresh(session)
+    result = resume_index.score(resume_text, request.job_description)
+    resume.ats_score = result.score
+    session.add(resume)
+    session.commit()
+
+    return {
+        "resume_id": resume_id,
+        "ats_score": result.score,
+        "matched_keywords": result.matched_keywords,
+        "missing_keywords": result.missing_keywords
+    }
+
+class ATSRankRequest(BaseModel):
+    job_description: str
+    offset: int = Field(default=0, ge=0)
+    limit: int = Field(default=50, ge=1)
+    # Return newline-delimited JSON instead of a single document
+    stream: bool = False
+
+@router.post("/rank", summary="Rank all stored resumes against a job description")
+def rank_resumes(request: ATSRankRequest, session: Session = Depends(get_session)):
+    """Score every stored resume against a job description and return the best matches."""
+    resume_index.refresh(session)
+    total, page = resume_index.rank(request.job_description, offset=request.offset, limit=request.limit)
+    results = [asdict(ranked) for ranked in page]
+
+    if request.stream or len(results) > settings.ats_rank_stream_threshold:
+        def generate():
+            yield json.dumps({"total": total, "offset": request.offset}) + "\n"
+            for result in results:
+                yield json.dumps(result) + "\n"
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    return {
+        "total": total,
+        "offset": request.offset,
+        "limit": request.limit,
+        "results": results
+    }
+
+class RenderPDFRequest(BaseModel):
+    # Structured resume JSON in the frontend's Resume shape, plus optional name and summary
+    resume: Dict[str, Any]
+    filename: str = "resume.pdf"
+
+def download_filename(filename: str, extension: str = ".pdf") -> str:
+    """A header-safe download name."""
+    name = re.sub(r'[^\w.-]+', '_', os.path.basename(filename)).strip('._') or "download"
+    return name if name.lower().endswith(extension) else name + extension
+
+@router.post("/render-pdf", summary="Render structured resume JSON as an ATS-friendly PDF")
+async def render_pdf(request: RenderPDFRequest, http_request: Request):
+    """Lay out the resume with the server-side template and return the PDF.
+
+    Renders are cached by content and template version; an unchanged
+    resume is served from the cache without laying it out again.
+    """
+    path, hit = await render_cache.get_or_render(request.resume)
+    headers = {
+        'Access-Control-Expose-Headers': 'Content-Disposition, X-Render-Cache',
+        'X-Render-Cache': 'hit' if hit else 'miss'
+    }
+    return file_server.serve_path(http_request, path, headers=headers, media_type="application/pdf",
+                                  filename=download_filename(request.filename))
+
+class ResumeVariant(BaseModel):
+    # File name in the zip (without .pdf), e.g. the job it is tailored for
+    name: str = Field(..., min_length=1, max_length=100)
+    summary: Optional[str] = None
+    # Skill names to list first, in this order; the others keep their order after them
+    skills: Optional[List[str]] = None
+    # Top-level sections replaced wholesale, e.g. {"experiences": [...]}
+    overrides: Dict[str, Any] = {}
+
+class RenderBatchRequest(BaseModel):
+    resume: Dict[str, Any]
+    variants: List[ResumeVariant] = Field(..., min_length=1, max_length=settings.render_batch_max_variants)
+    filename: str = "resumes.zip"
+
+@router.post("/render-pdf/batch", summary="Render tailored variants of a resume as a zip of PDFs")
+async def render_pdf_batch(request: RenderBatchRequest):
+    """Render one PDF per variant of the base resume, streamed as a zip.
+
+    Variants render in parallel on the process pool and each is added to
+    the zip as soon as it is done, so entries arrive in completion order.
+    Failed variants are listed in ``errors.txt`` inside the zip.
+    """
+    window = settings.render_batch_window or 2 * (settings.resume_extraction_workers or os.cpu_count() or 1)
+    variants = [
+        {**variant.model_dump(), "name": download_filename(variant.name, "")}
+        for variant in request.variants
+    ]
+    return StreamingResponse(
+        zip_variants(request.resume, variants, window),
+        media_type="application/zip",
+        headers={
+            'Content-Disposition': f'attachment; filename="{download_filename(request.filename, ".zip")}"',
+            'Access-Control-Expose-Headers': 'Content-Disposition'
+        }
+    )
+
 @router.get("/resume/{resume_id}", summary="Get resume file by ID")
-async def get_resume_file(resume_id: int, session: Session = Depends(get_session)):
+async def get_resume_file(resume_id: int, request: Request, session: Session = Depends(get_session)):
     """Get the uploaded resume file by ID."""
     try:
-        # Get the resume from the database
-        resume = session.get(Resume, resume_id)
-        if not resume:
-            raise HTTPException(status_code=404, detail="Resume not found")
-        
-        # Check if file exists
-        if not os.path.exists(resume.file_path):
-            raise HTTPException(status_code=404, detail="Resume file not found")
-            
-        # Get file name from path
-        filename = os.path.basename(resume.file_path)
-        
-        # Determine content type based on file extension
-        content_type = 'application/pdf'  # Default to PDF
-        if filename.lower().endswith('.doc'):
-            content_type = 'application/msword'
-        elif filename.lower().endswith('.docx'):
-            content_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-            
-        # Return the file
         headers = {
-            'Content-Disposition': f'inline; filename="{filename}"',
             'Access-Control-Expose-Headers': 'Content-Disposition',
             'Access-Control-Allow-Origin': '*',
             'Cache-Control': 'public, max-age=3600'
         }
-        
-        return FileResponse(
-            path=resume.file_path,
-            media_type=content_type,
-            filename=filename,
-            headers=headers
-        )
+        return file_server.serve(request, session, "resume", resume_id, headers=headers)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def serve_preview(request: Request, session: Session, kind: str, identifier: int, size: str,
+                        image_format: str) -> Response:
+    """Serve the cached first-page preview of a stored file."""
+    if size not in THUMBNAIL_WIDTHS:
+        raise HTTPException(status_code=400, detail=f"Size must be one of: {', '.join(THUMBNAIL_WIDTHS)}")
+    if image_format not in THUMBNAIL_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Format must be one of: {', '.join(THUMBNAIL_FORMATS)}")
+    path = file_server.locate(session, kind, identifier).path
+    if not can_preview(path):
+        raise HTTPException(status_code=415, detail="Previews are only available for PDF files")
+    try:
+        preview_path = await thumbnail_renderer.get(path, size, image_format)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    except ThumbnailError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        # Preview names include the content hash, so they never change
+        'Cache-Control': 'public, max-age=86400'
+    }
+    return file_server.serve_path(request, preview_path, headers=headers,
+                                  media_type=THUMBNAIL_FORMATS[image_format])
+
+@router.get("/resume/{resume_id}/preview", summary="Get a first-page preview image of a resume")
+async def get_resume_preview(
+    resume_id: int,
+    request: Request,
+    size: str = "medium",
+    format: str = "webp",
+    session: Session = Depends(get_session)
+):
+    """PNG or WebP of the resume's first page, small (160px), medium (320px) or large (640px) wide."""
+    return await serve_preview(request, session, "resume", resume_id, size, format)
+
 from fastapi.responses import JSONResponse
 from app.core.config import settings
 
@@ -222,25 +429,14 @@ async def upload_cover_letter(
         print(f"Received cover letter upload request - resume_id: {resume_id}")
         print(f"File: {file.filename}, content_type: {file.content_type}")
 
-        # Validate file
-        validate_file(file)
-
         # Get the resume from the database
         resume = session.get(Resume, int(resume_id))
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
 
-        # Create folder path based on existing resume
-        resume_dir = os.path.dirname(resume.file_path)
-        cl_filename = f"CL_{os.path.basename(file.filename)}"
-        cl_path = os.path.join(resume_dir, cl_filename)
-
-        print(f"Saving cover letter to: {cl_path}")
-
-        # Save cover letter
-        contents = await file.read()
-        with open(cl_path, "wb") as f:
-            f.write(contents)
+        # Save cover letter (identical files are stored once)
+        cl_path = (await store_upload(file)).path
+        print(f"Stored cover letter at {cl_path}")
 
         # Create cover letter record
         db_cover_letter = CoverLetter(
@@ -248,7 +444,11 @@ async def upload_cover_letter(
             file_path=cl_path
         )
         session.add(db_cover_letter)
+        if can_preview(cl_path):
+            enqueue(session, "thumbnail", payload={"path": cl_path}, max_attempts=settings.job_max_attempts)
         session.commit()
+        file_server.invalidate("cover_letter", db_cover_letter.id)
+        notify_job_worker()
 
         print(f"Created cover letter record for resume ID: {resume_id}")
 
@@ -258,48 +458,77 @@ async def upload_cover_letter(
             "cover_letter_id": db_cover_letter.id
         })
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error uploading cover letter: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+class CoverLetterPDFRequest(BaseModel):
+    content: str = Field(..., min_length=1, max_length=20000)
+    # Also save the PDF as this resume's cover letter
+    resume_id: Optional[int] = None
+    filename: str = "cover-letter.pdf"
+
+@router.post("/generate-cover-letter-pdf", summary="Render cover letter text as a PDF")
+async def generate_cover_letter_pdf(request: CoverLetterPDFRequest, session: Session = Depends(get_session)):
+    """Render the cover letter with reportlab and stream the PDF back.
+
+    Nothing is written to disk unless ``resume_id`` is given; the PDF is
+    then also stored as that resume's cover letter, and the new row's id
+    is returned in the ``X-Cover-Letter-Id`` header.
+    """
+    resume = None
+    if request.resume_id is not None:
+        resume = session.get(Resume, request.resume_id)
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
+
+    pdf = await render_cover_letter_pdf_async(request.content, resume.name if resume else None,
+                                              settings.resume_extraction_workers)
+    headers = {
+        'Content-Disposition': f'attachment; filename="{download_filename(request.filename)}"',
+        'Content-Length': str(len(pdf)),
+        'Access-Control-Expose-Headers': 'Content-Disposition, X-Cover-Letter-Id'
+    }
+
+    if resume:
+        stored = await run_in_threadpool(blob_store.put_bytes, pdf, "application/pdf")
+        db_cover_letter = CoverLetter(resume_id=resume.id, file_path=stored.path)
+        session.add(db_cover_letter)
+        enqueue(session, "thumbnail", payload={"path": stored.path}, max_attempts=settings.job_max_attempts)
+        session.commit()
+        file_server.invalidate("cover_letter", db_cover_letter.id)
+        notify_job_worker()
+        print(f"Created generated cover letter record for resume ID: {resume.id}")
+        headers['X-Cover-Letter-Id'] = str(db_cover_letter.id)
+
+    return StreamingResponse(iter_chunks(pdf), media_type="application/pdf", headers=headers)
+
+@router.get("/cover-letter/{cover_letter_id}/preview", summary="Get a first-page preview image of a cover letter")
+async def get_cover_letter_preview(
+    cover_letter_id: int,
+    request: Request,
+    size: str = "medium",
+    format: str = "webp",
+    session: Session = Depends(get_session)
+):
+    """PNG or WebP of the cover letter's first page."""
+    return await serve_preview(request, session, "cover_letter", cover_letter_id, size, format)
+
 @router.get("/cover-letter/{cover_letter_id}", summary="Get cover letter file by ID")
-async def get_cover_letter_file(cover_letter_id: int, session: Session = Depends(get_session)):
+async def get_cover_letter_file(cover_letter_id: int, request: Request, session: Session = Depends(get_session)):
     """Get the uploaded cover letter file by ID."""
     try:
-        # Get the cover letter from the database
-        cover_letter = session.get(CoverLetter, cover_letter_id)
-        if not cover_letter:
-            raise HTTPException(status_code=404, detail="Cover letter not found")
-
-        # Check if file exists
-        if not os.path.exists(cover_letter.file_path):
-            raise HTTPException(status_code=404, detail="Cover letter file not found")
-
-        # Get file name from path
-        filename = os.path.basename(cover_letter.file_path)
-
-        # Determine content type based on file extension
-        content_type = 'application/pdf'  # Default to PDF
-        if filename.lower().endswith('.doc'):
-            content_type = 'application/msword'
-        elif filename.lower().endswith('.docx'):
-            content_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-
-        # Return the file
         headers = {
-            'Content-Disposition': f'inline; filename="{filename}"',
             'Access-Control-Expose-Headers': 'Content-Disposition',
             'Access-Control-Allow-Origin': '*',
             'Cache-Control': 'public, max-age=3600'
         }
+        return file_server.serve(request, session, "cover_letter", cover_letter_id, headers=headers)
 
-        return FileResponse(
-            path=cover_letter.file_path,
-            media_type=content_type,
-            filename=filename,
-            headers=headers
-        )
-
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
         
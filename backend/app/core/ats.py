@@ -0,0 +1,217 @@
+"""ATS keyword-match scoring.
+
+Resume and job texts are tokenized into terms (unigrams plus bigrams, with
+"C++", "C#" and "Node.js" kept intact) and mapped to ids in a ``Vocabulary`` fitted on a
+corpus of documents (the stored resumes, see ``ResumeIndex``). A job's
+term weights are BM25-saturated term frequencies times IDF; the ATS score
+is the share of that weight the resume covers, 0-100. Scoring never adds
+terms to the vocabulary: job terms no fitted document contains weigh with
+the IDF of document frequency zero and match only if the resume has them.
+All scoring is NumPy over term-id arrays, so once the vocabulary exists a
+resume/job pair costs a few array operations.
+"""
+from dataclasses import dataclass, field
+import re
+import threading
+from collections import Counter
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# BM25 term-frequency saturation
+K1 = 1.2
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each etc few for from further had has have
+having he her here hers herself him himself his how i if in into is it its itself just me more most my
+myself no nor not now of off on once only or other our ours ourselves out over own per same she should
+so some such than that the their theirs them themselves then there these they this those through to too
+under until up very via was we were what when where which while who whom why will with within without
+would you your yours yourself yourselves
+ability able across candidate candidates company including strong excellent good great new role roles
+team teams work working job position opportunity looking join us must plus preferred required
+requirements responsibilities qualifications years year experience related skills skill knowledge
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+_HAS_LETTER_RE = re.compile(r"[a-z]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase terms of ``text``: unigrams and adjacent-word bigrams, minus stopwords.
+
+    Bigrams never span punctuation or line breaks.
+    """
+    text = text.lower()
+    terms = []
+    previous = None
+    last_end = 0
+    for match in _TOKEN_RE.finditer(text):
+        gap = text[last_end:match.start()]
+        last_end = match.end()
+        if gap.strip() or '\n' in gap:
+            previous = None
+        word = match.group(0).rstrip('.')
+        if word in STOPWORDS or not _HAS_LETTER_RE.search(word) or (len(word) < 2 and word not in ('c', 'r')):
+            previous = None
+            continue
+        terms.append(word)
+        if previous:
+            terms.append(f"{previous} {word}")
+        previous = word
+    return terms
+
+
+def resume_to_text(resume: Any) -> str:
+    """Flatten a structured resume (nested dicts/lists) into plain text."""
+    if isinstance(resume, str):
+        return resume
+    if isinstance(resume, dict):
+        return '\n'.join(resume_to_text(value) for value in resume.values())
+    if isinstance(resume, (list, tuple)):
+        return '\n'.join(resume_to_text(value) for value in resume)
+    return ''
+
+
+class Vocabulary:
+    """Term-to-id mapping with document frequencies for IDF."""
+
+    def __init__(self):
+        self.term_ids: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self._df = np.zeros(1024, dtype=np.float32)
+        self.n_docs = 0
+        self._idf: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def ids(self, terms: Iterable[str], grow: bool = True) -> np.ndarray:
+        """Map terms to ids, adding unseen terms when ``grow`` is set."""
+        ids = []
+        with self._lock:
+            for term in terms:
+                term_id = self.term_ids.get(term)
+                if term_id is None:
+                    if not grow:
+                        continue
+                    term_id = len(self.terms)
+                    self.term_ids[term] = term_id
+                    self.terms.append(term)
+                    if term_id >= len(self._df):
+                        self._df = np.concatenate([self._df, np.zeros_like(self._df)])
+                    self._idf = None
+                ids.append(term_id)
+        return np.asarray(ids, dtype=np.int64)
+
+    def add_document(self, terms: Iterable[str]) -> None:
+        self.update_document_frequencies(np.unique(self.ids(terms)), 1)
+
+    def update_document_frequencies(self, unique_ids: np.ndarray, delta: int) -> None:
+        """Count (``delta=1``) or uncount (``delta=-1``) one document's distinct terms."""
+        with self._lock:
+            self._df[unique_ids] += delta
+            self.n_docs += delta
+            self._idf = None
+
+    def fit(self, documents: Iterable[str]) -> "Vocabulary":
+        for document in documents:
+            self.add_document(tokenize(document))
+        return self
+
+    @property
+    def idf(self) -> np.ndarray:
+        """BM25 IDF for every known term (all equal until documents are added)."""
+        with self._lock:
+            if self._idf is None or len(self._idf) < len(self.terms):
+                df = self._df[:len(self.terms)]
+                self._idf = np.log1p((self.n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+            return self._idf
+
+    @property
+    def unseen_idf(self) -> float:
+        """BM25 IDF of a term no fitted document contains."""
+        return float(np.log1p((self.n_docs + 0.5) / 0.5))
+
+
+def saturate(counts: np.ndarray) -> np.ndarray:
+    """BM25 term-frequency saturation."""
+    return counts * (K1 + 1) / (counts + K1)
+
+
+@dataclass
+class TermVector:
+    """Sparse term counts: sorted unique term ids and their frequencies."""
+    ids: np.ndarray
+    counts: np.ndarray
+
+
+@dataclass
+class ATSResult:
+    score: float
+    matched_keywords: List[str] = field(default_factory=list)
+    missing_keywords: List[str] = field(default_factory=list)
+
+
+class ATSScorer:
+    """Score resumes against job descriptions by weighted keyword coverage."""
+
+    def __init__(self, vocabulary: Optional[Vocabulary] = None, max_keywords: int = 20):
+        self.vocabulary = vocabulary or Vocabulary()
+        self.max_keywords = max_keywords
+
+    def vectorize(self, text: str, grow: bool = True) -> TermVector:
+        ids = self.vocabulary.ids(tokenize(text), grow=grow)
+        unique_ids, counts = np.unique(ids, return_counts=True)
+        return TermVector(ids=unique_ids, counts=counts.astype(np.float32))
+
+    def vectorize_job(self, job_text: str) -> Tuple[TermVector, Dict[str, int]]:
+        """Vector of the job's known terms, and the counts of its terms outside the vocabulary."""
+        counts = Counter(tokenize(job_text))
+        term_ids = self.vocabulary.term_ids
+        unseen = {term: count for term, count in counts.items() if term not in term_ids}
+        known = {term: count for term, count in counts.items() if term not in unseen}
+        ids = self.vocabulary.ids(known, grow=False)
+        order = np.argsort(ids)
+        counts = np.fromiter(known.values(), dtype=np.float32, count=len(known))
+        return TermVector(ids=ids[order], counts=counts[order]), unseen
+
+    def job_weights(self, job: TermVector) -> np.ndarray:
+        """BM25 weight of each job term, aligned with ``job.ids``."""
+        return saturate(job.counts) * self.vocabulary.idf[job.ids]
+
+    def unseen_weights(self, unseen: Dict[str, int]) -> np.ndarray:
+        """BM25 weight of each job term outside the vocabulary, in ``unseen`` order."""
+        return saturate(np.fromiter(unseen.values(), dtype=np.float32, count=len(unseen))) * self.vocabulary.unseen_idf
+
+    def score_vectors(self, resume: TermVector, job: TermVector, unseen: Optional[Dict[str, int]] = None,
+                      resume_terms: AbstractSet[str] = frozenset()) -> ATSResult:
+        """Score a resume vector against a job vector; ``unseen`` job terms match if in ``resume_terms``."""
+        weights = self.job_weights(job)
+        present = np.isin(job.ids, resume.ids, assume_unique=True)
+        terms = [self.vocabulary.terms[term_id] for term_id in job.ids]
+        if unseen:
+            weights = np.concatenate([weights, self.unseen_weights(unseen)])
+            present = np.concatenate([present, np.fromiter((term in resume_terms for term in unseen), dtype=bool)])
+            terms.extend(unseen)
+        total = float(weights.sum())
+        if total <= 0:
+            return ATSResult(score=0.0)
+
+        score = 100.0 * float(weights[present].sum()) / total
+
+        order = np.argsort(-weights, kind='stable')
+        matched = [terms[i] for i in order if present[i]][:self.max_keywords]
+        missing = [terms[i] for i in order if not present[i]][:self.max_keywords]
+        return ATSResult(score=round(score, 2), matched_keywords=matched, missing_keywords=missing)
+
+    def score(self, resume_text: str, job_text: str) -> ATSResult:
+        """Score one resume text against one job description."""
+        job, unseen = self.vectorize_job(job_text)
+        resume_terms = tokenize(resume_text)
+        # Resume terms outside the vocabulary matter only if the job has them too
+        ids, counts = np.unique(self.vocabulary.ids(resume_terms, grow=False), return_counts=True)
+        resume = TermVector(ids=ids, counts=counts.astype(np.float32))
+        return self.score_vectors(resume, job, unseen, set(resume_terms))
@@ -0,0 +1,163 @@
+"""Content-addressed storage for uploaded files.
+
+Each distinct file is stored once, under its SHA-256:
+
+    <root>/ab/abcdef.../original.pdf
+    <root>/ab/abcdef.../<artifact>      (extracted text, thumbnails, ...)
+
+``Resume.file_path`` and ``CoverLetter.file_path`` point at the
+``original`` file, and those rows are the blob's references: a blob with
+no row pointing at it may be released. Other requests can be about to
+reference a blob before their rows are committed, so a blob is only
+released once nothing has stored or deduplicated to it for a grace
+period (tracked by the blob directory's mtime). Uploads are read once:
+they are validated, hashed and written to a staging file inside the store
+in the same pass, then renamed into place, or discarded if the blob is
+already stored. Results derived from the bytes alone are cached as
+artifacts next to the blob and shared by every upload of the same file.
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+import uuid
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.core.security.file_validator import FileValidator
+from app.core.uploads import StoredUpload, save_upload
+from app.db.models import CoverLetter, Resume
+
+UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
+
+ORIGINAL_NAME = "original"
+# Uploads are staged here, on the same filesystem as the blobs, so moving one into place is a rename
+INCOMING_DIR = "incoming"
+
+
+class BlobStore:
+    """Files keyed by SHA-256, with per-hash derived artifacts."""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(os.path.join(root, INCOMING_DIR), exist_ok=True)
+
+    def blob_dir(self, sha256: str) -> str:
+        return os.path.join(self.root, sha256[:2], sha256)
+
+    def blob_path(self, sha256: str, mime_type: str) -> str:
+        extension = FileValidator.ALLOWED_MIME_TYPES.get(mime_type, '')
+        return os.path.join(self.blob_dir(sha256), ORIGINAL_NAME + extension)
+
+    def sha256_for_path(self, path: str) -> Optional[str]:
+        """The hash of a stored blob's original file, or None for paths outside the store."""
+        directory, filename = os.path.split(os.path.abspath(path))
+        if os.path.dirname(os.path.dirname(directory)) != os.path.abspath(self.root):
+            return None
+        if not filename.startswith(ORIGINAL_NAME):
+            return None
+        return os.path.basename(directory)
+
+    async def put_upload(
+        self,
+        file: UploadFile,
+        max_size: int = FileValidator.MAX_FILE_SIZE,
+        allowed_mime_types: Optional[Iterable[str]] = None
+    ) -> StoredUpload:
+        """Store an upload unless identical bytes are already stored; returns the blob path."""
+        staged_path = os.path.join(self.root, INCOMING_DIR, uuid.uuid4().hex)
+        staged = await save_upload(file, staged_path, max_size=max_size, allowed_mime_types=allowed_mime_types)
+        path, created = await run_in_threadpool(self._commit_staged, staged_path, staged.sha256, staged.mime_type)
+        return StoredUpload(path=path, size=staged.size, sha256=staged.sha256, mime_type=staged.mime_type,
+                            created=created)
+
+    def _commit_staged(self, staged_path: str, sha256: str, mime_type: str) -> Tuple[str, bool]:
+        """Move a staged upload into place, or drop it if the blob is already stored; returns (path, created)."""
+        path = self.blob_path(sha256, mime_type)
+        if os.path.exists(path):
+            os.remove(staged_path)
+            print(f"Upload deduplicated: {sha256}")
+            self.touch(sha256)
+            return path, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(staged_path, path)
+        return path, True
+
+    def put_bytes(self, data: bytes, mime_type: str) -> StoredUpload:
+        """Store generated bytes unless identical bytes are already stored; returns the blob path."""
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(sha256, mime_type)
+        created = not os.path.exists(path)
+        if created:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Written under a temporary name and renamed, like uploads, so no partial file is left behind
+            temp_path = f"{path}.{uuid.uuid4().hex}.part"
+            try:
+                with open(temp_path, "wb") as out:
+                    out.write(data)
+                os.replace(temp_path, path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        else:
+            self.touch(sha256)
+        return StoredUpload(path=path, size=len(data), sha256=sha256, mime_type=mime_type, created=created)
+
+    def touch(self, sha256: str) -> None:
+        """Mark a blob as just used, so it is not released under a request that is about to reference it."""
+        try:
+            os.utime(self.blob_dir(sha256))
+        except FileNotFoundError:
+            pass
+
+    def _recently_used(self, sha256: str, grace_seconds: float) -> bool:
+        try:
+            return time.time() - os.stat(self.blob_dir(sha256)).st_mtime < grace_seconds
+        except FileNotFoundError:
+            return False
+
+    def reference_count(self, db: Session, path: str) -> int:
+        """Number of resume and cover letter rows pointing at a stored file."""
+        resumes = db.exec(select(func.count()).select_from(Resume).where(Resume.file_path == path)).one()
+        cover_letters = db.exec(select(func.count()).select_from(CoverLetter).where(CoverLetter.file_path == path)).one()
+        return resumes + cover_letters
+
+    def release(self, db: Session, path: str, grace_seconds: float = 0) -> bool:
+        """Delete a blob and its artifacts if no row references it and it was not used within the grace period."""
+        sha256 = self.sha256_for_path(path)
+        if sha256 is None or self._recently_used(sha256, grace_seconds) or self.reference_count(db, path) > 0:
+            return False
+        # Checked again right before deleting: an upload may have deduplicated to it meanwhile
+        if self._recently_used(sha256, grace_seconds):
+            return False
+        shutil.rmtree(self.blob_dir(sha256), ignore_errors=True)
+        print(f"Released blob {sha256}")
+        return True
+
+    # Derived artifacts
+
+    def artifact_path(self, sha256: str, name: str) -> str:
+        return os.path.join(self.blob_dir(sha256), name)
+
+    def read_json_artifact(self, sha256: str, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.artifact_path(sha256, name), encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def write_json_artifact(self, sha256: str, name: str, value: Dict[str, Any]) -> None:
+        path = self.artifact_path(sha256, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.part"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f)
+        os.replace(temp_path, path)
+
+
+blob_store = BlobStore(os.path.join(UPLOAD_DIR, "blobs"))
@@ -0,0 +1,201 @@
+"""Caching primitives shared by the backend."""
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+def stable_hash(value: Any) -> str:
+    """Hash a JSON-compatible value independently of dict key order."""
+    payload = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe LRU mapping with an optional per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.pop(key, None)
+            return item[0] if item else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._data),
+            'max_entries': self.max_entries,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """Files under one directory with a total size budget, evicting the least recently used.
+
+    Entries are written atomically and shared by every process using the
+    directory. Reads refresh the file's access time, and when the budget is
+    exceeded the least recently accessed files are deleted until the cache
+    is back under ``low_water`` of the budget.
+    """
+
+    def __init__(self, root: str, max_bytes: int, low_water: float = 0.9):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.root, name[:2], name)
+
+    def get(self, name: str) -> Optional[str]:
+        """Path of a cached entry, or None."""
+        path = self.path(name)
+        try:
+            stat_result = os.stat(path)
+            # Mark as used without touching mtime, which the file's ETag is derived from
+            os.utime(path, (time.time(), stat_result.st_mtime))
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def put(self, name: str, data: bytes) -> str:
+        path = self.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        self._added(len(data))
+        return path
+
+    def put_file(self, name: str, source_path: str) -> str:
+        """Move a finished file (on the same filesystem) into the cache."""
+        path = self.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        size = os.path.getsize(source_path)
+        os.replace(source_path, path)
+        self._added(size)
+        return path
+
+    def remove(self, name: str) -> bool:
+        try:
+            os.remove(self.path(name))
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            self._size = None
+        return True
+
+    def _added(self, size: int) -> None:
+        with self._lock:
+            self.writes += 1
+            if self._size is not None:
+                self._size += size
+            over = self._size is None or self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith('.part'):
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    stat_result = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat_result.st_atime, stat_result.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """Scan the directory (other processes write to it too) and trim it to the budget."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        if total > self.max_bytes:
+            target = self.max_bytes * self.low_water
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+        with self._lock:
+            self._size = total
+            self.evictions += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'bytes': self._size,
+            'max_bytes': self.max_bytes,
+        }
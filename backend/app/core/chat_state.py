@@ -0,0 +1,123 @@
+"""Server-side conversation state for the chat endpoint.
+
+Instead of resending the whole history and resume on every turn, a client
+can pass the id of a ``ChatSession``. Turns are persisted as
+``ChatMessage`` rows and the latest resume is stored as JSON on the
+session itself (``ChatSession.resume_snapshot``), so it never shows up
+among the messages. Each worker keeps a hot copy of the recent
+window in a bounded ring buffer per session; the copy is revalidated
+against ``ChatSession.last_message_at`` so a turn written by another
+worker forces a reload from the database.
+"""
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+from typing import Any, Deque, Dict, Optional
+
+from fastapi import HTTPException
+from sqlmodel import Session, select
+
+from app.core.cache import LRUCache, stable_hash
+from app.db.models import ChatMessage, ChatSession
+
+# Roles of the turns replayed as conversation context
+HISTORY_ROLES = ("user", "assistant")
+
+
+@dataclass
+class Turn:
+    role: str
+    content: str
+
+
+@dataclass
+class ConversationState:
+    history: Deque[Turn]
+    resume: Optional[Dict[str, Any]] = None
+    resume_hash: Optional[str] = None
+    last_message_at: Optional[datetime] = None
+
+
+class ConversationStore:
+    """Load and append chat turns, keeping a hot window per session."""
+
+    def __init__(self, window: int = 6, max_sessions: int = 1024):
+        self.window = window
+        self._states = LRUCache(max_entries=max_sessions)
+
+    def _get_chat_session(self, db: Session, session_id: int) -> ChatSession:
+        chat_session = db.get(ChatSession, session_id)
+        if not chat_session:
+            raise HTTPException(status_code=404, detail="Chat session not found")
+        if not chat_session.is_active:
+            raise HTTPException(status_code=400, detail="Chat session is closed")
+        return chat_session
+
+    def _load_from_db(self, db: Session, chat_session: ChatSession) -> ConversationState:
+        recent = db.exec(
+            select(ChatMessage)
+            .where(ChatMessage.session_id == chat_session.id)
+            .where(ChatMessage.role.in_(HISTORY_ROLES))
+            .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+            .limit(self.window)
+        ).all()
+        history = deque(
+            (Turn(role=message.role, content=message.content) for message in reversed(recent)),
+            maxlen=self.window
+        )
+
+        resume = json.loads(chat_session.resume_snapshot) if chat_session.resume_snapshot else None
+
+        return ConversationState(
+            history=history,
+            resume=resume,
+            resume_hash=stable_hash(resume) if resume is not None else None,
+            last_message_at=chat_session.last_message_at
+        )
+
+    def load(self, db: Session, session_id: int) -> ConversationState:
+        """Return the recent window and resume for a session."""
+        chat_session = self._get_chat_session(db, session_id)
+        state = self._states.get(session_id)
+        if state is None or state.last_message_at != chat_session.last_message_at:
+            state = self._load_from_db(db, chat_session)
+            self._states.set(session_id, state)
+        return state
+
+    def record_turn(
+        self,
+        db: Session,
+        session_id: int,
+        user_message: str,
+        assistant_message: str,
+        resume: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Persist one exchange (and the resume, if it changed) and update the hot window."""
+        chat_session = self._get_chat_session(db, session_id)
+        state = self.load(db, session_id)
+        now = datetime.utcnow()
+
+        # The hot window only changes once the turn is committed
+        new_resume_hash = None
+        if resume is not None:
+            resume_hash = stable_hash(resume)
+            if resume_hash != state.resume_hash:
+                chat_session.resume_snapshot = json.dumps(resume)
+                new_resume_hash = resume_hash
+
+        turns = [Turn(role="user", content=user_message), Turn(role="assistant", content=assistant_message)]
+        for turn in turns:
+            db.add(ChatMessage(session_id=session_id, role=turn.role, content=turn.content, created_at=now))
+
+        chat_session.last_message_at = now
+        db.commit()
+
+        if new_resume_hash is not None:
+            state.resume = resume
+            state.resume_hash = new_resume_hash
+        state.history.extend(turns)
+        state.last_message_at = now
+
+    def stats(self) -> Dict[str, Any]:
+        return self._states.stats()
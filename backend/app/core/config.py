@@ -34,6 +34,60 @@ class Settings(BaseSettings):
     # Google Application Credentials - can be JSON string or file path
     google_application_credentials_json: Optional[str] = None
 
+    # Natural language analysis (chat): "google" or "local" (offline lexicon/gazetteer)
+    nlp_backend: str = "google"
+    nlp_timeout_seconds: float = 5.0
+    nlp_max_workers: int = 4
+    nlp_cache_max_entries: int = 1024
+    nlp_cache_ttl_seconds: int = 3600
+    # SQLite file shared by all gunicorn workers; leave unset for a per-process cache only
+    nlp_cache_shared_path: Optional[str] = None
+    # Cached per-section resume analysis results
+    resume_analysis_cache_entries: int = 2048
+
+    # Worker processes for CV text extraction and PDF rendering (default: one per core)
+    resume_extraction_workers: Optional[int] = None
+    # TTF fonts embedded in rendered resumes (default: the standard Helvetica)
+    resume_pdf_font_path: Optional[str] = None
+    resume_pdf_bold_font_path: Optional[str] = None
+    # Laid-out resume sections and entries kept per worker, so an edit only re-lays-out what changed
+    resume_pdf_section_cache_entries: int = 512
+
+    # Background jobs (extraction, scoring, ...) run by a worker in every app process
+    job_worker_enabled: bool = True
+    job_poll_interval_seconds: float = 1.0
+    # A running job not finished within the lease is assumed lost and requeued
+    job_lease_seconds: float = 300.0
+    job_max_attempts: int = 3
+    job_backoff_seconds: float = 5.0
+    job_extract_concurrency: int = 2
+    job_ats_concurrency: int = 4
+    job_thumbnail_concurrency: int = 2
+    # Longest a status poll waits for a change
+    job_status_max_wait_seconds: float = 30.0
+    # A stored file left unreferenced by a failed upload is deleted once nothing used it for this long
+    blob_release_grace_seconds: float = 600.0
+
+    # Download metadata (path, size, mtime, content type) cached per file id
+    file_meta_cache_entries: int = 4096
+    # Disk budget for rendered first-page previews
+    thumbnail_cache_max_mb: int = 256
+    # Disk budget for generated resume PDFs
+    render_cache_max_mb: int = 512
+    # Tailored variants per batch render request, and how many render at once
+    # (default: two per extraction worker)
+    render_batch_max_variants: int = 100
+    render_batch_window: Optional[int] = None
+
+    # Bulk resume ranking: scoring threads (default: one per core) and the
+    # result count above which rankings are streamed as NDJSON
+    ats_rank_workers: Optional[int] = None
+    ats_rank_stream_threshold: int = 500
+
+    # Server-side chat state: messages kept per session and sessions kept hot per worker
+    chat_history_window: int = 6
+    chat_state_max_sessions: int = 1024
+
     # Database
     database_url: str = "sqlite:///database.db"
 
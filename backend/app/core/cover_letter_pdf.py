@@ -0,0 +1,86 @@
+"""PDF rendering of plain-text cover letters.
+
+Blank lines separate paragraphs and single line breaks are kept, so a
+letter typed or generated as text comes out laid out the way it reads.
+Fonts are the resume template's. reportlab serializes a document in one
+pass, so the finished PDF is necessarily in memory once; the renderer
+hands that buffer back without copying it again, and callers stream it
+out in chunks instead of writing it anywhere.
+"""
+import asyncio
+from functools import lru_cache
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Union
+from xml.sax.saxutils import escape
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+from app.core.resume_extraction import get_extraction_pool
+from app.core.resume_pdf import fonts
+
+PAGE_MARGIN = inch
+CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=1)
+def styles() -> Dict[str, ParagraphStyle]:
+    regular, _bold = fonts()
+    return {'body': ParagraphStyle('CoverLetter', fontName=regular, fontSize=11, leading=15, spaceAfter=10)}
+
+
+def paragraphs(content: str) -> List[str]:
+    """Escaped paragraph markup: blank lines split paragraphs, line breaks are kept."""
+    blocks = [block.strip() for block in content.replace('\r\n', '\n').split('\n\n')]
+    return [escape(block).replace('\n', '<br/>') for block in blocks if block]
+
+
+def render_cover_letter_pdf(content: str, output: Union[str, BinaryIO], author: Optional[str] = None) -> None:
+    """Render a cover letter to a path or binary file object."""
+    document = SimpleDocTemplate(
+        output,
+        pagesize=letter,
+        leftMargin=PAGE_MARGIN,
+        rightMargin=PAGE_MARGIN,
+        topMargin=PAGE_MARGIN,
+        bottomMargin=PAGE_MARGIN,
+        title=f"{author} Cover Letter".strip() if author else "Cover Letter",
+        author=author or '',
+        subject="Cover Letter"
+    )
+    story = [Paragraph(markup, styles()['body']) for markup in paragraphs(content)]
+    document.build(story or [Spacer(1, 1)])
+
+
+class _Capture:
+    """Write target that keeps what reportlab writes instead of copying it into a buffer."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data: Any) -> int:
+        self.chunks.append(data)
+        return len(data)
+
+    def getvalue(self) -> bytes:
+        return self.chunks[0] if len(self.chunks) == 1 else b''.join(self.chunks)
+
+
+def render_cover_letter_pdf_bytes(content: str, author: Optional[str] = None) -> bytes:
+    output = _Capture()
+    render_cover_letter_pdf(content, output, author)
+    return output.getvalue()
+
+
+async def render_cover_letter_pdf_async(content: str, author: Optional[str] = None,
+                                        max_workers: Optional[int] = None) -> bytes:
+    """Run ``render_cover_letter_pdf_bytes`` in the process pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_extraction_pool(max_workers), render_cover_letter_pdf_bytes, content, author)
+
+
+async def iter_chunks(data: bytes, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Response body in chunks, so no second copy of the whole PDF is made to send it."""
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
@@ -0,0 +1,242 @@
+"""File responses with HTTP validators, conditional GET and byte ranges.
+
+``conditional_file_response`` adds a strong ``ETag`` (the content hash for
+blob-store files, otherwise mtime and size) and ``Last-Modified`` to a file
+download. It answers ``If-None-Match`` / ``If-Modified-Since`` with 304 Not
+Modified, and serves a single ``Range: bytes=...`` request as 206 Partial
+Content (honouring ``If-Range``), which lets pdf.js load a large PDF page by
+page. Multi-range requests get the whole file, which RFC 9110 allows.
+Bodies are sent zero-copy when the ASGI server supports it.
+"""
+from email.utils import formatdate, parsedate_to_datetime
+import os
+import stat
+from typing import Callable, Mapping, Optional, Tuple
+
+import anyio
+from fastapi import HTTPException, Request
+from fastapi.responses import FileResponse, PlainTextResponse, Response
+from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
+
+from app.core.blob_store import blob_store
+
+# Response headers repeated on a 304 (RFC 9110 section 15.4.5, plus CORS)
+NOT_MODIFIED_HEADERS = ('cache-control', 'content-location', 'expires', 'vary')
+
+
+class SendfileResponse(FileResponse):
+    """File response for the whole file or an inclusive byte range.
+
+    The body goes out with the ASGI zero-copy extensions when the server
+    advertises them (``http.response.zerocopysend`` hands it the open file
+    for ``sendfile(2)``; ``http.response.pathsend`` takes a path) and is
+    otherwise read in chunks in the threadpool. ``transfer_mode`` records
+    which one was used.
+    """
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        stat_result: os.stat_result,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        **kwargs
+    ):
+        headers = dict(kwargs.pop('headers', None) or {})
+        self.is_range = start is not None
+        self.start = start or 0
+        self.end = stat_result.st_size - 1 if end is None else end
+        if self.is_range:
+            headers['Content-Length'] = str(self.end - self.start + 1)
+            headers['Content-Range'] = f"bytes {self.start}-{self.end}/{stat_result.st_size}"
+        super().__init__(
+            path, status_code=206 if self.is_range else 200, headers=headers, stat_result=stat_result, **kwargs
+        )
+        self.transfer_mode: Optional[str] = None
+        self.bytes_sent = 0
+        self.on_missing: Optional[Callable[[], None]] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions") or {}
+        count = self.end - self.start + 1
+        file = None
+        if not self.send_header_only and count > 0:
+            # Open before the headers go out, so a file deleted since its
+            # metadata was cached still gets a clean 404
+            try:
+                file = await anyio.to_thread.run_sync(open, self.path, "rb")
+            except FileNotFoundError:
+                if self.on_missing is not None:
+                    self.on_missing()
+                self.transfer_mode = "missing"
+                await PlainTextResponse("File not found", status_code=404)(scope, receive, send)
+                return
+
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if file is None:
+            self.transfer_mode = "headers"
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.zerocopysend" in extensions:
+            self.transfer_mode = "zerocopysend"
+            with file:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "offset": self.start,
+                    "count": count,
+                    "more_body": False
+                })
+            self.bytes_sent = count
+        elif "http.response.pathsend" in extensions and not self.is_range:
+            self.transfer_mode = "pathsend"
+            file.close()
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            self.bytes_sent = count
+        else:
+            self.transfer_mode = "chunked"
+            async with anyio.wrap_file(file) as async_file:
+                await async_file.seek(self.start)
+                remaining = count
+                while remaining > 0:
+                    chunk = await async_file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    self.bytes_sent += len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+                if remaining > 0:
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+        if self.background is not None:
+            await self.background()
+
+
+def file_etag(path: str, stat_result: os.stat_result) -> str:
+    """Strong ETag: the SHA-256 for content-addressed files, else mtime and size."""
+    sha256 = blob_store.sha256_for_path(path)
+    if sha256:
+        return f'"{sha256}"'
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison, as required for If-None-Match."""
+    if header.strip() == '*':
+        return True
+    opaque = etag.removeprefix('W/')
+    return any(candidate.strip().removeprefix('W/') == opaque for candidate in header.split(','))
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range into inclusive offsets.
+
+    Returns None when the header should be ignored (malformed or several
+    ranges) and raises 416 when it cannot be satisfied.
+    """
+    unit, _, ranges = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in ranges:
+        return None
+    first, sep, last = ranges.strip().partition('-')
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else None
+            if end is not None and end < start:
+                return None
+        else:
+            # Suffix range: the last N bytes
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError
+            start, end = max(size - suffix, 0), size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise HTTPException(status_code=416, detail="Range not satisfiable",
+                            headers={'Content-Range': f"bytes */{size}"})
+    return start, size - 1 if end is None else min(end, size - 1)
+
+
+def _if_range_matches(request: Request, etag: str, last_modified: str) -> bool:
+    if_range = request.headers.get('if-range')
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith('W/'):
+        # If-Range requires a strong match
+        return if_range == etag
+    return if_range == last_modified
+
+
+def conditional_file_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    filename: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    content_disposition_type: str = "inline",
+    stat_result: Optional[os.stat_result] = None,
+    etag: Optional[str] = None,
+    background: Optional[BackgroundTask] = None
+) -> Response:
+    """Serve a file with ETag/Last-Modified validation and byte-range support."""
+    if stat_result is None:
+        try:
+            stat_result = os.stat(path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    etag = etag or file_etag(path, stat_result)
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    response_headers = {
+        key: value for key, value in (headers or {}).items()
+        # Starlette derives Content-Type from media_type
+        if key.lower() != 'content-type'
+    }
+    response_headers.update({'ETag': etag, 'Last-Modified': last_modified, 'Accept-Ranges': 'bytes'})
+
+    if _not_modified(request, etag, stat_result.st_mtime):
+        not_modified_headers = {
+            key: value for key, value in response_headers.items()
+            if key.lower() in NOT_MODIFIED_HEADERS or key.lower().startswith('access-control-')
+        }
+        not_modified_headers.update({'ETag': etag, 'Last-Modified': last_modified})
+        return Response(status_code=304, headers=not_modified_headers, background=background)
+
+    start = end = None
+    range_header = request.headers.get('range')
+    if range_header and request.method in ('GET', 'HEAD') and _if_range_matches(request, etag, last_modified):
+        byte_range = parse_range(range_header, stat_result.st_size)
+        if byte_range is not None:
+            start, end = byte_range
+
+    return SendfileResponse(
+        path,
+        stat_result=stat_result,
+        start=start,
+        end=end,
+        headers=response_headers,
+        media_type=media_type,
+        filename=filename,
+        method=request.method,
+        content_disposition_type=content_disposition_type,
+        background=background
+    )
@@ -0,0 +1,226 @@
+"""One file-serving path for every download endpoint.
+
+``FileServer.serve`` resolves a stored file by kind and id (``resume``,
+``cover_letter``) or by path, and answers with ``conditional_file_response``
+(ETag/304, byte ranges, zero-copy send when the server supports it).
+Resolved metadata (path, ``os.stat`` result, content type, download name,
+ETag) is kept in a bounded LRU, so a repeat download costs no database
+query and no extension sniffing. Blob-store files never change in place,
+so their entries are trusted without a ``stat``; any other file (served
+by path, or a legacy upload path) is ``stat``-ed again on every hit and
+its entry is rebuilt when the size or mtime changed, since it may have
+been rewritten in place, possibly by another worker. Entries are also
+invalidated when a file is uploaded for the id, and dropped if the file
+turns out to be gone. Each response carries a ``Server-Timing`` header with the lookup
+time and cache result; totals are available from ``stats()``.
+"""
+from dataclasses import dataclass
+import mimetypes
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+from sqlmodel import Session
+from starlette.background import BackgroundTask
+
+from app.core.blob_store import blob_store
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.file_responses import SendfileResponse, conditional_file_response, file_etag
+from app.core.security.file_validator import FileValidator
+from app.db.models import CoverLetter, Resume
+
+CONTENT_TYPES = {extension: mime_type for mime_type, extension in FileValidator.ALLOWED_MIME_TYPES.items()}
+
+# (path, download name) of a stored file, or None when the row does not exist
+FileLoader = Callable[[Session, Any], Optional[Tuple[str, str]]]
+
+
+@dataclass
+class FileMeta:
+    path: str
+    stat_result: os.stat_result
+    media_type: str
+    filename: str
+    etag: str
+
+
+def _download_name(path: str, prefix: str, identifier: Any) -> str:
+    """Blob-store files are all called "original"; give downloads a readable name."""
+    name = os.path.basename(path)
+    if blob_store.sha256_for_path(path):
+        return f"{prefix}_{identifier}{os.path.splitext(name)[1]}"
+    return name
+
+
+def _load_resume(db: Session, resume_id: int) -> Optional[Tuple[str, str]]:
+    resume = db.get(Resume, resume_id)
+    return (resume.file_path, _download_name(resume.file_path, "CV", resume_id)) if resume else None
+
+
+def _load_cover_letter(db: Session, cover_letter_id: int) -> Optional[Tuple[str, str]]:
+    cover_letter = db.get(CoverLetter, cover_letter_id)
+    if not cover_letter:
+        return None
+    return cover_letter.file_path, _download_name(cover_letter.file_path, "CL", cover_letter_id)
+
+
+class FileServer:
+    """Serve stored files with cached metadata and per-request metrics."""
+
+    def __init__(self, max_entries: int = 4096):
+        self._meta = LRUCache(max_entries=max_entries)
+        self._loaders: Dict[str, Tuple[FileLoader, str, str]] = {}
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {
+            'requests': 0,
+            'bytes_sent': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'statuses': {},
+            'transfer_modes': {},
+        }
+
+    def register(self, kind: str, loader: FileLoader, not_found_detail: str, missing_file_detail: str) -> None:
+        """Add a kind of stored file: the loader and the 404 messages for a missing row / missing file."""
+        self._loaders[kind] = (loader, not_found_detail, missing_file_detail)
+
+    def invalidate(self, kind: str, identifier: Hashable) -> None:
+        self._meta.pop((kind, identifier))
+
+    def _resolve(self, key: Tuple[str, Hashable], load: Callable[[], Optional[Tuple[str, str]]],
+                 not_found_detail: str, missing_file_detail: str) -> Tuple[FileMeta, bool]:
+        meta = self._meta.get(key)
+        if meta is not None:
+            if blob_store.sha256_for_path(meta.path):
+                return meta, True
+            try:
+                stat_result = os.stat(meta.path)
+            except FileNotFoundError:
+                self._meta.pop(key)
+                raise HTTPException(status_code=404, detail=missing_file_detail)
+            if (stat_result.st_mtime_ns, stat_result.st_size) == (meta.stat_result.st_mtime_ns,
+                                                                  meta.stat_result.st_size):
+                return meta, True
+            # Rewritten in place: rebuild the entry from the fresh stat
+            path, filename = meta.path, meta.filename
+        else:
+            located = load()
+            if located is None:
+                raise HTTPException(status_code=404, detail=not_found_detail)
+            path, filename = located
+            try:
+                stat_result = os.stat(path)
+            except FileNotFoundError:
+                raise HTTPException(status_code=404, detail=missing_file_detail)
+        extension = os.path.splitext(path)[1].lower()
+        meta = FileMeta(
+            path=path,
+            stat_result=stat_result,
+            media_type=CONTENT_TYPES.get(extension) or mimetypes.guess_type(path)[0] or 'application/octet-stream',
+            filename=filename,
+            etag=file_etag(path, stat_result)
+        )
+        self._meta.set(key, meta)
+        return meta, False
+
+    def _record(self, started: float, response: Response) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        status = response.status_code
+        mode = getattr(response, 'transfer_mode', None) or 'none'
+        with self._lock:
+            metrics = self._metrics
+            metrics['requests'] += 1
+            metrics['bytes_sent'] += getattr(response, 'bytes_sent', 0)
+            metrics['total_ms'] += elapsed_ms
+            metrics['max_ms'] = max(metrics['max_ms'], elapsed_ms)
+            metrics['statuses'][status] = metrics['statuses'].get(status, 0) + 1
+            metrics['transfer_modes'][mode] = metrics['transfer_modes'].get(mode, 0) + 1
+
+    def _respond(
+        self,
+        request: Request,
+        key: Tuple[str, Hashable],
+        load: Callable[[], Optional[Tuple[str, str]]],
+        not_found_detail: str,
+        missing_file_detail: str,
+        headers: Optional[Mapping[str, str]],
+        media_type: Optional[str],
+        filename: Optional[str]
+    ) -> Response:
+        started = time.perf_counter()
+        meta, hit = self._resolve(key, load, not_found_detail, missing_file_detail)
+        lookup_ms = (time.perf_counter() - started) * 1000
+
+        response_headers = dict(headers or {})
+        response_headers['Server-Timing'] = f'file-meta;dur={lookup_ms:.3f};desc="{"hit" if hit else "miss"}"'
+        download_name = filename or meta.filename
+        response_headers.setdefault('Content-Disposition', f'inline; filename="{download_name}"')
+
+        background = BackgroundTask(lambda: self._record(started, response))
+        response = conditional_file_response(
+            request,
+            meta.path,
+            media_type=media_type or meta.media_type,
+            filename=download_name,
+            headers=response_headers,
+            stat_result=meta.stat_result,
+            etag=meta.etag,
+            background=background
+        )
+        if isinstance(response, SendfileResponse):
+            def on_missing() -> None:
+                self._meta.pop(key)
+                self._record(started, response)
+            response.on_missing = on_missing
+        return response
+
+    def locate(self, db: Session, kind: str, identifier: Any) -> FileMeta:
+        """Cached metadata of the file stored for a row, raising 404s like ``serve``."""
+        loader, not_found_detail, missing_file_detail = self._loaders[kind]
+        return self._resolve((kind, identifier), lambda: loader(db, identifier), not_found_detail,
+                             missing_file_detail)[0]
+
+    def serve(
+        self,
+        request: Request,
+        db: Session,
+        kind: str,
+        identifier: Any,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        filename: Optional[str] = None
+    ) -> Response:
+        """Serve the file stored for a database row of ``kind``."""
+        loader, not_found_detail, missing_file_detail = self._loaders[kind]
+        return self._respond(request, (kind, identifier), lambda: loader(db, identifier), not_found_detail,
+                             missing_file_detail, headers, media_type, filename)
+
+    def serve_path(
+        self,
+        request: Request,
+        path: str,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        filename: Optional[str] = None
+    ) -> Response:
+        """Serve a file by path."""
+        return self._respond(request, ('path', path), lambda: (path, os.path.basename(path)), "File not found",
+                             "File not found", headers, media_type, filename)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['statuses'] = dict(metrics['statuses'])
+            metrics['transfer_modes'] = dict(metrics['transfer_modes'])
+        metrics['mean_ms'] = metrics['total_ms'] / metrics['requests'] if metrics['requests'] else 0.0
+        metrics['metadata_cache'] = self._meta.stats()
+        return metrics
+
+
+file_server = FileServer(max_entries=settings.file_meta_cache_entries)
+file_server.register("resume", _load_resume, "Resume not found", "Resume file not found")
+file_server.register("cover_letter", _load_cover_letter, "Cover letter not found", "Cover letter file not found")
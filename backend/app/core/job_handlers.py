@@ -0,0 +1,74 @@
+"""Handlers for the background jobs queued after a resume upload."""
+from typing import Any, Dict
+
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.blob_store import blob_store
+from app.core.config import settings
+from app.core.jobs import PermanentJobError, enqueue, job_handler
+from app.core.resume_extraction import ExtractionError, extract_resume_async, save_extraction
+from app.core.resume_index import resume_index
+from app.core.thumbnails import ThumbnailError, thumbnail_renderer
+from app.db.models import Job, Resume, ResumeExtraction
+
+# Bump the version when the parser changes so cached extractions are redone
+EXTRACTION_ARTIFACT = "extraction-v1.json"
+
+
+def _get_resume(db: Session, job: Job) -> Resume:
+    resume = db.get(Resume, job.resume_id) if job.resume_id is not None else None
+    if not resume:
+        raise PermanentJobError(f"Resume {job.resume_id} not found")
+    return resume
+
+
+@job_handler("extract", concurrency=settings.job_extract_concurrency)
+async def extract(db: Session, job: Job, payload: Dict[str, Any]) -> None:
+    """Parse the uploaded CV, then score it if a job description came with the upload."""
+    resume = _get_resume(db, job)
+    # Identical files share one extraction
+    sha256 = blob_store.sha256_for_path(resume.file_path)
+    result = blob_store.read_json_artifact(sha256, EXTRACTION_ARTIFACT) if sha256 else None
+    if result is None:
+        try:
+            result = await extract_resume_async(resume.file_path, settings.resume_extraction_workers)
+        except (ExtractionError, FileNotFoundError) as e:
+            raise PermanentJobError(str(e)) from e
+        if sha256:
+            blob_store.write_json_artifact(sha256, EXTRACTION_ARTIFACT, result)
+    save_extraction(db, resume.id, result)
+    if payload.get('job_description'):
+        enqueue(db, "ats_score", resume.id, {'job_description': payload['job_description']},
+                max_attempts=settings.job_max_attempts)
+    db.commit()
+
+
+@job_handler("ats_score", concurrency=settings.job_ats_concurrency)
+async def ats_score(db: Session, job: Job, payload: Dict[str, Any]) -> None:
+    """Score the extracted resume text against a job description and store ``Resume.ats_score``."""
+    resume = _get_resume(db, job)
+    extraction = db.get(ResumeExtraction, resume.id)
+    if extraction is None:
+        raise PermanentJobError("Resume has no extracted text to score")
+    # Refreshing re-reads and re-vectorizes stale resumes under the index lock; keep it off the loop
+    await run_in_threadpool(resume_index.refresh, db)
+    result = await run_in_threadpool(resume_index.score, extraction.text, payload['job_description'])
+    resume.ats_score = result.score
+    db.add(resume)
+    db.commit()
+
+
+@job_handler("release_blob")
+async def release_blob(db: Session, job: Job, payload: Dict[str, Any]) -> None:
+    """Delete a file stored by a failed upload unless a row references it by now."""
+    blob_store.release(db, payload['path'], settings.blob_release_grace_seconds)
+
+
+@job_handler("thumbnail", concurrency=settings.job_thumbnail_concurrency)
+async def thumbnail(db: Session, job: Job, payload: Dict[str, Any]) -> None:
+    """Render the first-page previews of an uploaded file ahead of the first request."""
+    try:
+        await thumbnail_renderer.render(payload['path'])
+    except (ThumbnailError, FileNotFoundError) as e:
+        raise PermanentJobError(str(e)) from e
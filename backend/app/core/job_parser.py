@@ -0,0 +1,283 @@
+"""Structured extraction of job details from pasted job postings.
+
+The posting is read line by line (``iter_lines`` never materializes the
+whole split text, so very long pastes are cheap), and each line is scanned
+once by a single precompiled pattern whose named alternatives cover every
+signal we look for: labelled fields ("Location: ..."), hiring phrases,
+work type, salary ranges and visa/relocation statements. Title-shaped
+lines and "Company - City" header lines near the top are checked
+separately.
+
+An employer's phrase ("Acme is hiring", "we're looking for") marks a
+posting on its own. Otherwise the text needs ``MIN_WEAK_SIGNALS``
+distinct weak signals: each section heading, each labelled field, a
+salary, a work type, a visa or foreigner statement, a title line and a
+company header line count once each.
+"""
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+TITLE_WORDS = (
+    r'(?:engineer|developer|designer|manager|analyst|scientist|architect|consultant|'
+    r'specialist|director|intern|administrator|coordinator|officer|technician|'
+    r'researcher|programmer|lead|head of [\w ]+|recruiter|accountant|writer)s?'
+)
+
+# Capitalized name of up to four words, matched case-sensitively
+_PROPER_NAME = r"(?-i:[A-Z][\w&.'-]*(?:\s+(?:&\s+)?[A-Z][\w&.'-]*){0,3})"
+_MONEY = r"[$€£]\s?\d[\d,.]*\s?[kK]?"
+_RANGE_SEP = r'\s*(?:-|–|—|to)\s*'
+
+LABELS = {
+    'job title': 'positionName', 'position': 'positionName', 'role': 'positionName', 'title': 'positionName',
+    'company': 'companyName', 'employer': 'companyName', 'organization': 'companyName',
+    'location': 'location', 'based in': 'location', 'office': 'location',
+    'work type': 'workType', 'workplace': 'workType', 'work model': 'workType', 'remote': 'workType',
+    'salary': 'salaryRange', 'salary range': 'salaryRange', 'compensation': 'salaryRange', 'pay': 'salaryRange',
+}
+
+# Alternatives are tried left to right at each position, so specific phrases
+# come before the bare words they contain (e.g. "no visa sponsorship" before
+# "visa sponsorship", "hiring a <title>" before "hiring").
+LINE_PATTERN = re.compile(
+    '|'.join([
+        r'^\s*(?P<label>' + '|'.join(sorted(map(re.escape, LABELS), key=len, reverse=True)) + r')(?::|\s+[-–]\s)\s*(?P<label_value>\S.*?)\s*(?=\.\s|\.?$)',
+        # Lookahead so "hiring a <title>" is still seen after the company name
+        r'(?P<company_hiring>(?!(?:We|They|You|Our|This|It)\b)' + _PROPER_NAME + r')(?=\s+(?:is|are)\s+(?P<company_verb>hiring|looking|recruiting|growing)\b)',
+        # Only the employer's verbs (hiring, recruiting, "we're looking for") mark a posting;
+        # a bare "looking for" is as likely to be a candidate asking about a job
+        r"\b(?P<position_verb>hiring|recruiting|(?:we're|we are)\s+(?:looking for|seeking|searching for)"
+        r'|looking for|seeking|searching for)\s+(?:an?\s+|our\s+(?:next|new)\s+)?'
+        r'(?P<position_phrase>(?:[\w+#/.-]+\s+){0,4}?' + TITLE_WORDS + r')\b',
+        r'\b(?:join|at|about)\s+(?P<company_phrase>' + _PROPER_NAME + r')',
+        r'\b(?:based in|located in|offices? in)\s+(?P<location_phrase>' + _PROPER_NAME + r'(?:,\s*' + _PROPER_NAME + r')?)',
+        r"(?P<visa_no>\b(?:no|not|unable to|cannot|can't|do not|don't|will not|won't|are not able to)\s+(?:\w+\s+){0,3}?sponsor\w*"
+        r'|\bwithout (?:visa )?sponsorship|\bmust be (?:legally )?authori[sz]ed to work)',
+        r'(?P<visa_yes>\bvisa sponsorship|\bsponsorship (?:is )?(?:available|provided|offered)|\b(?:we|will) sponsor)',
+        r'(?P<foreigners_no>\bcitizens? only|\bmust be an? (?:\w+\s+)?citizen|\b(?:security|government) clearance'
+        r'|\bmust (?:already )?have (?:the )?right to work|\bmust (?:currently )?reside in|\blocal candidates only)',
+        r'(?P<foreigners_yes>\brelocation (?:support|assistance|package|bonus)|\bopen to (?:international|foreign|global) (?:candidates|applicants)'
+        r'|\binternational (?:candidates|applicants) (?:are )?welcome|\bwork from anywhere|\banywhere in the world)',
+        r'(?P<salary>' + _MONEY + r'(?:' + _RANGE_SEP + r'[$€£]?\s?\d[\d,.]*\s?[kK]?)?'
+        r'(?:\s*(?:USD|EUR|GBP|CAD|CHF|per year|/year|/yr|a year|per annum|p\.a\.|/hour|per hour|an hour))?'
+        r'|\b\d[\d,.]*\s?[kK]?' + _RANGE_SEP + r'\d[\d,.]*\s?[kK]?\s*(?:USD|EUR|GBP|CAD|CHF)\b)',
+        r'\b(?P<remote>fully remote|remote-first|remote)\b',
+        r'\b(?P<hybrid>hybrid)\b',
+        r'\b(?P<onsite>on-?site|in-office|in office)\b',
+        r"\b(?P<trigger>hiring|job opening|position available|we're looking for|we are looking for|join our team"
+        r"|about the role|apply now)\b",
+        r"\b(?P<section>responsibilities|requirements|qualifications|what you'll do|what we offer|benefits"
+        r"|job description)\b",
+    ]),
+    re.IGNORECASE
+)
+
+TITLE_LINE_PATTERN = re.compile(
+    # Not "I'm a Software Engineer, ..." or "What does an Analyst ..."
+    r"^\s*(?!(?:i|my|me|we|our|you|your|what|how|why|who|can|could|should|would|is|are|do|does)\b)"
+    r'(?P<title>(?:[\w+#/.,&()-]+\s+){0,6}?' + TITLE_WORDS + r')\b(?:\s*(?:[-–|,(@]|at\b).*)?$',
+    re.IGNORECASE
+)
+
+COMPANY_LINE_PATTERN = re.compile(
+    r'^(?P<company>' + _PROPER_NAME + r')\s+[-–|·•@]\s+(?P<location>' + _PROPER_NAME + r'(?:,\s*' + _PROPER_NAME + r')?)'
+)
+
+WORK_TYPES = ('remote', 'hybrid', 'onsite')
+
+MIN_WEAK_SIGNALS = 3
+# A line this short whose section word is all it says is a heading ("Requirements:")
+MAX_HEADING_LENGTH = 40
+
+# Title-shaped lines are only looked for near the top of the posting
+ANALYZED_TITLE_LINES = 15
+# Lines kept for the legacy "first short lines" company/position fallback
+FALLBACK_LINES = 10
+# Longer lines are cut; no real posting line comes close
+MAX_LINE_LENGTH = 10_000
+# Verbs after a company name that make a sentence a posting ("Acme is hiring")
+POSTING_VERBS = ('hiring', 'recruiting')
+
+
+def iter_lines(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Yield lines from a string or from an iterable of text chunks without splitting everything up front."""
+    if isinstance(source, str):
+        start = 0
+        while True:
+            end = source.find('\n', start)
+            if end == -1:
+                yield source[start:start + MAX_LINE_LENGTH]
+                return
+            yield source[start:min(end, start + MAX_LINE_LENGTH)]
+            start = end + 1
+
+    # Pieces of the current line; each chunk is searched once, so a long
+    # run without newlines costs no more than its length
+    pieces: List[str] = []
+    size = 0
+    for chunk in source:
+        start = 0
+        while True:
+            end = chunk.find('\n', start)
+            if end == -1:
+                break
+            pieces.append(chunk[start:min(end, start + MAX_LINE_LENGTH - size)])
+            yield ''.join(pieces)
+            pieces.clear()
+            size = 0
+            start = end + 1
+        if size < MAX_LINE_LENGTH and start < len(chunk):
+            piece = chunk[start:start + MAX_LINE_LENGTH - size]
+            pieces.append(piece)
+            size += len(piece)
+    if pieces:
+        yield ''.join(pieces)
+
+
+def _work_type(value: str) -> Optional[str]:
+    value = value.lower()
+    if 'hybrid' in value:
+        return 'hybrid'
+    if 'remote' in value:
+        return 'remote'
+    if 'site' in value or 'office' in value:
+        return 'onsite'
+    return None
+
+
+class JobPostingParser:
+    """Extract ``JobDetails`` fields from a job posting in one pass."""
+
+    def parse(self, source: Union[str, Iterable[str]]) -> Optional[Dict[str, Any]]:
+        """Return ``JobDetails`` fields, or ``None`` when the text is not a job posting."""
+        fields: Dict[str, Any] = {}
+        is_posting = False
+        # Headings, labels, salaries and the like are common outside postings
+        # too, so they only count once several distinct ones show up. Section
+        # words inside a sentence count once in all, so "requirements and
+        # qualifications" alone is not a posting.
+        weak_signals = set()
+        work_type_votes: Dict[str, int] = {}
+        visa: Optional[bool] = None
+        foreigners: Optional[bool] = None
+        title_line: Optional[str] = None
+        short_lines: List[str] = []
+
+        for index, line in enumerate(iter_lines(source)):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if title_line is None and index < ANALYZED_TITLE_LINES and len(stripped) < 80:
+                title_match = TITLE_LINE_PATTERN.match(stripped)
+                if title_match:
+                    title_line = title_match.group('title').strip(' ,-')
+                    weak_signals.add('title_line')
+            if index < FALLBACK_LINES and COMPANY_LINE_PATTERN.match(stripped):
+                weak_signals.add('company_line')
+
+            header_candidate = True
+            for match in LINE_PATTERN.finditer(line):
+                kind = match.lastgroup
+                # The verb group in the lookahead closes after the company name
+                if kind == 'company_verb':
+                    kind = 'company_hiring'
+                value = match.group(kind).strip(' .,;')
+                if kind in ('trigger', 'section', 'label_value'):
+                    header_candidate = False
+                if kind == 'label_value':
+                    field = LABELS[match.group('label').lower()]
+                    if field == 'workType':
+                        work_type = _work_type(value)
+                        if work_type:
+                            work_type_votes[work_type] = work_type_votes.get(work_type, 0) + 10
+                    else:
+                        fields.setdefault(field, value)
+                    weak_signals.add(('label', field))
+                elif kind == 'company_hiring':
+                    fields.setdefault('companyName', value)
+                    if match.group('company_verb').lower() in POSTING_VERBS:
+                        is_posting = True
+                elif kind == 'position_phrase':
+                    fields.setdefault('positionName', value)
+                    if not match.group('position_verb').lower().startswith(('looking', 'seeking', 'searching')):
+                        is_posting = True
+                elif kind == 'company_phrase':
+                    fields.setdefault('companyName', value)
+                elif kind == 'location_phrase':
+                    fields.setdefault('location', value)
+                elif kind == 'visa_no':
+                    visa = False
+                    weak_signals.add('visa')
+                elif kind == 'visa_yes':
+                    # A "no sponsorship" statement anywhere wins
+                    if visa is None:
+                        visa = True
+                    weak_signals.add('visa')
+                elif kind == 'foreigners_no':
+                    foreigners = False
+                    weak_signals.add('foreigners')
+                elif kind == 'foreigners_yes':
+                    if foreigners is None:
+                        foreigners = True
+                    weak_signals.add('foreigners')
+                elif kind == 'salary':
+                    fields.setdefault('salaryRange', value)
+                    weak_signals.add('salary')
+                elif kind in WORK_TYPES:
+                    work_type_votes[kind] = work_type_votes.get(kind, 0) + 1
+                    weak_signals.add('work_type')
+                elif kind == 'trigger':
+                    is_posting = True
+                elif kind == 'section':
+                    heading = stripped.rstrip(':').strip().lower()
+                    if len(stripped) <= MAX_HEADING_LENGTH and heading == value.lower():
+                        weak_signals.add(('heading', heading))
+                    else:
+                        weak_signals.add('section')
+
+            # Lines like "We're hiring!" or "Location: ..." are not company/title headers
+            if header_candidate and index < FALLBACK_LINES and len(stripped) < 100:
+                short_lines.append(stripped)
+
+        if not is_posting and len(weak_signals) < MIN_WEAK_SIGNALS:
+            return None
+
+        if 'positionName' not in fields and title_line:
+            fields['positionName'] = title_line
+        # Same fallback as the original heuristic: first short lines
+        for line in short_lines:
+            if 'companyName' in fields and 'positionName' in fields:
+                break
+            known = [fields[key] for key in ('companyName', 'positionName') if key in fields]
+            if any(value in line for value in known):
+                continue
+            if 'companyName' not in fields:
+                # "Acme Corp - Berlin, Germany (Hybrid)" style header line
+                company_line = COMPANY_LINE_PATTERN.match(line)
+                if company_line:
+                    fields['companyName'] = company_line.group('company')
+                    fields.setdefault('location', company_line.group('location'))
+                else:
+                    fields['companyName'] = line
+            else:
+                fields['positionName'] = line
+
+        fields.setdefault('companyName', 'Unknown Company')
+        fields.setdefault('positionName', 'Unknown Position')
+        if work_type_votes:
+            fields['workType'] = max(work_type_votes, key=work_type_votes.get)
+        if visa is not None:
+            fields['visaSponsorship'] = visa
+        # A sponsored visa implies candidates from abroad are considered
+        if foreigners is None and visa:
+            foreigners = True
+        if foreigners is not None:
+            fields['foreignersOk'] = foreigners
+        return fields
+
+
+job_parser = JobPostingParser()
+
+
+def parse_job_posting(source: Union[str, Iterable[str]]) -> Optional[Dict[str, Any]]:
+    return job_parser.parse(source)
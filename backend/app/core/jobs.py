@@ -0,0 +1,290 @@
+"""Database-backed background jobs for post-upload processing.
+
+Work is queued as ``Job`` rows in the application database, so no broker
+or outside service is needed and queued work survives restarts. Every
+app process runs a ``JobWorker`` that polls for due jobs and claims one
+with a conditional ``UPDATE ... WHERE status = 'queued'``, so several
+gunicorn workers can share the queue without running a job twice. Each
+job kind has its own concurrency limit. Failed jobs are retried with
+exponential backoff until ``max_attempts``, and jobs whose worker died
+mid-run are requeued once their lease expires (checked a few times per
+lease, not on every poll, so idle workers do not keep taking the write
+lock). Polling, claiming and recording results are blocking database
+work and run in the threadpool; only the handlers run on the event loop.
+
+Jobs attached to a resume drive its processing status: ``queued`` when
+work is enqueued, ``processing`` while any job is pending or running,
+then ``processed`` or ``failed``. Review statuses set by recruiters are
+never overwritten.
+"""
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import json
+import os
+import socket
+import traceback
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
+
+from app.db.models import Job, Resume, engine
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Resume statuses owned by the processing pipeline
+PIPELINE_STATUSES = ("new", "queued", "processing", "processed", "failed")
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying cannot help."""
+
+
+JobHandler = Callable[[Session, Job, Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class HandlerSpec:
+    handler: JobHandler
+    concurrency: int
+
+
+JOB_HANDLERS: Dict[str, HandlerSpec] = {}
+
+
+def job_handler(kind: str, concurrency: int = 1):
+    """Register an ``async def handler(db, job, payload)`` for a job kind."""
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = HandlerSpec(handler=handler, concurrency=concurrency)
+        return handler
+    return register
+
+
+def set_resume_status(db: Session, resume: Resume, status: str) -> None:
+    if resume.status in PIPELINE_STATUSES and resume.status != status:
+        resume.status = status
+        db.add(resume)
+
+
+def enqueue(
+    db: Session,
+    kind: str,
+    resume_id: Optional[int] = None,
+    payload: Optional[Dict[str, Any]] = None,
+    max_attempts: int = 3,
+    delay_seconds: float = 0
+) -> Job:
+    """Add a job in the caller's transaction. The caller commits."""
+    job = Job(kind=kind, resume_id=resume_id, payload=json.dumps(payload or {}), max_attempts=max_attempts,
+              run_after=datetime.utcnow() + timedelta(seconds=delay_seconds))
+    db.add(job)
+    if resume_id is not None:
+        resume = db.get(Resume, resume_id)
+        if resume:
+            set_resume_status(db, resume, "queued")
+    return job
+
+
+def refresh_resume_status(db: Session, resume_id: int) -> None:
+    """Derive a resume's processing status from its jobs."""
+    resume = db.get(Resume, resume_id)
+    if not resume:
+        return
+    statuses = set(db.exec(select(Job.status).where(Job.resume_id == resume_id)).all())
+    if statuses & {QUEUED, RUNNING}:
+        set_resume_status(db, resume, "processing")
+    elif FAILED in statuses:
+        set_resume_status(db, resume, "failed")
+    elif statuses:
+        set_resume_status(db, resume, "processed")
+
+
+def backoff_seconds(attempts: int, base: float, cap: float) -> float:
+    return min(cap, base * 2 ** max(attempts - 1, 0))
+
+
+class JobWorker:
+    """Poll the job table and run due jobs with per-kind concurrency limits."""
+
+    def __init__(
+        self,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 300.0,
+        backoff_base: float = 5.0,
+        backoff_cap: float = 600.0
+    ):
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._running: Dict[str, int] = {}
+        self._tasks: set = set()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._loop_task: Optional[asyncio.Task] = None
+        # Expired leases are looked for a few times per lease
+        self.requeue_interval = max(poll_interval, lease_seconds / 4)
+        self._next_requeue = 0.0
+
+    def start(self) -> None:
+        self._loop_task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self._wakeup.set()
+        if self._loop_task:
+            await self._loop_task
+        # Unfinished jobs are requeued by the lease check of whichever worker runs next
+        for task in list(self._tasks):
+            task.cancel()
+
+    def notify(self) -> None:
+        """Wake the worker early, e.g. right after a job was enqueued in this process."""
+        self._wakeup.set()
+
+    def _available_kinds(self) -> List[str]:
+        return [kind for kind, spec in JOB_HANDLERS.items() if self._running.get(kind, 0) < spec.concurrency]
+
+    def _requeue_expired(self) -> None:
+        expired = datetime.utcnow() - timedelta(seconds=self.lease_seconds)
+        with Session(engine) as db:
+            db.execute(
+                update(Job)
+                .where(Job.status == RUNNING, Job.locked_at < expired)
+                .values(status=QUEUED, locked_by=None, locked_at=None)
+            )
+            db.commit()
+
+    def _claim(self, kinds: List[str]) -> Optional[Job]:
+        now = datetime.utcnow()
+        with Session(engine, expire_on_commit=False) as db:
+            candidates = db.exec(
+                select(Job.id)
+                .where(Job.status == QUEUED, Job.run_after <= now, Job.kind.in_(kinds))
+                .order_by(Job.run_after, Job.id)
+                .limit(5)
+            ).all()
+            for job_id in candidates:
+                # Only one worker wins the status flip for a given job
+                claimed = db.execute(
+                    update(Job)
+                    .where(Job.id == job_id, Job.status == QUEUED)
+                    .values(status=RUNNING, locked_by=self.worker_id, locked_at=now, attempts=Job.attempts + 1)
+                )
+                db.commit()
+                if claimed.rowcount == 1:
+                    return db.get(Job, job_id)
+        return None
+
+    async def _run(self) -> None:
+        print(f"Job worker {self.worker_id} started")
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            try:
+                if loop.time() >= self._next_requeue:
+                    self._next_requeue = loop.time() + self.requeue_interval
+                    await run_in_threadpool(self._requeue_expired)
+                while not self._stopping:
+                    kinds = self._available_kinds()
+                    job = await run_in_threadpool(self._claim, kinds) if kinds else None
+                    if job is None:
+                        break
+                    self._running[job.kind] = self._running.get(job.kind, 0) + 1
+                    task = asyncio.create_task(self._execute(job.id, job.kind))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+            except Exception as e:
+                print(f"Job worker poll failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+        print(f"Job worker {self.worker_id} stopped")
+
+    def _start(self, db: Session, job_id: int) -> Job:
+        job = db.get(Job, job_id)
+        if job.resume_id is not None:
+            resume = db.get(Resume, job.resume_id)
+            if resume:
+                set_resume_status(db, resume, "processing")
+                db.commit()
+        return job
+
+    def _finish(self, db: Session, job_id: int, error: Optional[Exception], trace: Optional[str]) -> None:
+        if error is None:
+            job = db.get(Job, job_id)
+            job.status = DONE
+            job.last_error = None
+            job.finished_at = datetime.utcnow()
+        else:
+            db.rollback()
+            job = db.get(Job, job_id)
+            job.last_error = f"{type(error).__name__}: {error}"
+            if isinstance(error, PermanentJobError) or job.attempts >= job.max_attempts:
+                job.status = FAILED
+                job.finished_at = datetime.utcnow()
+                print(f"Job {job.id} ({job.kind}) failed permanently: {job.last_error}")
+                print(trace)
+            else:
+                job.status = QUEUED
+                job.run_after = datetime.utcnow() + timedelta(
+                    seconds=backoff_seconds(job.attempts, self.backoff_base, self.backoff_cap)
+                )
+                print(f"Job {job.id} ({job.kind}) attempt {job.attempts} failed, retrying at {job.run_after}")
+
+        job.locked_by = None
+        job.locked_at = None
+        db.add(job)
+        if job.resume_id is not None:
+            db.flush()
+            refresh_resume_status(db, job.resume_id)
+        db.commit()
+
+    async def _execute(self, job_id: int, kind: str) -> None:
+        try:
+            with Session(engine) as db:
+                error = None
+                trace = None
+                try:
+                    job = await run_in_threadpool(self._start, db, job_id)
+                    await JOB_HANDLERS[kind].handler(db, job, json.loads(job.payload))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    error = e
+                    trace = traceback.format_exc()
+                await run_in_threadpool(self._finish, db, job_id, error, trace)
+        finally:
+            self._running[kind] -= 1
+            self._wakeup.set()
+
+
+job_worker: Optional[JobWorker] = None
+
+
+def start_job_worker(**options: Any) -> JobWorker:
+    """Start this process's worker (call from the running event loop)."""
+    global job_worker
+    job_worker = JobWorker(**options)
+    job_worker.start()
+    return job_worker
+
+
+async def stop_job_worker() -> None:
+    global job_worker
+    if job_worker is not None:
+        await job_worker.stop()
+        job_worker = None
+
+
+def notify_job_worker() -> None:
+    if job_worker is not None:
+        job_worker.notify()
@@ -0,0 +1,18 @@
+"""Natural language analysis used by the chat endpoint."""
+from .base import NLPAnalysis, NLPBackend, NLPEntity, NLPTimeoutError
+from .cache import NLPResultCache
+from .client import AsyncLanguageAdapter
+from .intents import IntentMatcher, detect_intents
+from .local import LocalNLPBackend
+
+__all__ = [
+    'AsyncLanguageAdapter',
+    'IntentMatcher',
+    'LocalNLPBackend',
+    'NLPAnalysis',
+    'NLPBackend',
+    'NLPEntity',
+    'NLPResultCache',
+    'NLPTimeoutError',
+    'detect_intents',
+]
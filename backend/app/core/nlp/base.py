@@ -0,0 +1,34 @@
+"""Result types and the backend interface shared by NLP implementations."""
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class NLPEntity:
+    name: str
+    type: str
+    salience: float = 0.0
+
+
+@dataclass
+class NLPAnalysis:
+    """Sentiment and entities for one document."""
+    sentiment_score: float = 0.0
+    sentiment_magnitude: float = 0.0
+    entities: List[NLPEntity] = field(default_factory=list)
+
+
+class NLPTimeoutError(Exception):
+    """Raised when the language service does not answer within the timeout."""
+
+
+class NLPBackend:
+    """Interface for anything that scores sentiment and extracts entities."""
+
+    name = "base"
+
+    async def analyze(self, text: str) -> NLPAnalysis:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Release any resources held by the backend."""
@@ -0,0 +1,180 @@
+"""Content-addressed cache for language analysis results.
+
+Entries are keyed by a SHA-256 of the analysis type and the normalized
+document text. Lookups go through a bounded in-process LRU tier first and
+then through an optional SQLite file shared by every worker on the host.
+Both tiers drop entries once their TTL has passed. The shared tier does
+disk I/O and may wait on other workers' writes, so async callers reach it
+through ``get_async``/``set_async`` on an executor, never on the event loop.
+"""
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import asdict
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Optional
+
+from app.core.cache import LRUCache
+
+from .base import NLPAnalysis, NLPEntity
+
+
+def normalize_text(text: str) -> str:
+    """Normalize unicode and whitespace so trivially different messages share a key.
+
+    Case is kept because entity detection depends on it.
+    """
+    return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+
+def cache_key(text: str, analysis_type: str) -> str:
+    payload = f"{analysis_type}\0{normalize_text(text)}".encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+class SharedCache:
+    """SQLite-backed tier shared between worker processes on one host."""
+
+    def __init__(self, path: str, ttl_seconds: float = 3600, purge_interval_seconds: float = 300):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval_seconds = purge_interval_seconds
+        self._local = threading.local()
+        self._purge_lock = threading.Lock()
+        self._next_purge = 0.0
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS nlp_cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_nlp_cache_expires_at ON nlp_cache (expires_at)")
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=1.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._connection().execute(
+            "SELECT value FROM nlp_cache WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO nlp_cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, now + self.ttl_seconds)
+        )
+        # Reads already skip expired rows; purging them now and then is enough
+        if self._purge_due(now):
+            conn.execute("DELETE FROM nlp_cache WHERE expires_at <= ?", (now,))
+        conn.commit()
+
+    def _purge_due(self, now: float) -> bool:
+        with self._purge_lock:
+            if now < self._next_purge:
+                return False
+            self._next_purge = now + self.purge_interval_seconds
+            return True
+
+
+class NLPResultCache:
+    """Two-tier cache of ``NLPAnalysis`` results with hit/miss counters."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600,
+        shared_path: Optional[str] = None
+    ):
+        self.local = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.shared = SharedCache(shared_path, ttl_seconds=ttl_seconds) if shared_path else None
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def get(self, text: str, analysis_type: str) -> Optional[NLPAnalysis]:
+        key = cache_key(text, analysis_type)
+        analysis = self._get_local(key)
+        if analysis is None and self.shared:
+            analysis = self._get_shared(key)
+        if analysis is None:
+            self.misses += 1
+        return analysis
+
+    async def get_async(self, text: str, analysis_type: str, executor: Executor) -> Optional[NLPAnalysis]:
+        """Like ``get``, with the shared tier read on ``executor``."""
+        key = cache_key(text, analysis_type)
+        analysis = self._get_local(key)
+        if analysis is None and self.shared:
+            analysis = await asyncio.get_running_loop().run_in_executor(executor, self._get_shared, key)
+        if analysis is None:
+            self.misses += 1
+        return analysis
+
+    def set(self, text: str, analysis_type: str, analysis: NLPAnalysis) -> None:
+        key = cache_key(text, analysis_type)
+        self.local.set(key, analysis)
+        if self.shared:
+            self._set_shared(key, analysis)
+
+    def set_async(self, text: str, analysis_type: str, analysis: NLPAnalysis, executor: Executor) -> None:
+        """Like ``set``; the shared tier is written on ``executor`` without waiting for it."""
+        key = cache_key(text, analysis_type)
+        self.local.set(key, analysis)
+        if self.shared:
+            executor.submit(self._set_shared, key, analysis)
+
+    def _get_local(self, key: str) -> Optional[NLPAnalysis]:
+        analysis = self.local.get(key)
+        if analysis is not None:
+            self.hits += 1
+        return analysis
+
+    def _get_shared(self, key: str) -> Optional[NLPAnalysis]:
+        try:
+            raw = self.shared.get(key)
+        except sqlite3.Error as e:
+            print(f"Shared NLP cache read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        analysis = _deserialize(raw)
+        self.local.set(key, analysis)
+        self.shared_hits += 1
+        return analysis
+
+    def _set_shared(self, key: str, analysis: NLPAnalysis) -> None:
+        try:
+            self.shared.set(key, json.dumps(asdict(analysis)))
+        except sqlite3.Error as e:
+            print(f"Shared NLP cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            'hits': self.hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+            'entries': len(self.local),
+            'evictions': self.local.evictions,
+            'expirations': self.local.expirations,
+        }
+
+
+def _deserialize(raw: str) -> NLPAnalysis:
+    data = json.loads(raw)
+    data['entities'] = [NLPEntity(**entity) for entity in data.get('entities', [])]
+    return NLPAnalysis(**data)
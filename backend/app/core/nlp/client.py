@@ -0,0 +1,86 @@
+"""Async adapter around the Google Cloud Natural Language client.
+
+The Google client is synchronous, so calling it from an ``async def`` handler
+blocks the worker's event loop for the whole network round-trip. The adapter
+sends a single ``annotate_text`` request (sentiment + entities) on a bounded
+thread pool and enforces a timeout on it. Results can be memoized in an
+``NLPResultCache`` so repeated messages skip the network entirely.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+from google.cloud import language_v1
+
+from .base import NLPAnalysis, NLPBackend, NLPEntity, NLPTimeoutError
+
+if TYPE_CHECKING:
+    from .cache import NLPResultCache
+
+
+class AsyncLanguageAdapter(NLPBackend):
+    """Run language API calls off the event loop with a per-call timeout."""
+
+    name = "google"
+
+    # Cache namespace for the combined annotate request
+    ANALYSIS_TYPE = "annotate:sentiment+entities"
+
+    def __init__(
+        self,
+        client: language_v1.LanguageServiceClient,
+        timeout: float = 5.0,
+        max_workers: int = 4,
+        cache: Optional["NLPResultCache"] = None
+    ):
+        self.client = client
+        self.timeout = timeout
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nlp")
+
+    async def analyze(self, text: str) -> NLPAnalysis:
+        """Get sentiment and entities for ``text`` in one annotate request."""
+        if self.cache:
+            cached = await self.cache.get_async(text, self.ANALYSIS_TYPE, self._executor)
+            if cached is not None:
+                return cached
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self._annotate, text)
+        try:
+            analysis = await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise NLPTimeoutError(f"Language API did not respond within {self.timeout}s")
+
+        if self.cache:
+            self.cache.set_async(text, self.ANALYSIS_TYPE, analysis, self._executor)
+        return analysis
+
+    def _annotate(self, text: str) -> NLPAnalysis:
+        document = language_v1.Document(
+            content=text,
+            type_=language_v1.Document.Type.PLAIN_TEXT
+        )
+        features = language_v1.AnnotateTextRequest.Features(
+            extract_entities=True,
+            extract_document_sentiment=True
+        )
+        # The gRPC deadline matches the asyncio timeout so abandoned calls
+        # release their pool thread instead of piling up behind a slow API.
+        response = self.client.annotate_text(
+            document=document,
+            features=features,
+            timeout=self.timeout
+        )
+        return NLPAnalysis(
+            sentiment_score=response.document_sentiment.score,
+            sentiment_magnitude=response.document_sentiment.magnitude,
+            entities=[
+                NLPEntity(name=entity.name, type=entity.type_.name, salience=entity.salience)
+                for entity in response.entities
+            ]
+        )
+
+    def shutdown(self) -> None:
+        """Release the worker threads."""
+        self._executor.shutdown(wait=False)
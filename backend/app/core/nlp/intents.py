@@ -0,0 +1,40 @@
+"""Intent detection for chat messages.
+
+An intent is detected when any of its keywords occurs in the lowercased
+message as a substring, so "skill" matches "skills" (and "ats" matches
+"whats"). A plain ``in`` check per keyword runs in C and, for this
+table, is about 3x faster than scanning the message once with a compiled
+character-trie regex; the scan only wins beyond roughly 200 keywords
+(``benchmarks/intent_matcher.py``).
+"""
+from typing import Dict, List
+
+INTENT_KEYWORDS: Dict[str, List[str]] = {
+    'resume_help': ['resume', 'cv', 'curriculum', 'format', 'layout', 'structure'],
+    'job_search': ['job', 'position', 'hiring', 'application', 'apply', 'interview', 'career'],
+    'skills': ['skill', 'experience', 'qualification', 'competency', 'expertise'],
+    'cover_letter': ['cover letter', 'cover-letter', 'motivation', 'introduction'],
+    'optimization': ['optimize', 'improve', 'better', 'enhance', 'tailor', 'customize'],
+    'ats': ['ats', 'applicant tracking', 'tracking system', 'keyword'],
+    'advice': ['help', 'advice', 'suggestion', 'recommendation', 'tip']
+}
+
+class IntentMatcher:
+    """Map keywords to intents and find all intents whose keywords occur in a text."""
+
+    def __init__(self, intent_keywords: Dict[str, List[str]]):
+        self._keywords = {intent: [keyword.lower() for keyword in keywords]
+                          for intent, keywords in intent_keywords.items()}
+
+    def match(self, text: str) -> List[str]:
+        """Return the intents found in ``text``, in declaration order."""
+        text = text.lower()
+        return [intent for intent, keywords in self._keywords.items()
+                if any(keyword in text for keyword in keywords)]
+
+
+intent_matcher = IntentMatcher(INTENT_KEYWORDS)
+
+
+def detect_intents(text: str) -> List[str]:
+    return intent_matcher.match(text)
@@ -0,0 +1,269 @@
+"""In-process NLP backend with no external calls.
+
+Sentiment comes from a small valence lexicon with negation and intensifier
+handling (in the spirit of VADER); entities come from a gazetteer of
+companies, places, job titles and skills plus regex rules for prices,
+dates and phone numbers. It is far less capable than the Google API but
+answers in well under a millisecond, works offline and is deterministic,
+which is all the chat endpoint needs from it.
+"""
+import math
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .base import NLPAnalysis, NLPBackend, NLPEntity
+
+# Word valences on a -4..4 scale
+SENTIMENT_LEXICON: Dict[str, float] = {
+    # Positive
+    'love': 3.2, 'loved': 2.9, 'great': 3.1, 'excellent': 3.2, 'amazing': 2.8,
+    'awesome': 3.1, 'fantastic': 2.6, 'wonderful': 2.7, 'perfect': 2.7,
+    'good': 1.9, 'nice': 1.8, 'happy': 2.7, 'glad': 2.0, 'excited': 2.2,
+    'exciting': 2.2, 'thrilled': 2.6, 'enthusiastic': 1.9, 'passionate': 2.2,
+    'thanks': 1.9, 'thank': 1.5, 'grateful': 2.0, 'appreciate': 1.7,
+    'helpful': 1.7, 'useful': 1.9, 'confident': 2.2, 'hope': 1.9,
+    'hopeful': 1.6, 'interested': 1.7, 'impressive': 2.3, 'proud': 2.1,
+    'success': 2.7, 'successful': 2.8, 'win': 2.8, 'won': 2.7, 'hired': 1.8,
+    'offer': 0.8, 'promoted': 1.8, 'promotion': 1.6, 'dream': 1.0,
+    'like': 1.5, 'enjoy': 2.2, 'best': 3.2, 'better': 1.9, 'improve': 1.9,
+    'strong': 2.3, 'cool': 1.3, 'fine': 0.8, 'ready': 1.5, 'motivated': 1.8,
+    # Negative
+    'hate': -2.7, 'bad': -2.5, 'terrible': -2.1, 'awful': -2.0, 'horrible': -2.5,
+    'worst': -3.1, 'worse': -2.1, 'sad': -2.1, 'upset': -1.6, 'angry': -2.3,
+    'frustrated': -2.4, 'frustrating': -2.2, 'stressed': -1.9, 'stressful': -1.9,
+    'worried': -1.9, 'worry': -1.9, 'anxious': -1.0, 'nervous': -1.1,
+    'scared': -1.9, 'afraid': -2.0, 'confused': -1.3, 'confusing': -0.9,
+    'stuck': -1.0, 'lost': -1.3, 'struggling': -1.6, 'struggle': -1.4,
+    'difficult': -1.5, 'hard': -0.4, 'tough': -0.5, 'fail': -2.5,
+    'failed': -2.3, 'failure': -2.3, 'rejected': -2.0, 'rejection': -2.5,
+    'reject': -1.7, 'fired': -2.6, 'unemployed': -2.2, 'layoff': -1.8,
+    'laid': -0.8, 'ghosted': -1.8, 'hopeless': -2.7, 'disappointed': -1.9,
+    'disappointing': -2.2, 'boring': -1.3, 'tired': -1.9, 'exhausted': -1.5,
+    'weak': -1.9, 'wrong': -2.1, 'problem': -1.7, 'problems': -1.7,
+    'unfortunately': -1.5, 'sorry': -0.3, 'useless': -1.8, 'annoying': -1.6,
+}
+
+NEGATIONS = {
+    'not', 'no', 'never', 'none', 'nothing', 'nobody', 'neither', 'nor',
+    'cannot', "can't", 'cant', "don't", 'dont', "doesn't", 'doesnt',
+    "didn't", 'didnt', "isn't", 'isnt', "wasn't", 'wasnt', "aren't",
+    "won't", 'wont', "wouldn't", "shouldn't", "couldn't", 'hardly', 'without',
+}
+
+# Added to (or, when negative, taken from) the magnitude of the next sentiment word
+INTENSIFIERS = {
+    'very': 0.293, 'really': 0.293, 'extremely': 0.293, 'so': 0.293,
+    'super': 0.293, 'incredibly': 0.293, 'totally': 0.293, 'absolutely': 0.293,
+    'quite': 0.1, 'slightly': -0.293, 'somewhat': -0.293, 'kinda': -0.293,
+    'barely': -0.293,
+}
+
+# Constants from the VADER paper
+NEGATION_SCALAR = -0.74
+EXCLAMATION_BOOST = 0.292
+NORMALIZATION_ALPHA = 15
+NEGATION_WINDOW = 3
+
+# Phrase -> Google entity type
+GAZETTEER: Dict[str, str] = {
+    **{name: 'ORGANIZATION' for name in (
+        'Google', 'Alphabet', 'Microsoft', 'Amazon', 'AWS', 'Apple', 'Meta',
+        'Facebook', 'Netflix', 'IBM', 'Oracle', 'Salesforce', 'LinkedIn',
+        'Indeed', 'Glassdoor', 'Deloitte', 'Accenture', 'McKinsey', 'KPMG',
+        'PwC', 'EY', 'Goldman Sachs', 'JPMorgan', 'Morgan Stanley', 'Intel',
+        'Nvidia', 'Adobe', 'SAP', 'Spotify', 'Uber', 'Airbnb', 'Stripe',
+        'Shopify', 'Tesla', 'OpenAI', 'Twitter', 'Samsung', 'Siemens',
+        'Capgemini', 'BNP Paribas', 'L\'Oreal', 'Airbus', 'Thales',
+    )},
+    **{name: 'LOCATION' for name in (
+        'New York', 'San Francisco', 'Silicon Valley', 'Los Angeles', 'Seattle',
+        'Boston', 'Austin', 'Chicago', 'Toronto', 'Vancouver', 'Montreal',
+        'London', 'Paris', 'Berlin', 'Munich', 'Amsterdam', 'Dublin', 'Madrid',
+        'Barcelona', 'Lisbon', 'Zurich', 'Stockholm', 'Singapore', 'Tokyo',
+        'Sydney', 'Bangalore', 'Dubai', 'Europe', 'USA', 'United States',
+        'Canada', 'France', 'Germany', 'UK', 'United Kingdom', 'Spain',
+        'Brazil', 'India',
+    )},
+    **{name: 'PERSON' for name in (
+        'software engineer', 'software developer', 'developer', 'engineer',
+        'data scientist', 'data analyst', 'data engineer', 'product manager',
+        'project manager', 'designer', 'recruiter', 'hiring manager',
+        'manager', 'intern', 'consultant', 'analyst', 'researcher',
+        'architect', 'director', 'team lead', 'scientist',
+    )},
+    **{name: 'OTHER' for name in (
+        'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go',
+        'Rust', 'Ruby', 'PHP', 'Swift', 'Kotlin', 'SQL', 'NoSQL', 'React',
+        'Angular', 'Vue', 'Node.js', 'Django', 'FastAPI', 'Flask', 'Spring',
+        '.NET', 'Docker', 'Kubernetes', 'Terraform', 'Linux', 'Git', 'Azure',
+        'GCP', 'Excel', 'Tableau', 'Power BI', 'machine learning',
+        'deep learning', 'data science', 'artificial intelligence', 'AI',
+        'NLP', 'DevOps', 'Agile', 'Scrum', 'project management',
+        'resume', 'CV', 'cover letter', 'portfolio', 'interview', 'ATS',
+    )},
+}
+
+_MONTHS = (
+    r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|'
+    r'Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)'
+)
+
+# (type, pattern) in priority order; earlier rules win on overlapping spans
+ENTITY_RULES: List[Tuple[str, "re.Pattern"]] = [
+    ('PRICE', re.compile(r'[$€£]\s?\d[\d,]*(?:\.\d+)?\s?[kK]?\b')),
+    ('PHONE_NUMBER', re.compile(r'\+?\d[\d ().-]{7,}\d')),
+    ('DATE', re.compile(_MONTHS + r'\.?(?:\s+\d{1,2},?)?(?:\s+(?:19|20)\d{2})?\b|\b(?:19|20)\d{2}\b')),
+    ('NUMBER', re.compile(r'\b\d+(?:\.\d+)?\b')),
+]
+
+_TOKEN_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+_PROPER_NOUN_RE = re.compile(r"\b[A-Z][a-zA-Z&'-]+(?:\s+[A-Z][a-zA-Z&'-]+)*")
+_PROPER_NOUN_STOPWORDS = {'I', 'I\'m', 'I\'ve', 'I\'d', 'I\'ll'}
+
+
+# Entries that are also everyday words only match with their own capitalization
+AMBIGUOUS_ENTRIES = {
+    'Go', 'Swift', 'Spring', 'Rust', 'Ruby', 'Apple', 'Amazon', 'Meta',
+    'Indeed', 'Stripe', 'Oracle', 'Uber', 'Vue', 'Git', 'Agile',
+}
+
+
+def _is_case_sensitive(phrase: str) -> bool:
+    return phrase in AMBIGUOUS_ENTRIES or phrase.isupper()
+
+
+def _compile_gazetteer(phrases: List[str], flags: int = 0) -> Optional["re.Pattern"]:
+    if not phrases:
+        return None
+    # Longest phrases first so "machine learning" beats "learning"; lookarounds
+    # instead of \b so entries such as "C++" and ".NET" still match.
+    phrases = sorted(phrases, key=len, reverse=True)
+    alternation = '|'.join(re.escape(phrase) for phrase in phrases)
+    return re.compile(rf'(?<![\w.+#])(?:{alternation})(?![\w+#])', flags)
+
+
+def _at_sentence_start(text: str, position: int) -> bool:
+    i = position - 1
+    while i >= 0 and text[i] in ' \t':
+        i -= 1
+    return i < 0 or text[i] in '.!?:\n'
+
+
+class LexiconSentimentScorer:
+    """Score text on Google's -1..1 scale from a valence lexicon."""
+
+    def __init__(self, lexicon: Optional[Dict[str, float]] = None):
+        self.lexicon = lexicon if lexicon is not None else SENTIMENT_LEXICON
+
+    def score(self, text: str) -> Tuple[float, float]:
+        """Return ``(score, magnitude)`` for ``text``."""
+        tokens = _TOKEN_RE.findall(text.lower().replace('’', "'"))
+        total = 0.0
+        magnitude = 0.0
+        for i, token in enumerate(tokens):
+            valence = self.lexicon.get(token)
+            if valence is None:
+                continue
+            negated = False
+            for previous in tokens[max(0, i - NEGATION_WINDOW):i]:
+                if previous in INTENSIFIERS:
+                    valence += math.copysign(INTENSIFIERS[previous], valence)
+                if previous in NEGATIONS:
+                    negated = True
+            if negated:
+                valence *= NEGATION_SCALAR
+            total += valence
+            magnitude += abs(valence)
+
+        if total:
+            total += math.copysign(min(text.count('!'), 3) * EXCLAMATION_BOOST, total)
+
+        score = total / math.sqrt(total * total + NORMALIZATION_ALPHA)
+        return score, magnitude / 4
+
+
+class GazetteerEntityExtractor:
+    """Find entities from a phrase list, regex rules and capitalization."""
+
+    def __init__(self, gazetteer: Optional[Dict[str, str]] = None):
+        gazetteer = gazetteer if gazetteer is not None else GAZETTEER
+        self._canonical = {phrase.lower(): phrase for phrase in gazetteer}
+        self._types = {phrase.lower(): entity_type for phrase, entity_type in gazetteer.items()}
+        self._patterns = [
+            pattern for pattern in (
+                _compile_gazetteer([p for p in gazetteer if _is_case_sensitive(p)]),
+                _compile_gazetteer([p for p in gazetteer if not _is_case_sensitive(p)], re.IGNORECASE),
+            ) if pattern
+        ]
+
+    def extract(self, text: str) -> List[NLPEntity]:
+        spans: List[Tuple[int, int, str, str]] = []
+        taken = bytearray(len(text))
+
+        def claim(start: int, end: int, name: str, entity_type: str) -> None:
+            if any(taken[start:end]):
+                return
+            taken[start:end] = b'\x01' * (end - start)
+            spans.append((start, end, name, entity_type))
+
+        for pattern in self._patterns:
+            for match in pattern.finditer(text):
+                key = match.group(0).lower()
+                claim(match.start(), match.end(), self._canonical[key], self._types[key])
+
+        for entity_type, pattern in ENTITY_RULES:
+            for match in pattern.finditer(text):
+                claim(match.start(), match.end(), match.group(0).strip(), entity_type)
+
+        for match in _PROPER_NOUN_RE.finditer(text):
+            start, name = match.start(), match.group(0)
+            if _at_sentence_start(text, start):
+                # A capital after a full stop proves nothing; drop that word
+                name = name.partition(' ')[2].lstrip()
+                start = match.end() - len(name)
+            if not name or name in _PROPER_NOUN_STOPWORDS:
+                continue
+            claim(start, match.end(), name, 'OTHER')
+
+        return self._rank(spans, len(text))
+
+    @staticmethod
+    def _rank(spans: List[Tuple[int, int, str, str]], length: int) -> List[NLPEntity]:
+        # Salience favours entities mentioned often and early, summing to 1 like Google's
+        weights: Dict[Tuple[str, str], float] = {}
+        for start, _end, name, entity_type in spans:
+            key = (name, entity_type)
+            weights[key] = weights.get(key, 0.0) + 1.0 / (1.0 + start / max(length, 1))
+        total = sum(weights.values()) or 1.0
+        entities = [
+            NLPEntity(name=name, type=entity_type, salience=weight / total)
+            for (name, entity_type), weight in weights.items()
+        ]
+        entities.sort(key=lambda entity: entity.salience, reverse=True)
+        return entities
+
+
+class LocalNLPBackend(NLPBackend):
+    """NLP backend that runs entirely in process."""
+
+    name = "local"
+
+    def __init__(
+        self,
+        scorer: Optional[LexiconSentimentScorer] = None,
+        extractor: Optional[GazetteerEntityExtractor] = None
+    ):
+        self.scorer = scorer or LexiconSentimentScorer()
+        self.extractor = extractor or GazetteerEntityExtractor()
+
+    def analyze_sync(self, text: str) -> NLPAnalysis:
+        score, magnitude = self.scorer.score(text)
+        return NLPAnalysis(
+            sentiment_score=score,
+            sentiment_magnitude=magnitude,
+            entities=self.extractor.extract(text)
+        )
+
+    async def analyze(self, text: str) -> NLPAnalysis:
+        # Sub-millisecond work; not worth a thread hop
+        return self.analyze_sync(text)
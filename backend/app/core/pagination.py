@@ -0,0 +1,90 @@
+"""Keyset (cursor) pagination on ``(created_at, id)``.
+
+A page is read by seeking the ``(created_at, id)`` index to the cursor
+and taking the next ``limit`` rows, so every page costs the same however
+far back the reader has scrolled (OFFSET would scan all skipped rows).
+Cursors are opaque to clients: base64 of the boundary row's key.
+"""
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlmodel import Session
+
+T = TypeVar("T")
+
+
+def encode_cursor(row: Any) -> str:
+    payload = json.dumps([row.created_at.isoformat(), row.id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """One page in ascending key order, with cursors for the pages around it."""
+    items: List[T]
+    prev_cursor: Optional[str]
+    next_cursor: Optional[str]
+
+
+def keyset_page(
+    db: Session,
+    query,
+    model,
+    limit: int,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+    newest_first: bool = False
+) -> KeysetPage:
+    """Read one page of ``query`` (already filtered, unordered) keyed on ``model.created_at, model.id``.
+
+    ``after`` reads the rows following a cursor and ``before`` the rows
+    preceding it. Without either, the first page is the oldest rows, or
+    the newest ones when ``newest_first`` is set (e.g. chat history, read
+    from the end). Items are always returned oldest first; ``prev_cursor``
+    is None when there is nothing older and ``next_cursor`` when there is
+    nothing newer.
+    """
+    if before and after:
+        raise HTTPException(status_code=400, detail="Use either before or after, not both")
+    key = tuple_(model.created_at, model.id)
+    backwards = bool(before) or (newest_first and not after)
+    if before:
+        query = query.where(key < tuple_(*decode_cursor(before)))
+    elif after:
+        query = query.where(key > tuple_(*decode_cursor(after)))
+    if backwards:
+        query = query.order_by(model.created_at.desc(), model.id.desc())
+    else:
+        query = query.order_by(model.created_at, model.id)
+
+    # One extra row tells whether there is another page in the reading direction
+    rows = list(db.exec(query.limit(limit + 1)).all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+        has_older, has_newer = has_more, bool(before)
+    else:
+        has_older, has_newer = bool(after), has_more
+    if not rows:
+        # Past either end: the cursor given is still the way back
+        return KeysetPage(items=[], prev_cursor=after, next_cursor=before)
+    return KeysetPage(
+        items=rows,
+        prev_cursor=encode_cursor(rows[0]) if has_older else None,
+        next_cursor=encode_cursor(rows[-1]) if has_newer else None
+    )
@@ -1,20 +1,19 @@
 from pathlib import Path
 import os
 import shutil
-from fastapi.responses import FileResponse
-from fastapi import HTTPException
+from fastapi.responses import Response
+from fastapi import HTTPException, Request
 
-def serve_pdf(file_path: str, filename: str | None = None) -> FileResponse:
+from app.core.file_server import file_server
+
+def serve_pdf(request: Request, file_path: str, filename: str | None = None) -> Response:
     """
     Serve a PDF file with proper headers and error handling.
+    Supports conditional GET (ETag/Last-Modified) and byte ranges.
     """
     try:
-        path = Path(file_path)
-        if not path.exists():
-            raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
-        
         if not filename:
-            filename = path.name
+            filename = Path(file_path).name
 
         from app.core.config import settings
 
@@ -26,11 +25,14 @@ def serve_pdf(file_path: str, filename: str | None = None) -> FileResponse:
             'Cache-Control': 'no-cache'
         }
 
-        return FileResponse(
-            path=str(path),
+        return file_server.serve_path(
+            request,
+            str(file_path),
             media_type='application/pdf',
             filename=filename,
             headers=headers
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""Batch rendering of tailored resume variants into a streamed zip.
+
+Each variant is the base resume with its own summary, skills moved to the
+front in a given order, and optionally any top-level section replaced.
+Variants are rendered on the process pool through the render cache, at
+most ``window`` at a time, and every PDF is added to the zip as soon as
+it finishes (completion order, not request order). Only the renders in
+flight and the zip entry being written are held in memory, however many
+variants are requested.
+"""
+import asyncio
+from contextlib import aclosing
+import io
+from itertools import islice
+import os
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+import zipfile
+
+import anyio
+
+from app.core.render_cache import render_cache
+
+COPY_CHUNK_SIZE = 64 * 1024
+
+
+def apply_variant(resume: Dict[str, Any], variant: Dict[str, Any]) -> Dict[str, Any]:
+    """The base resume with a variant's summary, skill order and section overrides applied."""
+    tailored = dict(resume)
+    tailored.update(variant.get('overrides') or {})
+    if variant.get('summary') is not None:
+        tailored['summary'] = variant['summary']
+    if variant.get('skills'):
+        order = {name.lower(): position for position, name in enumerate(variant['skills'])}
+
+        def rank(item: Tuple[int, Any]) -> Tuple[int, int]:
+            position, skill = item
+            name = (skill.get('name') if isinstance(skill, dict) else str(skill)) or ''
+            return order.get(name.lower(), len(order)), position
+
+        tailored['skills'] = [skill for _, skill in sorted(enumerate(tailored.get('skills') or []), key=rank)]
+    return tailored
+
+
+def unique_names(names: Iterable[str]) -> Iterator[str]:
+    """Zip entry names, with -2, -3, ... added to repeats."""
+    seen: Dict[str, int] = {}
+    for name in names:
+        stem, extension = os.path.splitext(name)
+        count = seen.get(name.lower(), 0) + 1
+        seen[name.lower()] = count
+        yield name if count == 1 else f"{stem}-{count}{extension}"
+
+
+async def render_variants(
+    items: Iterable[Tuple[str, Dict[str, Any]]],
+    window: int
+) -> AsyncIterator[Tuple[str, Optional[str], Optional[BaseException]]]:
+    """Render (name, resume) pairs, yielding (name, path, error) as each finishes."""
+    items = iter(items)
+    pending: Dict[asyncio.Future, str] = {}
+
+    def launch() -> None:
+        for name, resume in islice(items, window - len(pending)):
+            pending[asyncio.ensure_future(render_cache.get_or_render(resume, pooled=True))] = name
+
+    launch()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = pending.pop(task)
+                error = task.exception()
+                yield name, None if error else task.result()[0], error
+            launch()
+    finally:
+        # Client went away: stop waiting for the rest
+        for task in pending:
+            task.cancel()
+
+
+class _ZipStream(io.RawIOBase):
+    """Unseekable sink for ZipFile; the bytes written are collected until drained."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _add_entry(archive: zipfile.ZipFile, name: str, path: str, stream: _ZipStream) -> bytes:
+    """Copy a file into the archive and return the zip bytes it produced."""
+    with open(path, 'rb') as source, archive.open(name, 'w') as entry:
+        while True:
+            chunk = source.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            entry.write(chunk)
+    return stream.drain()
+
+
+async def zip_variants(resume: Dict[str, Any], variants: List[Dict[str, Any]], window: int) -> AsyncIterator[bytes]:
+    """Stream a zip holding one PDF per variant (and ``errors.txt`` if any failed)."""
+    names = unique_names(f"{variant['name']}.pdf" for variant in variants)
+    items = ((name, apply_variant(resume, variant)) for name, variant in zip(names, variants))
+    stream = _ZipStream()
+    errors = []
+    # Data descriptors are used because the stream cannot seek back to patch headers
+    archive = zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED)
+    async with aclosing(render_variants(items, window)) as renders:
+        async for name, path, error in renders:
+            if error is not None:
+                print(f"Rendering variant {name} failed: {error}")
+                errors.append(f"{name}: {type(error).__name__}: {error}")
+                continue
+            try:
+                data = await anyio.to_thread.run_sync(_add_entry, archive, name, path, stream)
+            except FileNotFoundError:
+                # Evicted between render and copy
+                errors.append(f"{name}: render was evicted from the cache before it could be sent")
+                continue
+            yield data
+    if errors:
+        archive.writestr("errors.txt", "\n".join(errors) + "\n")
+    archive.close()
+    yield stream.drain()
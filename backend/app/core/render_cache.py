@@ -0,0 +1,101 @@
+"""Disk cache of rendered resume PDFs.
+
+Renders are keyed by a canonical hash of the resume JSON (key order does
+not matter) plus the template id and version, so clicking "generate"
+again without changes is a file lookup instead of a reportlab layout, and
+changing the template (bumping ``TEMPLATE_VERSION``) makes every old
+render unreachable. ``purge_stale_templates`` deletes those on startup;
+otherwise the cache is bounded by size with least-recently-used eviction.
+Cached files are served through the file server like any other download.
+"""
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.blob_store import UPLOAD_DIR
+from app.core.cache import DiskCache, stable_hash
+from app.core.config import settings
+from app.core.resume_pdf import TEMPLATE_ID, TEMPLATE_VERSION, render_resume_pdf_async
+
+TEMPLATE_SUFFIX = f"-{TEMPLATE_ID}-v{TEMPLATE_VERSION}.pdf"
+
+
+class RenderCache:
+    """Rendered PDFs by content hash and template version."""
+
+    def __init__(self, cache: DiskCache, max_workers: Optional[int] = None):
+        self.cache = cache
+        self.max_workers = max_workers
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    def name(self, resume: Dict[str, Any]) -> str:
+        return stable_hash(resume) + TEMPLATE_SUFFIX
+
+    async def get_or_render(self, resume: Dict[str, Any], pooled: bool = False) -> Tuple[str, bool]:
+        """Path of the rendered PDF and whether it came from the cache.
+
+        ``pooled`` renders a miss on the process pool instead of the render process.
+        """
+        name = self.name(resume)
+        cached = self.cache.get(name)
+        if cached is not None:
+            return cached, True
+
+        # Identical requests arriving together share one render. It runs as
+        # its own task and every caller waits through a shield, so a client
+        # that goes away does not cancel it for the others.
+        task = self._in_flight.get(name)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(self._render(name, resume, pooled))
+            self._in_flight[name] = task
+            task.add_done_callback(lambda done: self._finished(name, done))
+        return await asyncio.shield(task), shared
+
+    def _finished(self, name: str, task: asyncio.Future) -> None:
+        self._in_flight.pop(name, None)
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here too, in case every caller has gone away
+            print(f"Rendering {name} failed: {task.exception()}")
+
+    async def _render(self, name: str, resume: Dict[str, Any], pooled: bool) -> str:
+        started = time.perf_counter()
+        pdf = await render_resume_pdf_async(resume, self.max_workers, pooled)
+        with self._lock:
+            self.renders += 1
+            self.render_seconds += time.perf_counter() - started
+        return self.cache.put(name, pdf)
+
+    def purge_stale_templates(self) -> int:
+        """Delete renders made with another template or version."""
+        removed = 0
+        for directory, _, filenames in os.walk(self.cache.root):
+            for filename in filenames:
+                if not filename.endswith(TEMPLATE_SUFFIX) and not filename.endswith('.part'):
+                    try:
+                        os.remove(os.path.join(directory, filename))
+                        removed += 1
+                    except FileNotFoundError:
+                        pass
+        if removed:
+            self.cache.evict()
+            print(f"Removed {removed} renders from previous templates")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.cache.stats()
+        stats['template'] = f"{TEMPLATE_ID} v{TEMPLATE_VERSION}"
+        stats['renders'] = self.renders
+        stats['mean_render_ms'] = self.render_seconds / self.renders * 1000 if self.renders else 0.0
+        return stats
+
+
+render_cache = RenderCache(
+    DiskCache(os.path.join(UPLOAD_DIR, "renders"), max_bytes=settings.render_cache_max_mb * 1024 * 1024),
+    max_workers=settings.resume_extraction_workers
+)
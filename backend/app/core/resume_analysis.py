@@ -0,0 +1,122 @@
+"""Resume analysis for the chat endpoint, memoized per resume section.
+
+The client sends the whole resume with every chat message although it
+rarely changes within a conversation. Each section (skills, experiences,
+education, publications) is hashed on its own and its derived fields are
+cached under that hash, so an edit to one section only recomputes that
+section. The cheap cross-section summary (strengths, areas to improve) is
+rebuilt from the cached parts on every call.
+"""
+from typing import Any, Callable, Dict, List
+
+from app.core.cache import LRUCache, stable_hash
+
+
+def _analyze_skills(skills: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {'skills': [skill.get('name', '') for skill in skills if skill.get('name')]}
+
+
+def _analyze_experiences(experiences: List[Dict[str, Any]]) -> Dict[str, Any]:
+    total_months = 0
+    industries = set()
+    for exp in experiences:
+        if exp.get('startDate') and exp.get('endDate'):
+            # Simple calculation - could be improved
+            start_year = int(exp['startDate'].split('-')[0]) if '-' in exp['startDate'] else 2020
+            end_year = int(exp['endDate'].split('-')[0]) if '-' in exp['endDate'] else 2024
+            if exp['endDate'].lower() == 'present':
+                end_year = 2024
+            total_months += (end_year - start_year) * 12
+        if exp.get('company'):
+            industries.add(exp['company'])
+
+    return {
+        'experience_years': total_months // 12,
+        'industries': list(industries)
+    }
+
+
+def _analyze_education(education: List[Dict[str, Any]]) -> Dict[str, Any]:
+    degrees = [edu.get('degree', '').lower() for edu in education]
+    education_level = 'Unknown'
+    if any('phd' in degree or 'doctorate' in degree for degree in degrees):
+        education_level = 'PhD'
+    elif any('master' in degree or 'ms' in degree or 'ma' in degree for degree in degrees):
+        education_level = "Master's"
+    elif any('bachelor' in degree or 'bs' in degree or 'ba' in degree for degree in degrees):
+        education_level = "Bachelor's"
+    elif any('associate' in degree for degree in degrees):
+        education_level = "Associate's"
+    return {'education_level': education_level}
+
+
+def _analyze_publications(publications: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {'has_publications': bool(publications)}
+
+
+SECTION_ANALYZERS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    'skills': _analyze_skills,
+    'experiences': _analyze_experiences,
+    'education': _analyze_education,
+    'publications': _analyze_publications,
+}
+
+# Derived fields of a section that is missing or empty
+EMPTY_SECTION_RESULTS: Dict[str, Dict[str, Any]] = {
+    'skills': {'skills': []},
+    'experiences': {'experience_years': 0, 'industries': []},
+    'education': {'education_level': 'Unknown'},
+    'publications': {'has_publications': False},
+}
+
+
+class ResumeAnalyzer:
+    """Analyze resumes, reusing cached results for unchanged sections."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.cache = LRUCache(max_entries=max_entries)
+
+    def analyze_section(self, section: str, value: Any) -> Dict[str, Any]:
+        if not value:
+            return EMPTY_SECTION_RESULTS[section]
+        key = (section, stable_hash(value))
+        result = self.cache.get(key)
+        if result is None:
+            result = SECTION_ANALYZERS[section](value)
+            self.cache.set(key, result)
+        return result
+
+    def analyze(self, resume: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze resume content and extract key insights."""
+        sections = {section: self.analyze_section(section, resume.get(section)) for section in SECTION_ANALYZERS}
+
+        # Copy lists so callers cannot mutate cached entries
+        analysis = {
+            'skills': list(sections['skills']['skills']),
+            'experience_years': sections['experiences']['experience_years'],
+            'education_level': sections['education']['education_level'],
+            'industries': list(sections['experiences']['industries']),
+            'key_strengths': [],
+            'areas_for_improvement': []
+        }
+
+        # Generate key strengths
+        if analysis['experience_years'] > 5:
+            analysis['key_strengths'].append('Extensive professional experience')
+        if len(analysis['skills']) > 10:
+            analysis['key_strengths'].append('Diverse skill set')
+        if analysis['education_level'] in ["Master's", 'PhD']:
+            analysis['key_strengths'].append('Advanced education')
+
+        # Areas for improvement
+        if len(analysis['skills']) < 5:
+            analysis['areas_for_improvement'].append('Expand skills section')
+        if analysis['experience_years'] < 2:
+            analysis['areas_for_improvement'].append('Build more professional experience')
+        if not sections['publications']['has_publications']:
+            analysis['areas_for_improvement'].append('Consider adding publications or projects')
+
+        return analysis
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
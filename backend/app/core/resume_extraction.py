@@ -0,0 +1,385 @@
+"""Text and structure extraction from uploaded resume files.
+
+``extract_resume`` reads a PDF (via pypdf) or DOCX (its XML, read with the
+standard library) and turns the text into the frontend's ``Resume`` shape:
+contact info, experiences, education, publications, skills and languages.
+Parsing is CPU-bound, so request handlers call ``extract_resume_async``,
+which runs it in a process pool; the result is stored in a
+``ResumeExtraction`` row so later reads never parse the file again.
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from xml.etree import ElementTree
+import zipfile
+
+from sqlmodel import Session
+
+from app.db.models import ResumeExtraction
+
+SECTION_HEADINGS = {
+    'experiences': ('experience', 'work experience', 'professional experience', 'employment',
+                    'employment history', 'work history', 'career history'),
+    'education': ('education', 'academic background', 'education and training'),
+    'skills': ('skills', 'technical skills', 'core competencies', 'competencies', 'technologies',
+               'skills and tools'),
+    'publications': ('publications', 'papers', 'selected publications'),
+    'languages': ('languages', 'language skills'),
+    'summary': ('summary', 'profile', 'about me', 'objective', 'professional summary'),
+}
+HEADING_SECTIONS = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+
+_MONTHS = {
+    month: number for number, names in enumerate((
+        ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'), ('may',),
+        ('jun', 'june'), ('jul', 'july'), ('aug', 'august'), ('sep', 'sept', 'september'),
+        ('oct', 'october'), ('nov', 'november'), ('dec', 'december')
+    ), start=1) for month in names
+}
+_DATE = r'(?:(?:[A-Za-z]{3,9}\.?\s+)?\d{4}|\d{1,2}/\d{4})'
+DATE_RANGE_PATTERN = re.compile(
+    r'(?P<start>' + _DATE + r')\s*(?:-|–|—|to)\s*(?P<end>' + _DATE + r'|present|current|now)',
+    re.IGNORECASE
+)
+EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+PHONE_PATTERN = re.compile(r'\+?\d[\d\s().-]{7,}\d')
+LINKEDIN_PATTERN = re.compile(r'(?:https?://)?(?:[\w-]+\.)?linkedin\.com/[\w/%-]+', re.IGNORECASE)
+URL_PATTERN = re.compile(r'(?:https?://|www\.)[\w.-]+\.[a-z]{2,}[\w/%.-]*', re.IGNORECASE)
+LOCATION_PATTERN = re.compile(r"^(?P<city>[A-Z][\w .'-]+),\s*(?P<region>[A-Z][\w .'-]+?)(?:,\s*(?P<country>[A-Z][\w .'-]+))?$")
+BULLET_PATTERN = re.compile(r'^\s*[-•*·▪◦●‣]\s*')
+DEGREE_PATTERN = re.compile(
+    r"\b(?:ph\.?d|doctor(?:ate)?|master(?:'s)?|m\.?sc?|m\.?a|mba|bachelor(?:'s)?|b\.?sc?|b\.?a|b\.?eng|m\.?eng|"
+    r"associate(?:'s)?|diploma)\b\.?",
+    re.IGNORECASE
+)
+SCHOOL_PATTERN = re.compile(r'\b(?:university|college|school|institute|academy|polytechnic)\b', re.IGNORECASE)
+SKILL_SEPARATORS = re.compile(r'\s*(?:[,;|•·]|\s{2,}|\band\b)\s*')
+LANGUAGE_LEVELS = (
+    ('native', 'Native/Bilingual'), ('bilingual', 'Native/Bilingual'), ('mother tongue', 'Native/Bilingual'),
+    ('fluent', 'Full Professional'), ('full professional', 'Full Professional'), ('c2', 'Full Professional'),
+    ('c1', 'Full Professional'), ('professional', 'Professional Working'), ('advanced', 'Professional Working'),
+    ('b2', 'Professional Working'), ('intermediate', 'Limited Working'), ('limited', 'Limited Working'),
+    ('b1', 'Limited Working'), ('basic', 'Elementary'), ('elementary', 'Elementary'), ('beginner', 'Elementary'),
+    ('a1', 'Elementary'), ('a2', 'Elementary'),
+)
+_WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+class ExtractionError(Exception):
+    """The file could not be read as a resume."""
+
+
+def _pdf_text(path: str) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError as e:
+        raise ExtractionError("PDF extraction requires the pypdf package") from e
+    try:
+        reader = PdfReader(path)
+        return '\n'.join(page.extract_text() or '' for page in reader.pages)
+    except Exception as e:
+        raise ExtractionError(f"Could not read PDF: {e}") from e
+
+
+def _docx_text(path: str) -> str:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            root = ElementTree.fromstring(archive.read('word/document.xml'))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise ExtractionError(f"Could not read DOCX: {e}") from e
+    paragraphs = []
+    for paragraph in root.iter(f'{_WORD_NAMESPACE}p'):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f'{_WORD_NAMESPACE}t' and node.text:
+                parts.append(node.text)
+            elif node.tag == f'{_WORD_NAMESPACE}tab':
+                parts.append('\t')
+            elif node.tag in (f'{_WORD_NAMESPACE}br', f'{_WORD_NAMESPACE}cr'):
+                parts.append('\n')
+        paragraphs.append(''.join(parts))
+    return '\n'.join(paragraphs)
+
+
+def extract_text(path: str) -> str:
+    """Plain text of a PDF or DOCX file."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.pdf':
+        return _pdf_text(path)
+    if extension == '.docx':
+        return _docx_text(path)
+    raise ExtractionError(f"Unsupported resume format: {extension or 'unknown'}")
+
+
+def _normalize_date(value: str) -> str:
+    """"Jan 2020" -> "2020-01", "03/2019" -> "2019-03", "2018" -> "2018", "Present" -> "Present"."""
+    value = value.strip().rstrip('.')
+    if value.lower() in ('present', 'current', 'now'):
+        return 'Present'
+    if '/' in value:
+        month, year = value.split('/')
+        return f"{year}-{int(month):02d}"
+    parts = value.split()
+    if len(parts) == 2 and parts[0].lower().rstrip('.') in _MONTHS:
+        return f"{parts[1]}-{_MONTHS[parts[0].lower().rstrip('.')]:02d}"
+    return parts[-1]
+
+
+def _split_sections(lines: List[str]) -> Tuple[List[str], Dict[str, List[str]]]:
+    """Header lines before the first known heading, and the lines of each section."""
+    header: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    for line in lines:
+        heading = line.strip().rstrip(':').lower()
+        if len(heading) < 40 and heading in HEADING_SECTIONS:
+            current = sections.setdefault(HEADING_SECTIONS[heading], [])
+        elif current is None:
+            header.append(line)
+        else:
+            current.append(line)
+    return header, sections
+
+
+def _split_entries(lines: List[str]) -> List[List[str]]:
+    """Group section lines into entries, starting a new entry at each non-bullet line with a date range
+    (keeping the title/company lines right above it with the entry)."""
+    entries: List[List[str]] = []
+    pending: List[str] = []
+    for line in lines:
+        is_bullet = bool(BULLET_PATTERN.match(line))
+        if not is_bullet and DATE_RANGE_PATTERN.search(line):
+            # Non-bullet lines since the last bullet introduce this entry
+            carried = []
+            while pending and not BULLET_PATTERN.match(pending[-1]):
+                carried.insert(0, pending.pop())
+            if pending:
+                entries.append(pending)
+            pending = carried + [line]
+        else:
+            pending.append(line)
+    if pending:
+        entries.append(pending)
+    return entries
+
+
+def _split_title_company(text: str) -> Tuple[str, str]:
+    for separator in (' at ', ' @ ', ' | ', ' - ', ' – ', ', '):
+        if separator in text:
+            title, company = text.split(separator, 1)
+            return title.strip(), company.strip()
+    return text.strip(), ''
+
+
+def _parse_experiences(lines: List[str]) -> List[Dict[str, Any]]:
+    experiences = []
+    for entry in _split_entries(lines):
+        dates = None
+        heading_parts: List[str] = []
+        description: List[str] = []
+        location = ''
+        for line in entry:
+            if BULLET_PATTERN.match(line):
+                description.append(BULLET_PATTERN.sub('', line))
+                continue
+            match = DATE_RANGE_PATTERN.search(line) if dates is None else None
+            if match:
+                dates = match
+                rest = (line[:match.start()] + line[match.end():]).strip(' |,-–()\t')
+                if LOCATION_PATTERN.match(rest):
+                    location = rest
+                elif rest:
+                    heading_parts.append(rest)
+            elif not heading_parts or len(heading_parts) < 2 and not description:
+                heading_parts.append(line.strip())
+            else:
+                description.append(line.strip())
+        if not heading_parts and not description:
+            continue
+
+        if len(heading_parts) >= 2:
+            title, company = heading_parts[0], heading_parts[1]
+        else:
+            title, company = _split_title_company(heading_parts[0] if heading_parts else '')
+        if not location and LOCATION_PATTERN.match(company.split(' | ')[-1]):
+            company, _, location = company.rpartition(' | ')
+        experiences.append({
+            'id': f"exp-{len(experiences) + 1}",
+            'title': title,
+            'company': company,
+            'location': location,
+            'startDate': _normalize_date(dates.group('start')) if dates else '',
+            'endDate': _normalize_date(dates.group('end')) if dates else '',
+            'description': description,
+            'skills': [],
+        })
+    return experiences
+
+
+def _parse_education(lines: List[str]) -> List[Dict[str, Any]]:
+    education = []
+    for entry in _split_entries(lines):
+        text = ' '.join(line.strip() for line in entry)
+        if not text:
+            continue
+        dates = DATE_RANGE_PATTERN.search(text)
+        school = next((line.strip() for line in entry if SCHOOL_PATTERN.search(line)), entry[0].strip())
+        degree_line = next((line.strip() for line in entry if DEGREE_PATTERN.search(line)), '')
+        degree, field = degree_line, ''
+        if ' in ' in degree_line:
+            degree, field = degree_line.split(' in ', 1)
+        elif ', ' in degree_line:
+            degree, field = degree_line.split(', ', 1)
+        if dates:
+            field = DATE_RANGE_PATTERN.sub('', field)
+            school = DATE_RANGE_PATTERN.sub('', school)
+        gpa = re.search(r'\bGPA:?\s*(\d(?:\.\d+)?)', text, re.IGNORECASE)
+        item = {
+            'id': f"edu-{len(education) + 1}",
+            'school': school.strip(' |,-–()'),
+            'degree': degree.strip(' |,-–()'),
+            'field': field.strip(' |,-–()'),
+            'startDate': _normalize_date(dates.group('start')) if dates else '',
+            'endDate': _normalize_date(dates.group('end')) if dates else '',
+        }
+        if gpa:
+            item['gpa'] = float(gpa.group(1))
+        education.append(item)
+    return education
+
+
+def _parse_skills(lines: List[str]) -> List[Dict[str, Any]]:
+    names: List[str] = []
+    for line in lines:
+        line = BULLET_PATTERN.sub('', line)
+        # "Languages: Python, Go" style category prefixes
+        if ':' in line:
+            line = line.split(':', 1)[1]
+        for name in SKILL_SEPARATORS.split(line):
+            name = name.strip(' .')
+            if name and len(name) <= 40 and name.lower() not in (n.lower() for n in names):
+                names.append(name)
+    return [{'id': f"skill-{i}", 'name': name, 'level': 'Intermediate'} for i, name in enumerate(names, start=1)]
+
+
+def _parse_languages(lines: List[str]) -> List[Dict[str, Any]]:
+    languages = []
+    for line in lines:
+        for part in re.split(r'\s*[,;|•]\s*', BULLET_PATTERN.sub('', line)):
+            match = re.match(r"^(?P<name>[A-Za-z][A-Za-z' -]*?)\s*(?:[(:–-]\s*(?P<level>[^)]*)\)?)?$", part.strip())
+            if not match:
+                continue
+            level = (match.group('level') or '').lower()
+            proficiency = next((value for key, value in LANGUAGE_LEVELS if key in level), 'Professional Working')
+            languages.append({'id': f"lang-{len(languages) + 1}", 'name': match.group('name'), 'proficiency': proficiency})
+    return languages
+
+
+def _parse_publications(lines: List[str]) -> List[Dict[str, Any]]:
+    publications = []
+    for line in lines:
+        title = BULLET_PATTERN.sub('', line).strip()
+        if not title:
+            continue
+        year = re.search(r'\b(19|20)\d{2}\b', title)
+        url = URL_PATTERN.search(title)
+        item = {
+            'id': f"pub-{len(publications) + 1}",
+            'title': title,
+            'publisher': '',
+            'date': year.group(0) if year else '',
+            'authors': [],
+        }
+        if url:
+            item['url'] = url.group(0)
+        publications.append(item)
+    return publications
+
+
+def _parse_contact_info(text: str, header: List[str]) -> Dict[str, Any]:
+    email = EMAIL_PATTERN.search(text)
+    phone = PHONE_PATTERN.search(text)
+    linkedin = LINKEDIN_PATTERN.search(text)
+    website = next((match.group(0) for match in URL_PATTERN.finditer(text) if 'linkedin.com' not in match.group(0).lower()), None)
+
+    location = {'city': '', 'country': ''}
+    for line in header:
+        for part in re.split(r'\s*[|•·]\s*', line.strip()):
+            match = LOCATION_PATTERN.match(part)
+            if match and not EMAIL_PATTERN.search(part):
+                location = {'city': match.group('city').strip(), 'country': (match.group('country') or match.group('region')).strip()}
+                if match.group('country'):
+                    location['state'] = match.group('region').strip()
+                break
+        if location['city']:
+            break
+
+    contact = {
+        'email': email.group(0) if email else '',
+        'phone': phone.group(0).strip() if phone else '',
+        'location': location,
+    }
+    if linkedin:
+        contact['linkedin'] = linkedin.group(0)
+    if website:
+        contact['website'] = website
+    return contact
+
+
+def parse_resume_text(text: str) -> Dict[str, Any]:
+    """Structure resume text into the frontend ``Resume`` shape."""
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    header, sections = _split_sections(lines)
+    return {
+        'contactInfo': _parse_contact_info(text, header[:10]),
+        'experiences': _parse_experiences(sections.get('experiences', [])),
+        'education': _parse_education(sections.get('education', [])),
+        'publications': _parse_publications(sections.get('publications', [])),
+        'skills': _parse_skills(sections.get('skills', [])),
+        'languages': _parse_languages(sections.get('languages', [])),
+    }
+
+
+def extract_resume(path: str) -> Dict[str, Any]:
+    """Extract text and structured resume JSON from a file (runs in a worker process)."""
+    text = extract_text(path)
+    return {'text': text, 'resume': parse_resume_text(text)}
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_extraction_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _pool
+
+
+def shutdown_extraction_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def extract_resume_async(path: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """Run ``extract_resume`` in the process pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_extraction_pool(max_workers), extract_resume, path)
+
+
+def save_extraction(db: Session, resume_id: int, result: Dict[str, Any]) -> ResumeExtraction:
+    """Store (or replace) the extraction of a resume. The caller commits."""
+    extraction = db.get(ResumeExtraction, resume_id)
+    if extraction is None:
+        extraction = ResumeExtraction(resume_id=resume_id, text='', structured='{}')
+    extraction.text = result['text']
+    extraction.structured = json.dumps(result['resume'])
+    extraction.extracted_at = datetime.utcnow()
+    db.add(extraction)
+    return extraction
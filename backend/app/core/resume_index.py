@@ -0,0 +1,223 @@
+"""Bulk ATS ranking of stored resumes against one job description.
+
+Every stored resume is vectorized once into the index's own vocabulary
+(so IDF reflects the resume pool) and the vectors are packed into a CSR
+style term matrix: ``indices`` holds the term ids of all resumes back to
+back and ``indptr`` marks where each resume starts. Ranking a job builds
+a dense weight vector over the vocabulary and computes every resume's
+covered weight with one gather plus a cumulative sum over ``indices``,
+i.e. a sparse matrix-vector product that is linear in the total number of
+stored terms. Large matrices are split by rows across a thread pool;
+NumPy releases the GIL inside these kernels so the chunks run on all
+cores. The index is refreshed incrementally from the database before each
+ranking or scoring: an aggregate over the resume and extraction tables tells whether
+anything changed at all, and only resumes whose role or extraction changed
+have their text read and are re-vectorized. Single resume/job scores
+(``ResumeIndex.score``) use the same vocabulary, so their IDF is fitted
+on the stored resumes too.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.core.ats import ATSResult, ATSScorer, TermVector, Vocabulary
+from app.core.config import settings
+from app.db.models import Resume, ResumeExtraction
+
+# Below this many stored terms a single thread beats the pool overhead
+PARALLEL_MIN_TERMS = 200_000
+# Extraction texts read per query when refreshing
+TEXT_BATCH_SIZE = 500
+
+# What a resume's indexed text depends on: its role and when it was extracted
+Version = Tuple[Optional[str], Optional[datetime]]
+
+
+def indexed_text(role: Optional[str], text: Optional[str] = None) -> str:
+    """Text of a stored resume that the ranking index scores."""
+    if text is not None:
+        return f"{role or ''}\n{text}"
+    return role or ''
+
+
+@dataclass
+class ResumeMatrix:
+    """CSR layout of the indexed resumes' term ids."""
+    resume_ids: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    @classmethod
+    def build(cls, vectors: Dict[int, TermVector]) -> "ResumeMatrix":
+        resume_ids = np.fromiter(sorted(vectors), dtype=np.int64, count=len(vectors))
+        lengths = np.fromiter((len(vectors[rid].ids) for rid in resume_ids), dtype=np.int64, count=len(resume_ids))
+        indptr = np.zeros(len(resume_ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        if len(resume_ids):
+            indices = np.concatenate([vectors[rid].ids for rid in resume_ids])
+        else:
+            indices = np.zeros(0, dtype=np.int64)
+        return cls(resume_ids=resume_ids, indptr=indptr, indices=indices)
+
+    def row(self, position: int) -> np.ndarray:
+        return self.indices[self.indptr[position]:self.indptr[position + 1]]
+
+    def _dot_rows(self, weights: np.ndarray, start: int, stop: int) -> np.ndarray:
+        begin, end = self.indptr[start], self.indptr[stop]
+        running = np.zeros(end - begin + 1, dtype=np.float64)
+        np.cumsum(weights[self.indices[begin:end]], out=running[1:])
+        offsets = self.indptr[start:stop + 1] - begin
+        return running[offsets[1:]] - running[offsets[:-1]]
+
+    def dot(self, weights: np.ndarray, executor: Optional[ThreadPoolExecutor] = None, chunks: int = 1) -> np.ndarray:
+        """Sum of ``weights`` over each resume's terms (the matrix-vector product)."""
+        rows = len(self.resume_ids)
+        if executor is None or chunks <= 1 or len(self.indices) < PARALLEL_MIN_TERMS:
+            return self._dot_rows(weights, 0, rows)
+        bounds = np.linspace(0, rows, chunks + 1, dtype=np.int64)
+        parts = executor.map(lambda i: self._dot_rows(weights, bounds[i], bounds[i + 1]), range(chunks))
+        return np.concatenate(list(parts))
+
+
+@dataclass
+class RankedResume:
+    resume_id: int
+    score: float
+    matched_keywords: List[str]
+
+
+class ResumeIndex:
+    """Incrementally maintained term matrix of all stored resumes."""
+
+    def __init__(self, max_workers: Optional[int] = None, max_keywords: int = 10):
+        self.scorer = ATSScorer(Vocabulary(), max_keywords=max_keywords)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers) if self.max_workers > 1 else None
+        self._vectors: Dict[int, TermVector] = {}
+        self._versions: Dict[int, Version] = {}
+        self._marker: Optional[Tuple] = None
+        self._matrix: Optional[ResumeMatrix] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def _put(self, resume_id: int, version: Version, text: str) -> None:
+        self._drop(resume_id)
+        vector = self.scorer.vectorize(text)
+        self.scorer.vocabulary.update_document_frequencies(vector.ids, 1)
+        self._vectors[resume_id] = vector
+        self._versions[resume_id] = version
+
+    def _drop(self, resume_id: int) -> None:
+        vector = self._vectors.pop(resume_id, None)
+        if vector is not None:
+            self.scorer.vocabulary.update_document_frequencies(vector.ids, -1)
+            del self._versions[resume_id]
+
+    @staticmethod
+    def marker(db: Session) -> Tuple:
+        """Cheap summary of the indexed tables that changes whenever a resume is
+        added, deleted or (re-)extracted. Roles are set on upload only."""
+        resumes = db.exec(select(func.count(Resume.id), func.max(Resume.id))).one()
+        extractions = db.exec(
+            select(func.count(ResumeExtraction.resume_id), func.max(ResumeExtraction.extracted_at))
+        ).one()
+        return tuple(resumes) + tuple(extractions)
+
+    def refresh(self, db: Session) -> None:
+        """Bring the index in line with the ``resume`` table."""
+        with self._lock:
+            marker = self.marker(db)
+            if marker == self._marker and self._matrix is not None:
+                return
+
+            # Versions only; texts are read below for the resumes that changed
+            versions: Dict[int, Version] = {
+                resume_id: (role, extracted_at)
+                for resume_id, role, extracted_at in db.exec(
+                    select(Resume.id, Resume.role, ResumeExtraction.extracted_at)
+                    .join(ResumeExtraction, ResumeExtraction.resume_id == Resume.id, isouter=True)
+                )
+            }
+            stale = [resume_id for resume_id, version in versions.items() if self._versions.get(resume_id) != version]
+            removed = set(self._vectors) - set(versions)
+            for resume_id in removed:
+                self._drop(resume_id)
+            for start in range(0, len(stale), TEXT_BATCH_SIZE):
+                batch = stale[start:start + TEXT_BATCH_SIZE]
+                texts = dict(db.exec(
+                    select(ResumeExtraction.resume_id, ResumeExtraction.text)
+                    .where(ResumeExtraction.resume_id.in_(batch))
+                ).all())
+                for resume_id in batch:
+                    role, _ = versions[resume_id]
+                    self._put(resume_id, versions[resume_id], indexed_text(role, texts.get(resume_id)))
+            if stale or removed or self._matrix is None:
+                self._matrix = ResumeMatrix.build(self._vectors)
+            self._marker = marker
+
+    def _job_weights(self, job_text: str) -> Tuple[TermVector, np.ndarray, float]:
+        """Job vector over known terms, the dense weight vector and the total job weight."""
+        job, unseen = self.scorer.vectorize_job(job_text)
+        job_weights = self.scorer.job_weights(job)
+        dense = np.zeros(len(self.scorer.vocabulary), dtype=np.float64)
+        dense[job.ids] = job_weights
+        # Terms no indexed resume contains still count towards the total
+        return job, dense, float(job_weights.sum()) + float(self.scorer.unseen_weights(unseen).sum())
+
+    def score(self, resume_text: str, job_text: str, max_keywords: int = 20) -> ATSResult:
+        """Score one resume text against a job, with IDF fitted on the indexed resumes."""
+        scorer = ATSScorer(self.scorer.vocabulary, max_keywords=max_keywords)
+        with self._lock:
+            return scorer.score(resume_text, job_text)
+
+    def rank(self, job_text: str, offset: int = 0, limit: int = 50) -> Tuple[int, List[RankedResume]]:
+        """Return the total number of indexed resumes and one page of the best matches."""
+        with self._lock:
+            matrix = self._matrix
+            if matrix is None or not len(matrix.resume_ids):
+                return 0, []
+            job, dense, total = self._job_weights(job_text)
+            if total <= 0:
+                scores = np.zeros(len(matrix.resume_ids))
+            else:
+                scores = 100.0 * matrix.dot(dense, self._executor, self.max_workers) / total
+
+            count = len(scores)
+            top = min(offset + limit, count)
+            if offset >= top:
+                return count, []
+            # Only the first offset + limit entries need ordering; ties go to the lower id
+            if top < count:
+                cutoff = -np.partition(-scores, top - 1)[top - 1]
+                candidates = np.flatnonzero(scores >= cutoff)
+            else:
+                candidates = np.arange(count)
+            candidates = candidates[np.lexsort((matrix.resume_ids[candidates], -scores[candidates]))]
+
+            terms = self.scorer.vocabulary.terms
+            by_weight = job.ids[np.argsort(-dense[job.ids], kind='stable')]
+            page = []
+            for position in candidates[offset:top]:
+                present = np.isin(by_weight, matrix.row(position), assume_unique=True)
+                page.append(RankedResume(
+                    resume_id=int(matrix.resume_ids[position]),
+                    score=round(float(scores[position]), 2),
+                    matched_keywords=[terms[term_id] for term_id in by_weight[present][:self.scorer.max_keywords]]
+                ))
+            return count, page
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+resume_index = ResumeIndex(max_workers=settings.ats_rank_workers)
@@ -0,0 +1,317 @@
+"""ATS-friendly PDF rendering of structured resume JSON.
+
+``render_resume_pdf`` lays out a resume in the frontend's ``Resume`` shape
+(contactInfo, experiences, education, skills, publications, languages,
+plus an optional ``name`` and ``summary``) with reportlab. The layout is
+what applicant tracking systems parse reliably: one column, real text in
+reading order, plain section headings, no tables, images or text boxes,
+and document metadata set.
+
+Fonts and paragraph styles are built once per process and reused by
+every render, and so are the flowables of each section (of each entry,
+for experience, education and publications): they are cached by a hash
+of their content together with the line breaks computed for them, so
+regenerating after an edit only lays out what changed before the document
+is paginated. Standard Helvetica is used unless TTF files are configured
+(``RESUME_PDF_FONT_PATH`` / ``RESUME_PDF_BOLD_FONT_PATH``), which are
+embedded and cover non-Latin scripts.
+
+Rendering is CPU-bound, so request handlers use ``render_resume_pdf_async``.
+The section cache lives in the process that renders, so interactive
+renders (edit, regenerate) all go to one dedicated render process per app
+worker, whose cache sees every edit made through that worker. Batch
+renders, where parallelism matters more than a warm cache, spread over the
+extraction process pool. With several app workers, successive edits only
+hit a warm cache when they reach the same worker.
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import copy
+from functools import lru_cache
+from io import BytesIO
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+from xml.sax.saxutils import escape
+
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Flowable, Paragraph, SimpleDocTemplate, Spacer
+
+from app.core.cache import LRUCache, stable_hash
+from app.core.config import settings
+from app.core.resume_extraction import get_extraction_pool
+
+# Bump the version whenever the output changes, so cached renders are redone
+TEMPLATE_ID = "ats-classic"
+TEMPLATE_VERSION = 2
+
+PAGE_MARGIN = 0.7 * inch
+
+SECTION_TITLES = (
+    ('summary', 'Summary'),
+    ('experiences', 'Experience'),
+    ('education', 'Education'),
+    ('skills', 'Skills'),
+    ('publications', 'Publications'),
+    ('languages', 'Languages'),
+)
+
+
+@lru_cache(maxsize=1)
+def fonts() -> Tuple[str, str]:
+    """Register the configured TTF fonts once; returns (regular, bold) font names."""
+    if settings.resume_pdf_font_path:
+        pdfmetrics.registerFont(TTFont("ResumeSans", settings.resume_pdf_font_path))
+        bold_path = settings.resume_pdf_bold_font_path or settings.resume_pdf_font_path
+        pdfmetrics.registerFont(TTFont("ResumeSans-Bold", bold_path))
+        pdfmetrics.registerFontFamily("ResumeSans", normal="ResumeSans", bold="ResumeSans-Bold",
+                                      italic="ResumeSans", boldItalic="ResumeSans-Bold")
+        return "ResumeSans", "ResumeSans-Bold"
+    return "Helvetica", "Helvetica-Bold"
+
+
+@lru_cache(maxsize=1)
+def styles() -> Dict[str, ParagraphStyle]:
+    """Paragraph styles, built once per process."""
+    regular, bold = fonts()
+    body = ParagraphStyle('Body', fontName=regular, fontSize=10, leading=13)
+    return {
+        'name': ParagraphStyle('Name', parent=body, fontName=bold, fontSize=20, leading=24, alignment=TA_CENTER),
+        'contact': ParagraphStyle('Contact', parent=body, fontSize=9.5, leading=12, alignment=TA_CENTER,
+                                  spaceAfter=6),
+        # Headings and entry titles never end a page
+        'heading': ParagraphStyle('Heading', parent=body, fontName=bold, fontSize=12, leading=15,
+                                  spaceBefore=10, spaceAfter=3, keepWithNext=1),
+        'entry': ParagraphStyle('Entry', parent=body, fontName=bold, spaceBefore=4, keepWithNext=1),
+        'meta': ParagraphStyle('Meta', parent=body, fontSize=9.5, leading=12),
+        'body': body,
+        'bullet': ParagraphStyle('Bullet', parent=body, leftIndent=24, bulletIndent=12, bulletFontName=regular,
+                                 bulletFontSize=8),
+    }
+
+
+def _text(value: Any) -> str:
+    """Escape a JSON value for a reportlab paragraph."""
+    return escape(str(value).strip()) if value not in (None, '') else ''
+
+
+def _join(parts: List[Any], separator: str = ' | ') -> str:
+    """Join the non-empty parts (unescaped)."""
+    return separator.join(str(part).strip() for part in parts if part not in (None, '') and str(part).strip())
+
+
+def _dates(entry: Dict[str, Any]) -> str:
+    return _join([entry.get('startDate'), entry.get('endDate')], ' – ')
+
+
+class _Paragraph(Paragraph):
+    """Paragraph that keeps its line breaks for every width it has been wrapped at.
+
+    Copies share them, so a cached paragraph is only broken into lines
+    once per width however many documents it is laid out in.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._line_breaks: Dict[Any, Any] = {}
+
+    def breakLines(self, width):
+        key = tuple(width) if isinstance(width, (list, tuple)) else width
+        lines = self._line_breaks.get(key)
+        if lines is None:
+            lines = self._line_breaks[key] = super().breakLines(width)
+        return lines
+
+
+def _bullets(lines: List[Any]) -> List[Flowable]:
+    return [_Paragraph(_text(line), styles()['bullet'], bulletText='•') for line in lines if _text(line)]
+
+
+def _contact_line(contact: Dict[str, Any]) -> str:
+    location = contact.get('location') or {}
+    place = _join([location.get('city'), location.get('state'), location.get('country')], ', ')
+    return _join([contact.get('email'), contact.get('phone'), place, contact.get('linkedin'), contact.get('website')])
+
+
+def header_flowables(resume: Dict[str, Any]) -> List[Flowable]:
+    contact = resume.get('contactInfo') or {}
+    flowables: List[Flowable] = []
+    name = resume.get('name') or contact.get('name')
+    if name:
+        flowables.append(_Paragraph(_text(name), styles()['name']))
+    line = _contact_line(contact)
+    if line:
+        flowables.append(_Paragraph(_text(line), styles()['contact']))
+    return flowables
+
+
+def _summary(summary: Any) -> List[Flowable]:
+    summary = _text(summary)
+    return [_Paragraph(summary, styles()['body'])] if summary else []
+
+
+def _experience(experience: Dict[str, Any]) -> List[Flowable]:
+    entry = [_Paragraph(_text(_join([experience.get('title'), experience.get('company')], ' – ')),
+                        styles()['entry'])]
+    meta = _join([experience.get('location'), _dates(experience)])
+    if meta:
+        entry.append(_Paragraph(_text(meta), styles()['meta']))
+    entry.extend(_bullets(experience.get('description') or []))
+    skills = _join(experience.get('skills') or [], ', ')
+    if skills:
+        entry.append(_Paragraph(_text(f"Skills: {skills}"), styles()['meta']))
+    return entry
+
+
+def _education(education: Dict[str, Any]) -> List[Flowable]:
+    degree = _join([education.get('degree'), education.get('field')], ', ')
+    entry = [_Paragraph(_text(_join([degree, education.get('school')], ' – ')), styles()['entry'])]
+    gpa = f"GPA {education['gpa']}" if education.get('gpa') else None
+    meta = _join([_dates(education), gpa])
+    if meta:
+        entry.append(_Paragraph(_text(meta), styles()['meta']))
+    entry.extend(_bullets(education.get('activities') or []))
+    return entry
+
+
+def _skills(skills: Any) -> List[Flowable]:
+    names = [skill.get('name') if isinstance(skill, dict) else skill for skill in skills or []]
+    line = _join(names, ', ')
+    return [_Paragraph(_text(line), styles()['body'])] if line else []
+
+
+def _publication(publication: Dict[str, Any]) -> List[Flowable]:
+    entry = [_Paragraph(_text(publication.get('title')), styles()['entry'])]
+    meta = _join([_join(publication.get('authors') or [], ', '), publication.get('publisher'),
+                  publication.get('date'), publication.get('url')])
+    if meta:
+        entry.append(_Paragraph(_text(meta), styles()['meta']))
+    if publication.get('description'):
+        entry.append(_Paragraph(_text(publication['description']), styles()['body']))
+    return entry
+
+
+def _languages(languages: Any) -> List[Flowable]:
+    languages = [
+        f"{_text(language.get('name'))} ({_text(language['proficiency'])})" if language.get('proficiency')
+        else _text(language.get('name'))
+        for language in languages or [] if language.get('name')
+    ]
+    return [_Paragraph(', '.join(languages), styles()['body'])] if languages else []
+
+
+# Sections laid out as a whole, from the section's value
+SECTION_BUILDERS = {
+    'summary': _summary,
+    'skills': _skills,
+    'languages': _languages,
+}
+
+# List sections laid out entry by entry, so editing one entry leaves the others cached
+ENTRY_BUILDERS = {
+    'experiences': _experience,
+    'education': _education,
+    'publications': _publication,
+}
+
+# Flowables by (part, content hash), per process
+_section_cache = LRUCache(max_entries=settings.resume_pdf_section_cache_entries)
+
+
+def _cached(part: str, content: Any, build: Callable[[Any], List[Flowable]]) -> List[Flowable]:
+    """``build(content)``, built again only when the content changes."""
+    key = (part, stable_hash(content))
+    flowables = _section_cache.get(key)
+    if flowables is None:
+        flowables = tuple(build(content))
+        _section_cache.set(key, flowables)
+    # Building a document sets attributes on its flowables, so every document gets copies
+    return [copy.copy(flowable) for flowable in flowables]
+
+
+def _heading(section: str) -> List[Flowable]:
+    return [_Paragraph(dict(SECTION_TITLES)[section].upper(), styles()['heading'])]
+
+
+def section_flowables(resume: Dict[str, Any], section: str) -> List[Flowable]:
+    """Heading and content of one section, or nothing if the section is empty."""
+    if section in ENTRY_BUILDERS:
+        content = [
+            flowable
+            for entry in resume.get(section) or []
+            for flowable in _cached(section, entry, ENTRY_BUILDERS[section])
+        ]
+    else:
+        content = _cached(section, resume.get(section), SECTION_BUILDERS[section])
+    if not content:
+        return []
+    return _cached('heading', section, _heading) + content
+
+
+def build_story(resume: Dict[str, Any]) -> List[Flowable]:
+    header = {'name': resume.get('name'), 'contactInfo': resume.get('contactInfo')}
+    story = _cached('header', header, header_flowables)
+    for section, _title in SECTION_TITLES:
+        story.extend(section_flowables(resume, section))
+    return story or [Spacer(1, 1)]
+
+
+def render_resume_pdf(resume: Dict[str, Any], output: Union[str, BinaryIO]) -> None:
+    """Render a resume to a path or binary file object."""
+    contact = resume.get('contactInfo') or {}
+    name = resume.get('name') or contact.get('name') or ''
+    document = SimpleDocTemplate(
+        output,
+        pagesize=letter,
+        leftMargin=PAGE_MARGIN,
+        rightMargin=PAGE_MARGIN,
+        topMargin=PAGE_MARGIN,
+        bottomMargin=PAGE_MARGIN,
+        title=f"{name} Resume".strip(),
+        author=name,
+        subject="Resume",
+        creator=f"{TEMPLATE_ID} v{TEMPLATE_VERSION}"
+    )
+    document.build(build_story(resume))
+
+
+def render_resume_pdf_bytes(resume: Dict[str, Any]) -> bytes:
+    buffer = BytesIO()
+    render_resume_pdf(resume, buffer)
+    return buffer.getvalue()
+
+
+_render_process: Optional[ProcessPoolExecutor] = None
+
+
+def get_render_process() -> ProcessPoolExecutor:
+    """The single process that runs interactive renders, keeping its section cache warm."""
+    global _render_process
+    if _render_process is None:
+        _render_process = ProcessPoolExecutor(max_workers=1)
+    return _render_process
+
+
+def shutdown_render_process() -> None:
+    global _render_process
+    if _render_process is not None:
+        _render_process.shutdown(wait=False, cancel_futures=True)
+        _render_process = None
+
+
+async def render_resume_pdf_async(
+    resume: Dict[str, Any],
+    max_workers: Optional[int] = None,
+    pooled: bool = False
+) -> bytes:
+    """Run ``render_resume_pdf_bytes`` without blocking the event loop.
+
+    Renders go to the render process, or to the extraction process pool
+    when ``pooled`` (batches).
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_extraction_pool(max_workers) if pooled else get_render_process()
+    return await loop.run_in_executor(executor, render_resume_pdf_bytes, resume)
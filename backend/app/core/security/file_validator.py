@@ -16,8 +16,35 @@ class FileValidator:
         'text/plain': '.txt'
     }
     
+    # Generic containers libmagic reports when the document markers are past
+    # the sniffed header; trusted only with the matching extension
+    CONTAINER_MIME_TYPES = {
+        'application/zip': {'.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'},
+        'application/x-ole-storage': {'.doc': 'application/msword'},
+        'application/CDFV2': {'.doc': 'application/msword'},
+    }
+
     # Maximum files per request
     MAX_FILES_PER_REQUEST = 5
+
+    @classmethod
+    def detect_mime_type(cls, header: bytes, filename: str = '') -> str:
+        """Detect the MIME type from the first bytes of a file."""
+        mime_type = magic.from_buffer(header, mime=True)
+        extension = os.path.splitext(filename)[1].lower()
+        return cls.CONTAINER_MIME_TYPES.get(mime_type, {}).get(extension, mime_type)
+
+    @classmethod
+    def check_mime_type(cls, header: bytes, filename: str = '', allowed_mime_types=None) -> str:
+        """Return the detected MIME type, raising 415 if it is not allowed."""
+        allowed = allowed_mime_types or cls.ALLOWED_MIME_TYPES
+        mime_type = cls.detect_mime_type(header, filename)
+        if mime_type not in allowed:
+            raise HTTPException(
+                status_code=415,
+                detail=f"File type not allowed. Allowed types: {', '.join(sorted(cls.ALLOWED_MIME_TYPES.get(t, t) for t in allowed))}"
+            )
+        return mime_type
     
     @classmethod
     async def validate_file(cls, file: UploadFile) -> None:
@@ -38,13 +65,7 @@ class FileValidator:
         await file.seek(0)
         
         # Detect MIME type
-        mime_type = magic.from_buffer(header, mime=True)
-        
-        if mime_type not in cls.ALLOWED_MIME_TYPES:
-            raise HTTPException(
-                status_code=415,
-                detail=f"File type not allowed. Allowed types: {', '.join(cls.ALLOWED_MIME_TYPES.values())}"
-            )
+        cls.check_mime_type(header, file.filename or '')
     
     @classmethod
     async def validate_files(cls, files: List[UploadFile]) -> None:
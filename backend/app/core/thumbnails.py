@@ -0,0 +1,138 @@
+"""First-page previews of stored resumes and cover letters.
+
+Page 1 of a PDF is rasterized once (pypdfium2), downscaled to every size
+in ``THUMBNAIL_WIDTHS`` and encoded in every format in
+``THUMBNAIL_FORMATS`` (Pillow), all in a single task on the extraction
+process pool. Results go to a size-bounded ``DiskCache`` keyed by the
+file's content hash, so identical uploads share their previews and list
+views fetch a few kilobytes instead of the whole PDF. Previews are
+rendered ahead of time by the ``thumbnail`` job queued on upload, and on
+demand if a request arrives first or the entry was evicted.
+"""
+import asyncio
+import hashlib
+from io import BytesIO
+import os
+from typing import Dict, Optional
+
+from app.core.blob_store import UPLOAD_DIR, blob_store
+from app.core.cache import DiskCache
+from app.core.config import settings
+from app.core.resume_extraction import get_extraction_pool
+
+THUMBNAIL_WIDTHS = {'small': 160, 'medium': 320, 'large': 640}
+THUMBNAIL_FORMATS = {'webp': 'image/webp', 'png': 'image/png'}
+# Bump when rendering changes so cached previews are redone
+THUMBNAIL_VERSION = 1
+
+
+class ThumbnailError(Exception):
+    """The file cannot be previewed."""
+
+
+def render_thumbnails(path: str) -> Dict[str, bytes]:
+    """Render page 1 of a PDF at every size and format, keyed ``"<size>.<format>"``."""
+    try:
+        import pypdfium2 as pdfium
+        from PIL import Image
+    except ImportError as e:
+        raise ThumbnailError("Previews require the pypdfium2 and Pillow packages") from e
+
+    try:
+        pdf = pdfium.PdfDocument(path)
+    except pdfium.PdfiumError as e:
+        raise ThumbnailError(f"Could not open PDF: {e}") from e
+    try:
+        if len(pdf) == 0:
+            raise ThumbnailError("PDF has no pages")
+        page = pdf[0]
+        # Render once at the largest size and downscale from there
+        scale = max(THUMBNAIL_WIDTHS.values()) / page.get_width()
+        image = page.render(scale=scale).to_pil().convert('RGB')
+    finally:
+        pdf.close()
+
+    rendered = {}
+    for size, width in THUMBNAIL_WIDTHS.items():
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for image_format in THUMBNAIL_FORMATS:
+            buffer = BytesIO()
+            if image_format == 'webp':
+                resized.save(buffer, format='WEBP', quality=80, method=4)
+            else:
+                resized.save(buffer, format='PNG', optimize=True)
+            rendered[f"{size}.{image_format}"] = buffer.getvalue()
+    return rendered
+
+
+def can_preview(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() == '.pdf'
+
+
+class ThumbnailRenderer:
+    """Render previews once per file hash and keep them in a disk cache."""
+
+    def __init__(self, cache: DiskCache, max_workers: Optional[int] = None):
+        self.cache = cache
+        self.max_workers = max_workers
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def cache_key(self, path: str) -> str:
+        sha256 = blob_store.sha256_for_path(path)
+        if sha256 is None:
+            # Files stored before content addressing: key on path and version of the file
+            stat_result = os.stat(path)
+            identity = f"{os.path.abspath(path)}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+            sha256 = hashlib.sha256(identity.encode('utf-8')).hexdigest()
+        return f"{sha256}-v{THUMBNAIL_VERSION}"
+
+    def _name(self, key: str, size: str, image_format: str) -> str:
+        return f"{key}-{size}.{image_format}"
+
+    async def render(self, path: str, key: Optional[str] = None) -> str:
+        """Make sure every preview of ``path`` is cached; returns the cache key."""
+        if not can_preview(path):
+            raise ThumbnailError("Previews are only available for PDF files")
+        key = key or self.cache_key(path)
+        if all(os.path.exists(self.cache.path(self._name(key, size, image_format)))
+               for size in THUMBNAIL_WIDTHS for image_format in THUMBNAIL_FORMATS):
+            return key
+
+        # Concurrent requests for the same file share one render, which runs
+        # as its own task (storing included) so no caller can cancel it
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render(path, key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._in_flight.pop(key, None))
+        await asyncio.shield(task)
+        return key
+
+    async def _render(self, path: str, key: str) -> None:
+        loop = asyncio.get_running_loop()
+        rendered = await loop.run_in_executor(get_extraction_pool(self.max_workers), render_thumbnails, path)
+        for name, data in rendered.items():
+            self.cache.put(f"{key}-{name}", data)
+        print(f"Rendered previews for {os.path.basename(path)} ({key[:12]})")
+
+    async def get(self, path: str, size: str, image_format: str) -> str:
+        """Path of the cached preview, rendering it first if needed."""
+        if not can_preview(path):
+            raise ThumbnailError("Previews are only available for PDF files")
+        key = self.cache_key(path)
+        name = self._name(key, size, image_format)
+        cached = self.cache.get(name)
+        if cached is not None:
+            return cached
+        await self.render(path, key)
+        return self.cache.path(name)
+
+    def stats(self) -> Dict[str, object]:
+        return self.cache.stats()
+
+
+thumbnail_renderer = ThumbnailRenderer(
+    DiskCache(os.path.join(UPLOAD_DIR, "thumbnails"), max_bytes=settings.thumbnail_cache_max_mb * 1024 * 1024),
+    max_workers=settings.resume_extraction_workers
+)
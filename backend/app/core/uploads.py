@@ -0,0 +1,79 @@
+"""Streaming storage of uploaded files.
+
+``save_upload`` copies an ``UploadFile`` to disk chunk by chunk: the MIME
+type is sniffed from the first chunk with ``FileValidator``, the size
+limit is enforced as bytes arrive, and the SHA-256 is computed in the
+same pass. Disk writes run in the threadpool so the event loop is never
+blocked, and only one chunk is held in memory at a time. The file is
+written under a temporary name and renamed into place once complete, so
+a rejected or interrupted upload never leaves a partial file behind.
+"""
+from dataclasses import dataclass
+import hashlib
+import os
+from typing import Iterable, Optional
+import uuid
+
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from app.core.security.file_validator import FileValidator
+
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class StoredUpload:
+    path: Optional[str]
+    size: int
+    sha256: str
+    mime_type: str
+    # False when identical bytes were already stored and nothing was written
+    created: bool = False
+
+
+async def save_upload(
+    file: UploadFile,
+    path: Optional[str],
+    max_size: int = FileValidator.MAX_FILE_SIZE,
+    allowed_mime_types: Optional[Iterable[str]] = None,
+    chunk_size: int = CHUNK_SIZE
+) -> StoredUpload:
+    """Validate and write an upload to ``path`` in a single streaming pass.
+
+    With ``path=None`` the upload is only validated and hashed.
+    """
+    allowed = set(allowed_mime_types) if allowed_mime_types else None
+    # Unique per call, so concurrent uploads of the same target never share a temp file
+    temp_path = f"{path}.{uuid.uuid4().hex}.part" if path else None
+    digest = hashlib.sha256()
+    size = 0
+    mime_type = None
+
+    out = await run_in_threadpool(open, temp_path, "wb") if temp_path else None
+    try:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            if mime_type is None:
+                mime_type = FileValidator.check_mime_type(chunk, file.filename or '', allowed)
+            size += len(chunk)
+            if size > max_size:
+                raise HTTPException(status_code=413, detail=f"File too large (max {max_size // (1024 * 1024)}MB)")
+            digest.update(chunk)
+            if out:
+                await run_in_threadpool(out.write, chunk)
+        if mime_type is None:
+            raise HTTPException(status_code=400, detail="Empty file")
+        if out:
+            await run_in_threadpool(out.close)
+            await run_in_threadpool(os.replace, temp_path, path)
+    except BaseException:
+        if out:
+            out.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+
+    return StoredUpload(path=path, size=size, sha256=digest.hexdigest(), mime_type=mime_type, created=path is not None)
@@ -0,0 +1,153 @@
+"""Check that the hot queries are planned as index scans.
+
+Migrates a scratch SQLite database (or the one given with
+``--database-url``), runs EXPLAIN on each query below and fails if a plan
+does not use the expected index, or sorts when the index order should do:
+
+    python -m app.db.check_query_plans [--database-url postgresql://...]
+
+On Postgres, sequential scans are disabled for the check so that the
+planner's choice on a small table does not hide a missing index.
+"""
+import argparse
+from datetime import datetime
+import os
+import sys
+import tempfile
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import create_engine, func, text, tuple_
+from sqlalchemy.engine import Connection
+from sqlmodel import select
+
+from app.db.migrate import upgrade_database
+from app.db.models import ChatMessage, ChatSession, CoverLetter, Job, Resume, ResumeExtraction
+
+
+class HotQuery(NamedTuple):
+    name: str
+    statement: object
+    index: str
+    # The index must also provide the ORDER BY
+    ordered: bool = False
+
+
+HOT_QUERIES = [
+    HotQuery(
+        "latest resume",
+        select(Resume).order_by(Resume.uploaded_at.desc()).limit(1),
+        "ix_resume_uploaded_at",
+        ordered=True
+    ),
+    HotQuery(
+        "ranking index staleness marker",
+        select(func.count(ResumeExtraction.resume_id), func.max(ResumeExtraction.extracted_at)),
+        "ix_resumeextraction_extracted_at"
+    ),
+    HotQuery(
+        "chat messages of a session",
+        select(ChatMessage).where(ChatMessage.session_id == 1)
+        .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc()).limit(50),
+        "ix_chatmessage_session_id_created_at",
+        ordered=True
+    ),
+    HotQuery(
+        "older chat messages (keyset page)",
+        select(ChatMessage).where(
+            ChatMessage.session_id == 1,
+            tuple_(ChatMessage.created_at, ChatMessage.id) < tuple_(datetime(2024, 1, 1), 100)
+        ).order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc()).limit(51),
+        "ix_chatmessage_session_id_created_at",
+        ordered=True
+    ),
+    HotQuery(
+        "latest chat sessions of a resume",
+        select(ChatSession).where(ChatSession.resume_id == 1)
+        .order_by(ChatSession.created_at.desc(), ChatSession.id.desc()).limit(21),
+        "ix_chatsession_resume_id_created_at",
+        ordered=True
+    ),
+    HotQuery(
+        "earlier chat sessions (keyset page)",
+        select(ChatSession).where(
+            ChatSession.resume_id == 1,
+            tuple_(ChatSession.created_at, ChatSession.id) < tuple_(datetime(2024, 1, 1), 100)
+        ).order_by(ChatSession.created_at.desc(), ChatSession.id.desc()).limit(21),
+        "ix_chatsession_resume_id_created_at",
+        ordered=True
+    ),
+    HotQuery(
+        "cover letter of a resume",
+        select(CoverLetter).where(CoverLetter.resume_id == 1),
+        "ix_coverletter_resume_id"
+    ),
+    HotQuery(
+        "resumes sharing a blob",
+        select(func.count()).select_from(Resume).where(Resume.file_path == "/blobs/ab/abc/original.pdf"),
+        "ix_resume_file_path"
+    ),
+    HotQuery(
+        "cover letters sharing a blob",
+        select(func.count()).select_from(CoverLetter).where(CoverLetter.file_path == "/blobs/ab/abc/original.pdf"),
+        "ix_coverletter_file_path"
+    ),
+    HotQuery(
+        "due jobs",
+        select(Job.id).where(Job.status == "queued", Job.run_after <= func.current_timestamp())
+        .order_by(Job.run_after, Job.id).limit(5),
+        "ix_job_status_run_after"
+    ),
+    HotQuery(
+        "jobs of a resume",
+        select(Job.status).where(Job.resume_id == 1),
+        "ix_job_resume_id"
+    ),
+]
+
+
+def explain(connection: Connection, statement) -> List[str]:
+    sql = str(statement.compile(connection, compile_kwargs={"literal_binds": True}))
+    if connection.dialect.name == 'sqlite':
+        return [row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    return [row[0] for row in connection.execute(text(f"EXPLAIN {sql}"))]
+
+
+def check_plan(connection: Connection, query: HotQuery) -> Optional[str]:
+    """None if the plan is as expected, else the reason it is not."""
+    plan = explain(connection, query.statement)
+    plan_text = "\n".join(plan)
+    if query.index not in plan_text:
+        return f"does not use {query.index}:\n  " + "\n  ".join(plan)
+    sorts = "TEMP B-TREE FOR ORDER BY" in plan_text or any(line.lstrip(" ->").startswith("Sort") for line in plan)
+    if query.ordered and sorts:
+        return f"sorts instead of reading {query.index} in order:\n  " + "\n  ".join(plan)
+    return None
+
+
+def check_query_plans(database_url: str) -> bool:
+    engine = create_engine(database_url)
+    upgrade_database(engine)
+    ok = True
+    with engine.connect() as connection:
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text("SET enable_seqscan = off"))
+        for query in HOT_QUERIES:
+            problem = check_plan(connection, query)
+            print(f"{'FAIL' if problem else 'ok  '} {query.name}" + (f": {problem}" if problem else ""))
+            ok = ok and problem is None
+    engine.dispose()
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="database to check (default: a scratch SQLite file)")
+    args = parser.parse_args()
+    if args.database_url:
+        return 0 if check_query_plans(args.database_url) else 1
+    with tempfile.TemporaryDirectory() as directory:
+        return 0 if check_query_plans(f"sqlite:///{os.path.join(directory, 'plans.db')}") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Apply the Alembic migrations in ``migrations/`` to the app database.
+
+Runs on startup from ``init_db`` and can be run by hand:
+
+    python -m app.db.migrate
+
+Databases created by ``create_all`` before migrations existed are stamped
+with the baseline revision first, but only if their tables and columns are
+exactly the baseline's; anything else is refused rather than guessed at. Every gunicorn worker calls this at
+startup, so the upgrade holds a lock: a Postgres advisory lock, or a file
+lock for SQLite (whose workers all share one host).
+"""
+from contextlib import contextmanager
+import fcntl
+from pathlib import Path
+import tempfile
+from typing import List
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+BASELINE_REVISION = "0001"
+# Tables and columns created by revision 0001 (the schema before migrations)
+BASELINE_SCHEMA = {
+    'user': {'id', 'email', 'first_name', 'last_name', 'password_hash', 'avatar_url', 'created_at', 'updated_at',
+             'subscription_plan', 'subscription_status', 'resumes_used', 'resumes_limit', 'email_notifications',
+             'job_alerts', 'weekly_reports'},
+    'resume': {'id', 'user_id', 'name', 'email', 'role', 'file_path', 'uploaded_at', 'ats_score', 'status'},
+    'coverletter': {'id', 'resume_id', 'file_path', 'uploaded_at'},
+    'chatsession': {'id', 'resume_id', 'created_at', 'last_message_at', 'is_active'},
+    'chatmessage': {'id', 'session_id', 'content', 'role', 'created_at'},
+}
+MIGRATION_LOCK_KEY = 7_241_305_118
+
+
+def alembic_config(connection: Connection = None) -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    config.attributes['connection'] = connection
+    return config
+
+
+@contextmanager
+def _migration_lock(connection: Connection):
+    if connection.dialect.name == 'postgresql':
+        # Released when the surrounding transaction ends
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        yield
+        return
+    with open(Path(tempfile.gettempdir()) / "app-db-migrations.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def baseline_mismatches(connection: Connection) -> List[str]:
+    """How the live schema differs from the baseline revision (empty if it matches)."""
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    mismatches = []
+    for table, expected in BASELINE_SCHEMA.items():
+        if table not in tables:
+            mismatches.append(f"missing table {table}")
+            continue
+        columns = {column['name'] for column in inspector.get_columns(table)}
+        if columns != expected:
+            mismatches.append(f"{table} columns differ (missing {sorted(expected - columns)}, "
+                              f"unexpected {sorted(columns - expected)})")
+    return mismatches
+
+
+def upgrade_database(engine: Engine, revision: str = "head") -> None:
+    """Upgrade to ``revision``; raises if the database cannot be brought under migration safely."""
+    with engine.begin() as connection, _migration_lock(connection):
+        config = alembic_config(connection)
+        tables = set(inspect(connection).get_table_names())
+        if tables & set(BASELINE_SCHEMA) and 'alembic_version' not in tables:
+            mismatches = baseline_mismatches(connection)
+            if mismatches:
+                raise RuntimeError(
+                    "Existing schema has no migration history and does not match the baseline revision "
+                    f"{BASELINE_REVISION}, refusing to stamp it: " + "; ".join(mismatches)
+                )
+            print(f"Existing schema without migration history, stamping revision {BASELINE_REVISION}")
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, revision)
+
+
+if __name__ == "__main__":
+    from app.db.models import engine
+    upgrade_database(engine)
+    print("Database migrated")
@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, create_engine, Session, select, Relationship
 from datetime import datetime
 from typing import Optional, List
@@ -43,7 +44,13 @@ class User(SQLModel, table=True):
 
 class Resume(SQLModel, table=True):
     __tablename__ = "resume"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Latest upload (get_latest_resume)
+        Index("ix_resume_uploaded_at", "uploaded_at"),
+        # Blob reference counting
+        Index("ix_resume_file_path", "file_path"),
+        {'extend_existing': True},
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")
@@ -53,16 +60,24 @@ class Resume(SQLModel, table=True):
     file_path: str
     uploaded_at: datetime = Field(default_factory=datetime.utcnow)
     ats_score: Optional[float] = Field(default=None)
-    status: str = Field(default="new")  # new, reviewing, approved, rejected
+    # Processing: new, queued, processing, processed, failed; review: reviewing, approved, rejected
+    status: str = Field(default="new")
 
     # Relationships
     user: Optional[User] = Relationship(back_populates="resumes")
     cover_letter: Optional["CoverLetter"] = Relationship(back_populates="resume")
+    extraction: Optional["ResumeExtraction"] = Relationship(back_populates="resume")
+    jobs: List["Job"] = Relationship(back_populates="resume")
     chat_sessions: List["ChatSession"] = Relationship(back_populates="resume")
 
 class CoverLetter(SQLModel, table=True):
     __tablename__ = "coverletter"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_coverletter_resume_id", "resume_id"),
+        # Blob reference counting
+        Index("ix_coverletter_file_path", "file_path"),
+        {'extend_existing': True},
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     resume_id: int = Field(foreign_key="resume.id")
@@ -72,9 +87,54 @@ class CoverLetter(SQLModel, table=True):
     # Relationships
     resume: Optional[Resume] = Relationship(back_populates="cover_letter")
 
+class ResumeExtraction(SQLModel, table=True):
+    __tablename__ = "resumeextraction"
+    __table_args__ = (
+        # Ranking index staleness check (max(extracted_at))
+        Index("ix_resumeextraction_extracted_at", "extracted_at"),
+        {'extend_existing': True},
+    )
+
+    resume_id: int = Field(foreign_key="resume.id", primary_key=True)
+    text: str
+    structured: str  # Resume JSON in the frontend's shape
+    extracted_at: datetime = Field(default_factory=datetime.utcnow)
+
+    # Relationships
+    resume: Optional[Resume] = Relationship(back_populates="extraction")
+
+class Job(SQLModel, table=True):
+    __tablename__ = "job"
+    __table_args__ = (
+        # Claiming due jobs: status filter, run_after order
+        Index("ix_job_status_run_after", "status", "run_after"),
+        {'extend_existing': True},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str  # extract, ats_score, ...
+    resume_id: Optional[int] = Field(default=None, foreign_key="resume.id", index=True)
+    payload: str = Field(default="{}")  # JSON arguments for the handler
+    status: str = Field(default="queued")  # queued, running, done, failed
+    attempts: int = Field(default=0)
+    max_attempts: int = Field(default=3)
+    run_after: datetime = Field(default_factory=datetime.utcnow)
+    locked_by: Optional[str] = None
+    locked_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    # Relationships
+    resume: Optional[Resume] = Relationship(back_populates="jobs")
+
 class ChatMessage(SQLModel, table=True):
     __tablename__ = "chatmessage"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # A session's messages in order, newest first
+        Index("ix_chatmessage_session_id_created_at", "session_id", "created_at", "id"),
+        {'extend_existing': True},
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: int = Field(foreign_key="chatsession.id")
@@ -87,27 +147,38 @@ class ChatMessage(SQLModel, table=True):
 
 class ChatSession(SQLModel, table=True):
     __tablename__ = "chatsession"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # A resume's sessions in order
+        Index("ix_chatsession_resume_id_created_at", "resume_id", "created_at", "id"),
+        {'extend_existing': True},
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     resume_id: int = Field(foreign_key="resume.id")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     last_message_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = Field(default=True)
+    # JSON of the resume the conversation is about, kept by the chat endpoint (not a message)
+    resume_snapshot: Optional[str] = Field(default=None)
 
     # Relationships
     resume: Optional[Resume] = Relationship(back_populates="chat_sessions")
-    messages: List[ChatMessage] = Relationship(back_populates="session")
+    messages: List[ChatMessage] = Relationship(
+        back_populates="session",
+        sa_relationship_kwargs={"order_by": "[ChatMessage.created_at, ChatMessage.id]"}
+    )
 
 def init_db():
-    """Initialize database and create all tables"""
+    """Initialize database by applying the schema migrations"""
+    from app.db.migrate import upgrade_database
+
     try:
-        SQLModel.metadata.create_all(engine)
-        print("Database tables created successfully")
+        upgrade_database(engine)
     except Exception as e:
-        print(f"Failed to create database tables: {e}")
-        # Don't raise exception, just log it
-        pass
+        # An app running against a half-migrated schema fails later in confusing ways
+        print(f"Failed to migrate database: {e}")
+        raise
+    print("Database schema is up to date")
 
 def get_session():
     """Get database session"""
@@ -11,6 +11,7 @@ from sqlmodel import SQLModel
 from app.core.config import settings
 from sqlmodel import create_engine
 from app.db.models import Resume, CoverLetter, ChatSession, ChatMessage
+from app.db.migrate import upgrade_database
 
 def reset_db():
     print("Starting database reset...")
@@ -22,6 +23,9 @@ def reset_db():
     # Drop all tables
     print("Dropping existing tables...")
     SQLModel.metadata.drop_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE IF EXISTS alembic_version")
+    engine.dispose()
     db_path = Path(current_dir.parent) / "database.db"
     
     # Remove the existing database file if it exists
@@ -30,7 +34,7 @@ def reset_db():
         db_path.unlink()
     
     print("Creating new tables...")
-    SQLModel.metadata.create_all(engine)
+    upgrade_database(engine)
     print("Database reset complete!")
 
 if __name__ == "__main__":
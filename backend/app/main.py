@@ -1,15 +1,35 @@
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional
 from google.cloud import language_v1
+import asyncio
 import json
 import os
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
 from app.core.security.middleware import SecurityMiddleware, RequestValidationMiddleware
-from app.db import init_db
+from app.db import init_db, get_session
+from app.core.chat_state import ConversationStore
+from app.core.nlp import (
+    AsyncLanguageAdapter,
+    LocalNLPBackend,
+    NLPAnalysis,
+    NLPBackend,
+    NLPResultCache,
+    NLPTimeoutError,
+    detect_intents,
+)
+from app.core.job_parser import parse_job_posting
+from app.core.resume_analysis import ResumeAnalyzer
+from app.core.resume_extraction import shutdown_extraction_pool
+from app.core.resume_pdf import shutdown_render_process
+from app.core.jobs import start_job_worker, stop_job_worker
+from app.core.render_cache import render_cache
+import app.core.job_handlers  # registers the background job handlers
 
 app = FastAPI(
     title="Free ATS Resume API",
@@ -35,32 +55,36 @@ app.add_middleware(RequestValidationMiddleware)
 # Initialize database
 @app.on_event("startup")
 async def on_startup():
-    global language_client
+    global nlp_backend
     try:
         init_db()
         print("Database initialized successfully")
     except Exception as e:
         print(f"Database initialization failed: {e}")
-        # Don't fail the app startup if DB init fails
-        pass
+        raise
 
-    try:
-        # Try to initialize Google Cloud Language client
-        creds = settings.get_google_credentials()
-        if creds:
-            # Set credentials in environment for Google Cloud client
-            import google.auth
-            from google.oauth2 import service_account
+    nlp_backend = init_nlp_backend()
+    if nlp_backend:
+        print(f"NLP backend '{nlp_backend.name}' initialized successfully")
+    else:
+        print("NLP backend not available - AI features will be disabled")
 
-            credentials = service_account.Credentials.from_service_account_info(creds)
-            language_client = language_v1.LanguageServiceClient(credentials=credentials)
-            print("Google Cloud Language client initialized successfully")
-        else:
-            print("Google Cloud credentials not available - AI features will be disabled")
-            language_client = None
-    except Exception as e:
-        print(f"Google Cloud Language client initialization failed: {e}")
-        language_client = None
+    render_cache.purge_stale_templates()
+
+    if settings.job_worker_enabled:
+        start_job_worker(
+            poll_interval=settings.job_poll_interval_seconds,
+            lease_seconds=settings.job_lease_seconds,
+            backoff_base=settings.job_backoff_seconds
+        )
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    if nlp_backend:
+        nlp_backend.shutdown()
+    await stop_job_worker()
+    shutdown_extraction_pool()
+    shutdown_render_process()
 
 # Include routers here
 from app.api.v1.router import api_router
@@ -73,8 +97,11 @@ class ChatMessage(BaseModel):
 
 class ChatRequest(BaseModel):
     message: str
-    resume: Dict[str, Any]
-    conversationHistory: List[ChatMessage]
+    # With a sessionId the server keeps history and the last resume, so the
+    # client may omit both after the first turn.
+    sessionId: Optional[int] = None
+    resume: Optional[Dict[str, Any]] = None
+    conversationHistory: List[ChatMessage] = []
 
 class JobDetails(BaseModel):
     companyName: str
@@ -94,272 +121,208 @@ class ChatResponse(BaseModel):
 # Initialize Google Cloud Natural Language client
 def init_language_client():
     try:
+        creds = settings.get_google_credentials()
+        if creds:
+            from google.oauth2 import service_account
+
+            credentials = service_account.Credentials.from_service_account_info(creds)
+            return language_v1.LanguageServiceClient(credentials=credentials)
+        # Fall back to application default credentials
         return language_v1.LanguageServiceClient()
     except Exception as e:
         print(f"Failed to initialize Google Cloud Language client: {e}")
         return None
 
-# Global variable to track initialization
-language_client = None
+def init_nlp_backend() -> Optional[NLPBackend]:
+    """Create the NLP backend selected by ``settings.nlp_backend``."""
+    if settings.nlp_backend == "local":
+        return LocalNLPBackend()
+
+    language_client = init_language_client()
+    if not language_client:
+        return None
+    return AsyncLanguageAdapter(
+        language_client,
+        timeout=settings.nlp_timeout_seconds,
+        max_workers=settings.nlp_max_workers,
+        cache=nlp_cache
+    )
+
+# Global variables to track initialization
+nlp_backend = None
+nlp_cache = NLPResultCache(
+    max_entries=settings.nlp_cache_max_entries,
+    ttl_seconds=settings.nlp_cache_ttl_seconds,
+    shared_path=settings.nlp_cache_shared_path
+)
+
+resume_analyzer = ResumeAnalyzer(max_entries=settings.resume_analysis_cache_entries)
+conversation_store = ConversationStore(
+    window=settings.chat_history_window,
+    max_sessions=settings.chat_state_max_sessions
+)
 
 def analyze_resume_content(resume: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze resume content and extract key insights."""
-    analysis = {
-        'skills': [],
-        'experience_years': 0,
-        'education_level': 'Unknown',
-        'industries': [],
-        'key_strengths': [],
-        'areas_for_improvement': []
-    }
-    
-    # Extract skills
-    if resume.get('skills'):
-        analysis['skills'] = [skill.get('name', '') for skill in resume['skills'] if skill.get('name')]
-    
-    # Calculate experience years
-    if resume.get('experiences'):
-        total_months = 0
-        industries = set()
-        for exp in resume['experiences']:
-            if exp.get('startDate') and exp.get('endDate'):
-                # Simple calculation - could be improved
-                start_year = int(exp['startDate'].split('-')[0]) if '-' in exp['startDate'] else 2020
-                end_year = int(exp['endDate'].split('-')[0]) if '-' in exp['endDate'] else 2024
-                if exp['endDate'].lower() == 'present':
-                    end_year = 2024
-                total_months += (end_year - start_year) * 12
-            if exp.get('company'):
-                industries.add(exp['company'])
-        
-        analysis['experience_years'] = total_months // 12
-        analysis['industries'] = list(industries)
-    
-    # Determine education level
-    if resume.get('education'):
-        degrees = [edu.get('degree', '').lower() for edu in resume['education']]
-        if any('phd' in degree or 'doctorate' in degree for degree in degrees):
-            analysis['education_level'] = 'PhD'
-        elif any('master' in degree or 'ms' in degree or 'ma' in degree for degree in degrees):
-            analysis['education_level'] = "Master's"
-        elif any('bachelor' in degree or 'bs' in degree or 'ba' in degree for degree in degrees):
-            analysis['education_level'] = "Bachelor's"
-        elif any('associate' in degree for degree in degrees):
-            analysis['education_level'] = "Associate's"
-    
-    # Generate key strengths
-    if analysis['experience_years'] > 5:
-        analysis['key_strengths'].append('Extensive professional experience')
-    if len(analysis['skills']) > 10:
-        analysis['key_strengths'].append('Diverse skill set')
-    if analysis['education_level'] in ["Master's", 'PhD']:
-        analysis['key_strengths'].append('Advanced education')
-    
-    # Areas for improvement
-    if len(analysis['skills']) < 5:
-        analysis['areas_for_improvement'].append('Expand skills section')
-    if analysis['experience_years'] < 2:
-        analysis['areas_for_improvement'].append('Build more professional experience')
-    if not resume.get('publications'):
-        analysis['areas_for_improvement'].append('Consider adding publications or projects')
-    
-    return analysis
+    return resume_analyzer.analyze(resume)
 
 def extract_job_details(text: str) -> Optional[JobDetails]:
     """Extract job details from text if it appears to be a job description."""
-    # Simple heuristic - check for common job posting keywords
-    job_keywords = ["hiring", "job opening", "position available", "we're looking for", "join our team"]
-    text_lower = text.lower()
-    
-    if any(keyword in text_lower for keyword in job_keywords):
-        # Try to extract basic job details
-        lines = text.split('\n')
-        company_name = "Unknown Company"
-        position_name = "Unknown Position"
-        
-        for line in lines[:10]:  # Check first 10 lines
-            line = line.strip()
-            if line and len(line) < 100:  # Reasonable length for company/position
-                if not company_name or company_name == "Unknown Company":
-                    company_name = line
-                elif not position_name or position_name == "Unknown Position":
-                    position_name = line
-                    break
-        
-        return JobDetails(
-            companyName=company_name,
-            positionName=position_name
-        )
-    
-    return None
+    fields = parse_job_posting(text)
+    return JobDetails(**fields) if fields else None
 
-@app.post("/api/chat", response_model=ChatResponse)
-async def process_chat_message(request: ChatRequest):
-    """Process a chat message using Google Cloud Natural Language API."""
-    global language_client
+def detect_conversation_intents(message: str, history: List[Any]) -> List[str]:
+    """Intents of the message; a follow-up without any ("tell me more") keeps those of the last user turn."""
+    detected_intents = detect_intents(message)
+    if not detected_intents:
+        for msg in reversed(list(history)[-settings.chat_history_window:]):
+            if msg.role == "user":
+                return detect_intents(msg.content)
+    return detected_intents
+
+def get_nlp_backend() -> NLPBackend:
+    """Return the NLP backend, initializing it on first use."""
+    global nlp_backend
     
-    if not language_client:
+    if not nlp_backend:
         # Try to initialize again
-        language_client = init_language_client()
-        if not language_client:
+        nlp_backend = init_nlp_backend()
+        if not nlp_backend:
             raise HTTPException(
                 status_code=500, 
-                detail="AI service is not available. Please check Google Cloud configuration."
+                detail="AI service is not available. Please check Google Cloud configuration or set NLP_BACKEND=local."
             )
-    
+    return nlp_backend
+
+def load_conversation(request: ChatRequest, db: Session) -> tuple:
+    """Return ``(resume, history)`` for a request, from the session when one is given.
+
+    Reads the database; call it from the threadpool.
+    """
+    if request.sessionId is None:
+        return request.resume or {}, request.conversationHistory
+
+    state = conversation_store.load(db, request.sessionId)
+    resume = request.resume if request.resume is not None else state.resume
+    return resume or {}, list(state.history)
+
+async def analyze_message(backend: NLPBackend, message: str) -> NLPAnalysis:
+    """Analyze the user's message (sentiment and entities in one request)."""
     try:
-        # Analyze the user's message first
-        message_document = language_v1.Document(
-            content=request.message,
-            type_=language_v1.Document.Type.PLAIN_TEXT
-        )
-        
-        # Get sentiment and entities from user message
-        message_sentiment = language_client.analyze_sentiment(document=message_document)
-        message_entities = language_client.analyze_entities(document=message_document)
-        
-        # Perform comprehensive resume analysis
-        resume_analysis = analyze_resume_content(request.resume)
+        return await backend.analyze(message)
+    except NLPTimeoutError as e:
+        # Sentiment only tunes the sign-off, so answer without it
+        print(f"Language analysis skipped: {e}")
+        return NLPAnalysis()
+
+def analyze_locally(message: str, resume: Dict[str, Any], history: List[Any]) -> tuple:
+    """Return ``(resume_analysis, detected_intents, job_details)``, the inputs that need no NLP call."""
+    return (
+        analyze_resume_content(resume),
+        detect_conversation_intents(message, history),
+        extract_job_details(message)
+    )
+
+def compose_chat_response(
+    resume_analysis: Dict[str, Any],
+    detected_intents: List[str],
+    job_details: Optional[JobDetails]
+) -> Iterator[str]:
+    """Yield the reply piece by piece, in display order, up to the sign-off."""
+    # Main response based on detected intents
+    if 'resume_help' in detected_intents or 'optimization' in detected_intents:
+        yield "**Resume Optimization Tips:**\n\n"
         
-        # Analyze conversation history for context
-        conversation_context = ""
-        user_questions = []
-        assistant_responses = []
+        if resume_analysis['skills']:
+            yield f"• **Skills Section**: You have {len(resume_analysis['skills'])} skills listed. Consider prioritizing the most relevant ones for your target roles.\n"
         
-        for msg in request.conversationHistory[-6:]:  # Last 6 messages for context
-            if msg.role == "user":
-                user_questions.append(msg.content)
-                conversation_context += f"User: {msg.content}\n"
-            else:
-                assistant_responses.append(msg.content)
-                conversation_context += f"Assistant: {msg.content}\n"
+        yield f"• **Experience**: With {resume_analysis['experience_years']} years of experience, focus on achievements and quantifiable results.\n"
         
-        # Determine user intent and provide appropriate response
-        user_message_lower = request.message.lower()
-        intent_keywords = {
-            'resume_help': ['resume', 'cv', 'curriculum', 'format', 'layout', 'structure'],
-            'job_search': ['job', 'position', 'hiring', 'application', 'apply', 'interview', 'career'],
-            'skills': ['skill', 'experience', 'qualification', 'competency', 'expertise'],
-            'cover_letter': ['cover letter', 'cover-letter', 'motivation', 'introduction'],
-            'optimization': ['optimize', 'improve', 'better', 'enhance', 'tailor', 'customize'],
-            'ats': ['ats', 'applicant tracking', 'tracking system', 'keyword'],
-            'advice': ['help', 'advice', 'suggestion', 'recommendation', 'tip']
-        }
+        if resume_analysis['key_strengths']:
+            yield f"• **Strengths**: {', '.join(resume_analysis['key_strengths'][:3])}\n"
         
-        detected_intents = []
-        for intent, keywords in intent_keywords.items():
-            if any(keyword in user_message_lower for keyword in keywords):
-                detected_intents.append(intent)
+        if resume_analysis['areas_for_improvement']:
+            yield f"• **Areas to Improve**: {', '.join(resume_analysis['areas_for_improvement'][:2])}\n"
         
-        # Generate intelligent response based on intent and resume analysis
-        response_parts = []
+        yield "• **ATS Optimization**: Use industry-standard keywords and keep formatting simple.\n"
+        yield "• **Length**: Aim for 1-2 pages depending on your experience level.\n\n"
         
-        # Greeting and context awareness
-        sentiment_score = message_sentiment.document_sentiment.score
-        if sentiment_score > 0.3:
-            response_parts.append("Great to see your enthusiasm! ")
-        elif sentiment_score < -0.3:
-            response_parts.append("I understand this can be challenging. ")
+    elif 'job_search' in detected_intents:
+        yield "**Job Search Strategy:**\n\n"
+        yield "• **Targeted Applications**: Customize each application for the specific role.\n"
+        yield "• **Networking**: Connect with professionals in your target companies.\n"
+        yield "• **LinkedIn**: Keep your profile updated and engage with industry content.\n"
+        yield "• **Follow-up**: Send thank-you notes after interviews.\n\n"
         
-        # Main response based on detected intents
-        if 'resume_help' in detected_intents or 'optimization' in detected_intents:
-            response_parts.append("**Resume Optimization Tips:**\n\n")
-            
-            if resume_analysis['skills']:
-                response_parts.append(f"• **Skills Section**: You have {len(resume_analysis['skills'])} skills listed. Consider prioritizing the most relevant ones for your target roles.\n")
-            
-            response_parts.append(f"• **Experience**: With {resume_analysis['experience_years']} years of experience, focus on achievements and quantifiable results.\n")
-            
-            if resume_analysis['strengths']:
-                response_parts.append(f"• **Strengths**: {', '.join(resume_analysis['strengths'][:3])}\n")
+    elif 'skills' in detected_intents:
+        if resume_analysis['skills']:
+            yield f"**Your Skills Analysis:** You have expertise in {', '.join(resume_analysis['skills'][:5])}{' and more' if len(resume_analysis['skills']) > 5 else ''}.\n\n"
+            yield "**Skill Development Recommendations:**\n"
+            yield "• Identify gaps between your skills and target job requirements.\n"
+            yield "• Consider online courses or certifications for in-demand skills.\n"
+            yield "• Highlight transferable skills from your experience.\n\n"
             
             if resume_analysis['areas_for_improvement']:
-                response_parts.append(f"• **Areas to Improve**: {', '.join(resume_analysis['areas_for_improvement'][:2])}\n")
-            
-            response_parts.append("• **ATS Optimization**: Use industry-standard keywords and keep formatting simple.\n")
-            response_parts.append("• **Length**: Aim for 1-2 pages depending on your experience level.\n\n")
-            
-        elif 'job_search' in detected_intents:
-            response_parts.append("**Job Search Strategy:**\n\n")
-            response_parts.append("• **Targeted Applications**: Customize each application for the specific role.\n")
-            response_parts.append("• **Networking**: Connect with professionals in your target companies.\n")
-            response_parts.append("• **LinkedIn**: Keep your profile updated and engage with industry content.\n")
-            response_parts.append("• **Follow-up**: Send thank-you notes after interviews.\n\n")
-            
-        elif 'skills' in detected_intents:
-            if resume_analysis['skills']:
-                response_parts.append(f"**Your Skills Analysis:** You have expertise in {', '.join(resume_analysis['skills'][:5])}{' and more' if len(resume_analysis['skills']) > 5 else ''}.\n\n")
-                response_parts.append("**Skill Development Recommendations:**\n")
-                response_parts.append("• Identify gaps between your skills and target job requirements.\n")
-                response_parts.append("• Consider online courses or certifications for in-demand skills.\n")
-                response_parts.append("• Highlight transferable skills from your experience.\n\n")
-                
-                if resume_analysis['areas_for_improvement']:
-                    response_parts.append(f"**Based on your resume, consider focusing on:** {', '.join(resume_analysis['areas_for_improvement'])}\n\n")
-            else:
-                response_parts.append("Let's analyze your skills! Share your key competencies and I'll help you present them effectively.\n\n")
-                
-        elif 'cover_letter' in detected_intents:
-            response_parts.append("**Cover Letter Best Practices:**\n\n")
-            response_parts.append("• **Personalization**: Address the hiring manager by name when possible.\n")
-            response_parts.append("• **Structure**: Introduction, body (2-3 paragraphs), conclusion.\n")
-            response_parts.append("• **Focus**: Explain why you're interested and what you bring to the role.\n")
-            response_parts.append("• **Length**: Keep it to 3-4 paragraphs, about 250-400 words.\n\n")
-            
-        elif 'ats' in detected_intents:
-            response_parts.append("**ATS-Friendly Resume Tips:**\n\n")
-            response_parts.append("• **Keywords**: Include relevant terms from the job description.\n")
-            response_parts.append("• **Format**: Use simple fonts (Arial, Calibri) and clear headings.\n")
-            response_parts.append("• **File Type**: Save as .docx or PDF, avoid images and complex formatting.\n")
-            response_parts.append("• **Sections**: Use standard headings like 'Work Experience', 'Education', 'Skills'.\n\n")
-            
+                yield f"**Based on your resume, consider focusing on:** {', '.join(resume_analysis['areas_for_improvement'])}\n\n"
         else:
-            # General helpful response with personalized resume insights
-            response_parts.append("I'm here to help you with your career development! ")
-            
-            if resume_analysis['experience_years'] > 0:
-                response_parts.append(f"With {resume_analysis['experience_years']} years of experience")
-                if resume_analysis['education_level']:
-                    response_parts.append(f" and a {resume_analysis['education_level']} education")
-                response_parts.append(", you have a solid foundation to build upon.\n\n")
-            else:
-                response_parts.append("Let's build a strong foundation for your career journey.\n\n")
+            yield "Let's analyze your skills! Share your key competencies and I'll help you present them effectively.\n\n"
             
-            response_parts.append("I can assist with:\n\n")
-            response_parts.append("• **Resume optimization** and formatting tips\n")
-            response_parts.append("• **Job search strategies** and application advice\n")
-            response_parts.append("• **Interview preparation** and common questions\n")
-            response_parts.append("• **Career transition** guidance\n")
-            response_parts.append("• **Skill development** recommendations\n\n")
-            
-            if resume_analysis['strengths']:
-                response_parts.append(f"**Your key strengths:** {', '.join(resume_analysis['strengths'][:3])}\n\n")
-            
-            response_parts.append("What specific aspect would you like help with?")
+    elif 'cover_letter' in detected_intents:
+        yield "**Cover Letter Best Practices:**\n\n"
+        yield "• **Personalization**: Address the hiring manager by name when possible.\n"
+        yield "• **Structure**: Introduction, body (2-3 paragraphs), conclusion.\n"
+        yield "• **Focus**: Explain why you're interested and what you bring to the role.\n"
+        yield "• **Length**: Keep it to 3-4 paragraphs, about 250-400 words.\n\n"
         
-        # Add job description analysis if detected
-        job_details = extract_job_details(request.message)
-        if job_details:
-            response_parts.append(f"\n\n**Job Analysis:** I detected a job posting for **{job_details.positionName}** at **{job_details.companyName}**.\n\n")
-            response_parts.append("**Next Steps:**\n")
-            response_parts.append("• Review the job requirements against your resume\n")
-            response_parts.append("• Customize your application materials\n")
-            response_parts.append("• Prepare for potential interview questions\n")
-            response_parts.append("• Research the company and role\n\n")
-            response_parts.append("Would you like me to help you tailor your resume for this specific position?")
+    elif 'ats' in detected_intents:
+        yield "**ATS-Friendly Resume Tips:**\n\n"
+        yield "• **Keywords**: Include relevant terms from the job description.\n"
+        yield "• **Format**: Use simple fonts (Arial, Calibri) and clear headings.\n"
+        yield "• **File Type**: Save as .docx or PDF, avoid images and complex formatting.\n"
+        yield "• **Sections**: Use standard headings like 'Work Experience', 'Education', 'Skills'.\n\n"
         
-        ai_response = ''.join(response_parts)
+    else:
+        # General helpful response with personalized resume insights
+        yield "I'm here to help you with your career development! "
         
-        return ChatResponse(
-            response=ai_response,
-            isJobDescription=job_details is not None,
-            jobDetails=job_details
-        )
+        if resume_analysis['experience_years'] > 0:
+            yield f"With {resume_analysis['experience_years']} years of experience"
+            if resume_analysis['education_level']:
+                yield f" and a {resume_analysis['education_level']} education"
+            yield ", you have a solid foundation to build upon.\n\n"
+        else:
+            yield "Let's build a strong foundation for your career journey.\n\n"
         
-    except Exception as e:
-        print(f"Error processing chat message: {e}")
-        # Fallback response
-        fallback_response = """I apologize, but I'm having trouble processing your message right now. Here are some general tips to get you started:
+        yield "I can assist with:\n\n"
+        yield "• **Resume optimization** and formatting tips\n"
+        yield "• **Job search strategies** and application advice\n"
+        yield "• **Interview preparation** and common questions\n"
+        yield "• **Career transition** guidance\n"
+        yield "• **Skill development** recommendations\n\n"
+        
+        if resume_analysis['key_strengths']:
+            yield f"**Your key strengths:** {', '.join(resume_analysis['key_strengths'][:3])}\n\n"
+        
+        yield "What specific aspect would you like help with?"
+    
+    # Add job description analysis if detected
+    if job_details:
+        yield f"\n\n**Job Analysis:** I detected a job posting for **{job_details.positionName}** at **{job_details.companyName}**.\n\n"
+        yield "**Next Steps:**\n"
+        yield "• Review the job requirements against your resume\n"
+        yield "• Customize your application materials\n"
+        yield "• Prepare for potential interview questions\n"
+        yield "• Research the company and role\n\n"
+        yield "Would you like me to help you tailor your resume for this specific position?"
+
+def compose_sign_off(sentiment_score: float) -> Iterator[str]:
+    """Yield the closing line, the only part of the reply that depends on the NLP analysis."""
+    if sentiment_score > 0.3:
+        yield "\n\nGreat to see your enthusiasm!"
+    elif sentiment_score < -0.3:
+        yield "\n\nI understand this can be challenging, and I'm here to help."
+
+FALLBACK_RESPONSE = """I apologize, but I'm having trouble processing your message right now. Here are some general tips to get you started:
 
 **Resume Basics:**
 • Keep it to 1-2 pages
@@ -374,9 +337,101 @@ async def process_chat_message(request: ChatRequest):
 • Research company culture
 
 Feel free to ask me specific questions about resume optimization, job search strategies, or career development!"""
+
+@app.post("/api/chat", response_model=ChatResponse)
+async def process_chat_message(request: ChatRequest, db: Session = Depends(get_session)):
+    """Process a chat message using the configured NLP backend."""
+    backend = get_nlp_backend()
+    resume, history = await run_in_threadpool(load_conversation, request, db)
+    
+    try:
+        # The NLP call and the local analyses run at the same time
+        analysis_task = asyncio.create_task(analyze_message(backend, request.message))
+        try:
+            resume_analysis, detected_intents, job_details = await run_in_threadpool(
+                analyze_locally, request.message, resume, history
+            )
+            message_analysis = await analysis_task
+        finally:
+            analysis_task.cancel()
+
+        # Generate intelligent response based on intent and resume analysis
+        ai_response = ''.join(compose_chat_response(resume_analysis, detected_intents, job_details))
+        ai_response += ''.join(compose_sign_off(message_analysis.sentiment_score))
+        
+        if request.sessionId is not None:
+            await run_in_threadpool(conversation_store.record_turn, db, request.sessionId, request.message,
+                                    ai_response, request.resume)
         
         return ChatResponse(
-            response=fallback_response,
+            response=ai_response,
+            isJobDescription=job_details is not None,
+            jobDetails=job_details
+        )
+        
+    except Exception as e:
+        print(f"Error processing chat message: {e}")
+        return ChatResponse(
+            response=FALLBACK_RESPONSE,
             isJobDescription=False,
             jobDetails=None
-        )
\ No newline at end of file
+        )
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.post("/api/chat/stream")
+async def stream_chat_message(request: ChatRequest, db: Session = Depends(get_session)):
+    """Stream the chat reply as Server-Sent Events.
+
+    Emits one ``delta`` event per piece of the reply as soon as it is
+    produced, then a ``done`` event carrying ``isJobDescription`` and
+    ``jobDetails``. On failure an ``error`` event carries the fallback reply.
+    """
+    backend = get_nlp_backend()
+    resume, history = await run_in_threadpool(load_conversation, request, db)
+
+    async def events() -> AsyncIterator[str]:
+        # SSE comment so headers and the first bytes go out before any analysis
+        yield ": stream open\n\n"
+        try:
+            # Start the NLP call first; the local analyses run in the threadpool
+            # while it is in flight, and everything but the sign-off is sent
+            # before its result is needed
+            analysis_task = asyncio.create_task(analyze_message(backend, request.message))
+            parts = []
+            try:
+                resume_analysis, detected_intents, job_details = await run_in_threadpool(
+                    analyze_locally, request.message, resume, history
+                )
+                for part in compose_chat_response(resume_analysis, detected_intents, job_details):
+                    parts.append(part)
+                    yield sse_event("delta", {"text": part})
+                message_analysis = await analysis_task
+            finally:
+                analysis_task.cancel()
+
+            for part in compose_sign_off(message_analysis.sentiment_score):
+                parts.append(part)
+                yield sse_event("delta", {"text": part})
+
+            if request.sessionId is not None:
+                await run_in_threadpool(conversation_store.record_turn, db, request.sessionId, request.message,
+                                        ''.join(parts), request.resume)
+
+            yield sse_event("done", {
+                "isJobDescription": job_details is not None,
+                "jobDetails": job_details.model_dump() if job_details else None
+            })
+        except Exception as e:
+            print(f"Error streaming chat message: {e}")
+            yield sse_event("error", {"text": FALLBACK_RESPONSE})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Keep proxies from buffering the stream
+        }
+    )
@@ -0,0 +1,92 @@
+"""SQL statement count and latency of the chat session listing.
+
+Seeds a scratch SQLite database with a resume holding 1, 10 and 100 chat
+sessions, calls GET /api/v1/chat/sessions/{resume_id} for each, and
+counts the SQL statements every request executes. The count must not
+grow with the number of sessions (one lazy load per session would); the
+script exits non-zero if it does.
+
+Usage (from the backend directory):
+    python -m benchmarks.chat_sessions [--messages N] [--repeat R]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SCRATCH_DIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(SCRATCH_DIR, 'chat_sessions.db')}"
+os.environ.setdefault("JOB_WORKER_ENABLED", "false")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.db.models import ChatMessage, ChatSession, Resume, User, engine
+from app.main import app
+
+SESSION_COUNTS = (1, 10, 100)
+
+
+def seed(session_count: int, messages_per_session: int) -> int:
+    start = datetime(2024, 1, 1)
+    with Session(engine) as db:
+        user = User(email=f"bench{session_count}@example.com", first_name="Bench", last_name="User", password_hash="-")
+        db.add(user)
+        db.flush()
+        resume = Resume(user_id=user.id, name="Bench", email=user.email, role="Engineer", file_path="/dev/null")
+        db.add(resume)
+        db.flush()
+        for index in range(session_count):
+            chat_session = ChatSession(resume_id=resume.id, created_at=start + timedelta(minutes=index))
+            db.add(chat_session)
+            db.flush()
+            db.add_all(
+                ChatMessage(session_id=chat_session.id, content=f"message {number}",
+                            created_at=chat_session.created_at + timedelta(seconds=number))
+                for number in range(messages_per_session)
+            )
+        db.commit()
+        return resume.id
+
+
+def main(messages_per_session: int, repeat: int) -> int:
+    engine.echo = False
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    counts = {}
+    with TestClient(app) as client:
+        for session_count in SESSION_COUNTS:
+            resume_id = seed(session_count, messages_per_session)
+            for query, label in (("", "all messages"), ("&messages=5", "last 5 messages")):
+                url = f"/api/v1/chat/sessions/{resume_id}?limit=100{query}"
+                client.get(url)  # warm up
+                statements.clear()
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    response = client.get(url)
+                    response.raise_for_status()
+                elapsed = (time.perf_counter() - start) / repeat
+                per_request = len(statements) / repeat
+                counts.setdefault(label, set()).add(per_request)
+                returned = response.json()["sessions"]
+                print(f"{session_count:>4} sessions, {label:<16} {per_request:>4.0f} statements/request, "
+                      f"{elapsed * 1000:7.2f} ms, {sum(len(s['messages']) for s in returned)} messages returned")
+
+    constant = all(len(values) == 1 for values in counts.values())
+    print("statement count is constant" if constant else "statement count GROWS with the number of sessions")
+    return 0 if constant else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20, help="messages per session")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    sys.exit(main(args.messages, args.repeat))
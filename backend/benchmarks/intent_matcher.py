@@ -0,0 +1,160 @@
+"""Benchmark chat intent detection on long pasted job descriptions.
+
+Compares ``IntentMatcher``'s per-keyword substring loop with a single-pass
+scan by one compiled character-trie regex over all keywords, first with the shipped
+keyword table and then with the table grown by synthetic keywords, since
+the loop's cost grows with every keyword while the scan's barely does.
+Both are checked to detect exactly what the original loop did.
+
+Usage (from the backend directory):
+    python -m benchmarks.intent_matcher [--repeat N]
+"""
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.nlp.intents import INTENT_KEYWORDS, IntentMatcher
+
+JOB_POSTING = """Senior Backend Engineer - Payments Platform
+Acme Corp - Berlin, Germany (Hybrid)
+
+About the role
+You will design and operate the services that move money for millions of
+customers. You will work closely with product, security and data teams and
+own services end to end, from design documents to on-call.
+
+What you will do
+- Build scalable, well-tested APIs in Python and Go
+- Improve reliability and observability of our distributed systems
+- Mentor engineers and contribute to architecture reviews
+
+What we are looking for
+- 5+ years of professional experience building backend systems
+- Strong knowledge of PostgreSQL, Kafka and Kubernetes
+- Excellent written and verbal communication
+
+What we offer
+- Competitive salary and equity, 30 days of vacation
+- Relocation support and visa sponsorship
+"""
+
+
+def loop_match(intent_keywords: Dict[str, List[str]], text: str) -> List[str]:
+    """The matching loop previously inlined in ``process_chat_message``."""
+    text_lower = text.lower()
+    detected = []
+    for intent, keywords in intent_keywords.items():
+        if any(keyword in text_lower for keyword in keywords):
+            detected.append(intent)
+    return detected
+
+
+def trie_regex(words: List[str]) -> str:
+    """Render ``words`` as a prefix-factored alternation, e.g. ``appl(?:y|ication)``."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A word ending here makes the rest optional; greedy so the longest keyword wins
+        return f'(?:{body})?' if '' in node else body
+
+    return render(trie)
+
+
+class CompiledMatcher:
+    """Every keyword in one character-trie regex, scanned once per message.
+
+    The scan reports the longest keyword at each position, which also
+    reports the intents of the keywords that are its prefixes; a lookahead
+    consumes nothing, so overlapping keywords are still found.
+    """
+
+    def __init__(self, intent_keywords: Dict[str, List[str]]):
+        self.intents = list(intent_keywords)
+        owners: Dict[str, set] = {}
+        for intent, keywords in intent_keywords.items():
+            for keyword in keywords:
+                owners.setdefault(keyword.lower(), set()).add(intent)
+        self._intents_for = {
+            keyword: set().union(*(owners[prefix] for prefix in owners if keyword.startswith(prefix)))
+            for keyword in owners
+        }
+        self._pattern = re.compile('(?=(' + trie_regex(list(owners)) + '))')
+
+    def match(self, text: str) -> List[str]:
+        found = set()
+        for match in self._pattern.finditer(text.lower()):
+            found |= self._intents_for[match.group(1)]
+            if len(found) == len(self.intents):
+                break
+        return [intent for intent in self.intents if intent in found]
+
+
+def grown_table(extra_per_intent: int) -> Dict[str, List[str]]:
+    return {
+        intent: keywords + [f"{intent[:4]}kw{i}zz" for i in range(extra_per_intent)]
+        for intent, keywords in INTENT_KEYWORDS.items()
+    }
+
+
+# Substring matches the shipped table must keep ("ats" inside "whats")
+SAMPLE_MESSAGES = [
+    "whats my score?",
+    "Can you help me tailor my CV for this position?",
+    "I need a cover-letter for a job with applicant tracking",
+    "multiple skills and expertise",
+    "hello there",
+]
+
+
+def check(intent_keywords: Dict[str, List[str]], texts: List[str]) -> None:
+    loop = IntentMatcher(intent_keywords)
+    compiled = CompiledMatcher(intent_keywords)
+    for text in texts:
+        expected = loop_match(intent_keywords, text)
+        for matcher in (loop, compiled):
+            detected = matcher.match(text)
+            if detected != expected:
+                raise SystemExit(f"detected {detected} instead of {expected} for {text[:40]!r}")
+
+
+def bench(label: str, intent_keywords: Dict[str, List[str]], text: str, repeat: int) -> None:
+    loop = IntentMatcher(intent_keywords)
+    compiled = CompiledMatcher(intent_keywords)
+    loop_ms = timeit.timeit(lambda: loop.match(text), number=repeat) / repeat * 1000
+    compiled_ms = timeit.timeit(lambda: compiled.match(text), number=repeat) / repeat * 1000
+    keyword_count = sum(len(keywords) for keywords in intent_keywords.values())
+    print(f"{label:<28} {keyword_count:>5} kw  loop {loop_ms:7.3f} ms  "
+          f"compiled {compiled_ms:7.3f} ms  ({loop_ms / compiled_ms:5.2f}x)")
+
+
+def main(repeat: int) -> None:
+    check(INTENT_KEYWORDS, SAMPLE_MESSAGES + [JOB_POSTING])
+    check(grown_table(50), SAMPLE_MESSAGES + [JOB_POSTING])
+    print("both matchers detect what the original loop did")
+    for copies in (1, 10, 50):
+        text = JOB_POSTING * copies
+        print(f"-- job description x{copies} ({len(text):,} chars)")
+        bench("shipped keywords", INTENT_KEYWORDS, text, repeat)
+        for extra in (10, 25, 50):
+            bench(f"+{extra} keywords per intent", grown_table(extra), text, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,147 @@
+"""Throughput benchmark for the job-posting parser.
+
+Parses a small corpus of sample postings repeatedly and reports postings
+per second, plus the time to parse one very long paste fed as a stream of
+chunks and one without any newlines. Each sample also carries the fields
+we expect, and chat messages that must not be taken for postings are
+checked too, so a regression in extraction shows up next to the timing.
+
+Usage (from the backend directory):
+    python -m benchmarks.job_parser [--seconds S]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.job_parser import parse_job_posting
+
+CORPUS = [
+    ("""Senior Backend Engineer - Payments Platform
+Acme Corp - Berlin, Germany (Hybrid)
+
+About the role
+You will design and operate the services that move money for millions of customers.
+
+What you will do
+- Build scalable, well-tested APIs in Python and Go
+- Mentor engineers and contribute to architecture reviews
+
+What we offer
+- Salary: €70,000 – €90,000 per year
+- Relocation support and visa sponsorship
+""", {'companyName': 'Acme Corp', 'positionName': 'Senior Backend Engineer', 'location': 'Berlin, Germany',
+      'workType': 'hybrid', 'salaryRange': '€70,000 – €90,000 per year', 'visaSponsorship': True, 'foreignersOk': True}),
+    ("""Stripe is hiring a Staff Software Engineer to join our infrastructure group.
+This role is fully remote within the United States. Compensation: $180k - $240k.
+Responsibilities include owning our storage layer end to end.
+Applicants must be authorized to work in the US; we are unable to sponsor visas.
+""", {'companyName': 'Stripe', 'positionName': 'Staff Software Engineer', 'workType': 'remote',
+      'salaryRange': '$180k - $240k', 'visaSponsorship': False}),
+    ("""Job Title: Data Analyst
+Company: Northwind Traders
+Location: London, UK
+Work type: On-site
+Salary range: 45k - 55k GBP
+
+Requirements
+- Strong SQL and Excel
+- Must have the right to work in the UK
+""", {'companyName': 'Northwind Traders', 'positionName': 'Data Analyst', 'location': 'London, UK',
+      'workType': 'onsite', 'salaryRange': '45k - 55k GBP', 'foreignersOk': False}),
+    ("""We're hiring!
+Globex
+Product Designer
+
+Join our team and shape the design system used by 200 engineers.
+Remote-first, with optional office days in Lisbon.
+International candidates are welcome.
+""", {'companyName': 'Globex', 'positionName': 'Product Designer', 'workType': 'remote', 'foreignersOk': True}),
+    ("""Machine Learning Engineer (NLP)
+Initech is looking for a Machine Learning Engineer based in Toronto, Canada.
+Qualifications: 3+ years with PyTorch, experience shipping models to production.
+Pay: $120,000 to $150,000 CAD per year. This position requires government clearance.
+""", {'companyName': 'Initech', 'positionName': 'Machine Learning Engineer', 'location': 'Toronto, Canada',
+      'salaryRange': '$120,000 to $150,000 CAD per year', 'foreignersOk': False}),
+    ("""Platform Engineer
+Globex Corporation - London, UK (Hybrid)
+
+Responsibilities
+- Run our Kubernetes clusters and CI pipelines
+
+Requirements
+- 3+ years operating production infrastructure
+
+Benefits
+- 30 days of paid leave
+
+Please note we cannot sponsor visas for this role.
+""", {'companyName': 'Globex Corporation', 'positionName': 'Platform Engineer', 'location': 'London, UK',
+      'workType': 'hybrid', 'visaSponsorship': False}),
+    ("Software Engineer at Stripe, remote, $150k - $180k",
+     {'companyName': 'Stripe', 'positionName': 'Software Engineer', 'workType': 'remote',
+      'salaryRange': '$150k - $180k'}),
+]
+
+
+# Chat messages that mention jobs but are not postings
+NOT_POSTINGS = [
+    "I am looking for a software engineer job, can you help?",
+    "What are the requirements and qualifications for a PM?",
+    "What should I put in the requirements section of my resume? My salary was $100k",
+]
+
+
+def chunked(text: str, size: int = 4096) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+
+def check_corpus() -> None:
+    for text, expected in CORPUS:
+        fields = parse_job_posting(text) or {}
+        wrong = {key: (fields.get(key), value) for key, value in expected.items() if fields.get(key) != value}
+        status = "ok" if not wrong else f"MISMATCH {wrong}"
+        print(f"  {expected['positionName']:<28} {status}")
+    for text in NOT_POSTINGS:
+        fields = parse_job_posting(text)
+        status = "ok" if fields is None else f"TAKEN FOR A POSTING {fields}"
+        print(f"  not a posting: {text!r} {status}")
+
+
+def main(seconds: float) -> None:
+    print("extraction check:")
+    check_corpus()
+
+    parsed = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for text, _expected in CORPUS:
+            parse_job_posting(text)
+        parsed += len(CORPUS)
+    elapsed = time.perf_counter() - start
+    print(f"throughput: {parsed / elapsed:,.0f} postings/s ({elapsed / parsed * 1e6:.1f} µs per posting)")
+
+    long_paste = "\n".join(text for text, _expected in CORPUS) * 400
+    start = time.perf_counter()
+    parse_job_posting(chunked(long_paste))
+    elapsed = time.perf_counter() - start
+    print(f"long paste: {len(long_paste) / 1e6:.1f} MB streamed in {elapsed * 1000:.1f} ms "
+          f"({len(long_paste) / 1e6 / elapsed:.1f} MB/s)")
+
+    one_line = "lorem ipsum " * 500_000
+    start = time.perf_counter()
+    parse_job_posting(chunked(one_line))
+    elapsed = time.perf_counter() - start
+    print(f"no newlines: {len(one_line) / 1e6:.1f} MB streamed in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    main(args.seconds)
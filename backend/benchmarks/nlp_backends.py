@@ -0,0 +1,117 @@
+"""Compare the local NLP backend with the Google backend.
+
+Reports per-message latency for each backend and, when Google credentials
+are available, how often the two agree on sentiment polarity and which
+entities they find.
+
+Usage (from the backend directory):
+    python -m benchmarks.nlp_backends [--rounds N]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.nlp import AsyncLanguageAdapter, LocalNLPBackend, NLPAnalysis, NLPBackend
+
+SAMPLE_MESSAGES = [
+    "Can you help me improve my resume?",
+    "I love this tool, thanks so much!",
+    "I'm really frustrated, I keep getting rejected after interviews.",
+    "How should I format my cover letter for a data scientist role at Google?",
+    "I'm not confident about my skills section.",
+    "We are hiring a Senior Software Engineer in Berlin. Python, Docker and Kubernetes required.",
+    "What keywords do ATS systems look for in a product manager CV?",
+    "I was laid off from Amazon last month and I'm worried about finding a new job.",
+    "Is it a good idea to mention my salary expectations of $95k?",
+    "My interview at Microsoft in Seattle is on March 12, any tips?",
+    "This is terrible, my application was ghosted again.",
+    "Should I list React and TypeScript before Java?",
+    "I'm excited to apply for the machine learning internship at Nvidia!",
+    "Can you tailor my experience for a consultant position at Deloitte in London?",
+    "Not sure if my education section is good enough.",
+    "Thanks, that was really helpful.",
+]
+
+
+def polarity(score: float, threshold: float = 0.25) -> int:
+    if score > threshold:
+        return 1
+    if score < -threshold:
+        return -1
+    return 0
+
+
+def entity_names(analysis: NLPAnalysis) -> set:
+    return {entity.name.lower() for entity in analysis.entities}
+
+
+async def time_backend(backend: NLPBackend, rounds: int) -> tuple:
+    results: List[NLPAnalysis] = []
+    timings: List[float] = []
+    for round_index in range(rounds):
+        for message in SAMPLE_MESSAGES:
+            start = time.perf_counter()
+            analysis = await backend.analyze(message)
+            timings.append((time.perf_counter() - start) * 1000)
+            if round_index == 0:
+                results.append(analysis)
+    return results, timings
+
+
+def report_latency(name: str, timings: List[float]) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{name:>7}: mean {statistics.mean(timings):8.3f} ms  "
+          f"p50 {statistics.median(timings):8.3f} ms  p95 {p95:8.3f} ms  ({len(timings)} calls)")
+
+
+def google_backend() -> Optional[AsyncLanguageAdapter]:
+    from app.main import init_language_client
+
+    client = init_language_client()
+    # No cache: every call should pay the real round-trip
+    return AsyncLanguageAdapter(client, timeout=10.0) if client else None
+
+
+async def main(rounds: int) -> None:
+    local = LocalNLPBackend()
+    local_results, local_timings = await time_backend(local, rounds)
+    report_latency("local", local_timings)
+
+    google = google_backend()
+    if not google:
+        print(" google: skipped (no credentials)")
+        return
+    try:
+        google_results, google_timings = await time_backend(google, 1)
+    finally:
+        google.shutdown()
+    report_latency("google", google_timings)
+
+    same_polarity = sum(
+        polarity(a.sentiment_score) == polarity(b.sentiment_score)
+        for a, b in zip(local_results, google_results)
+    )
+    overlaps = []
+    for a, b in zip(local_results, google_results):
+        union = entity_names(a) | entity_names(b)
+        overlaps.append(len(entity_names(a) & entity_names(b)) / len(union) if union else 1.0)
+
+    print(f"sentiment polarity agreement: {same_polarity}/{len(SAMPLE_MESSAGES)}")
+    print(f"mean entity Jaccard overlap:  {statistics.mean(overlaps):.2f}")
+    for message, a, b in zip(SAMPLE_MESSAGES, local_results, google_results):
+        if polarity(a.sentiment_score) != polarity(b.sentiment_score):
+            print(f"  disagree ({a.sentiment_score:+.2f} vs {b.sentiment_score:+.2f}): {message}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200, help="timing rounds for the local backend")
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
@@ -0,0 +1,70 @@
+"""Batch variant rendering: throughput, time to first zip bytes, and memory.
+
+Streams zips of N tailored variants of the sample resume (every variant
+has its own summary, so none are cache hits) and reports how long the
+first bytes and the whole zip take, and the peak Python memory of the
+serving process while doing it. Peak memory should stay flat as N grows,
+since only ``window`` renders are in flight at a time.
+
+Usage (from the backend directory):
+    python -m benchmarks.render_batch [--variants 10 100 400] [--window W]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.cache import DiskCache
+from app.core.render_batch import zip_variants
+from app.core.render_cache import render_cache
+from app.core.resume_extraction import get_extraction_pool, shutdown_extraction_pool
+from benchmarks.resume_pdf import SAMPLE_RESUME
+
+
+async def stream_batch(count: int, window: int) -> None:
+    variants = [
+        {'name': f'job-{index}', 'summary': f'{SAMPLE_RESUME["summary"]} Variant {index} of {count}.',
+         'skills': ['Kafka', 'Go'] if index % 2 else ['React', 'TypeScript']}
+        for index in range(count)
+    ]
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    first = None
+    size = 0
+    async for chunk in zip_variants(SAMPLE_RESUME, variants, window):
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    print(f"{count:5} variants: first bytes {first * 1000:7.1f} ms, zip {elapsed:6.2f} s "
+          f"({count / elapsed:6.1f} renders/s, {size / 1024:8.1f} KiB), peak memory {peak / 1024 / 1024:5.2f} MiB")
+
+
+async def main(counts, window: int) -> None:
+    for count in counts:
+        await stream_batch(count, window)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--variants", type=int, nargs="+", default=[10, 100, 400])
+    parser.add_argument("--window", type=int, default=2 * (os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Keep benchmark renders out of the real cache
+        render_cache.cache = DiskCache(directory, max_bytes=1024 * 1024 * 1024)
+        # Start the workers before measuring
+        list(get_extraction_pool().map(abs, range(os.cpu_count() or 1)))
+        tracemalloc.start()
+        try:
+            asyncio.run(main(args.variants, args.window))
+        finally:
+            shutdown_extraction_pool()
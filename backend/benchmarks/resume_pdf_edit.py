@@ -0,0 +1,100 @@
+"""Edit-and-regenerate latency of the resume PDF renderer.
+
+Compares, on one core:
+
+* a full render, with the section cache emptied before every render, so
+  every section is built and broken into lines from scratch;
+* regenerating after editing one experience bullet, so only the
+  experience section is rebuilt and the other sections come from the
+  cache;
+* regenerating with no changes (every section cached; pagination, drawing
+  and writing the PDF still happen).
+
+It also checks that a regenerated PDF is byte-identical to a full render
+of the same resume, and then times the edit case the way the server runs
+it, in another process: through a single render process (the interactive
+path, one warm section cache) and through a process pool with one worker
+per core (where successive edits land on processes with cold caches).
+
+Usage (from the backend directory):
+    python -m benchmarks.resume_pdf_edit [--renders N]
+"""
+import argparse
+from concurrent.futures import Executor, ProcessPoolExecutor
+import copy
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reportlab import rl_config
+
+from app.core import resume_pdf
+from benchmarks.resume_pdf import SAMPLE_RESUME
+
+
+def edited(index: int):
+    resume = copy.deepcopy(SAMPLE_RESUME)
+    bullets = resume['experiences'][2]['description']
+    bullets[1] = f"{bullets[1]} (revision {index})"
+    return resume
+
+
+def timed(render, renders: int) -> float:
+    """Median milliseconds of ``render(i)`` over ``renders`` calls."""
+    samples = []
+    for index in range(renders):
+        start = time.perf_counter()
+        render(index)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def full_render(index: int) -> bytes:
+    resume_pdf._section_cache.clear()
+    return resume_pdf.render_resume_pdf_bytes(edited(index))
+
+
+def edit_through(executor: Executor, resumes, renders: int) -> float:
+    """Median milliseconds of an edit-and-regenerate submitted to ``executor``."""
+    executor.submit(resume_pdf.render_resume_pdf_bytes, SAMPLE_RESUME).result()
+    return timed(lambda index: executor.submit(resume_pdf.render_resume_pdf_bytes, resumes[index]).result(), renders)
+
+
+def main(renders: int) -> None:
+    # No timestamps or random ids in the output, so renders can be compared
+    rl_config.invariant = 1
+    resume_pdf.render_resume_pdf_bytes(SAMPLE_RESUME)
+
+    regenerated = resume_pdf.render_resume_pdf_bytes(edited(-1))
+    identical = regenerated == full_render(-1)
+    print(f"regenerated PDF identical to a full render: {'yes' if identical else 'NO'}")
+
+    # Resumes are built outside the timings of the cached cases too, so all three do the same copying
+    resumes = [edited(index) for index in range(renders)]
+    full = timed(full_render, renders)
+    resume_pdf.render_resume_pdf_bytes(SAMPLE_RESUME)
+    edit = timed(lambda index: resume_pdf.render_resume_pdf_bytes(resumes[index]), renders)
+    unchanged = timed(lambda index: resume_pdf.render_resume_pdf_bytes(SAMPLE_RESUME), renders)
+
+    print(f"full render:              {full:6.2f} ms")
+    print(f"edit one bullet:          {edit:6.2f} ms ({full / edit:.2f}x faster)")
+    print(f"regenerate, no changes:   {unchanged:6.2f} ms ({full / unchanged:.2f}x faster)")
+    print(f"section cache: {resume_pdf._section_cache.stats()}")
+
+    with ProcessPoolExecutor(max_workers=1) as render_process:
+        single = edit_through(render_process, resumes, renders)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        pooled = edit_through(pool, resumes, renders)
+    print(f"edit via render process:  {single:6.2f} ms")
+    print(f"edit via {os.cpu_count()}-process pool: {pooled:6.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=200)
+    args = parser.parse_args()
+    main(args.renders)
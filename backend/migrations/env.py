@@ -0,0 +1,43 @@
+"""Alembic environment: migrates the database the app is configured for."""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlmodel import SQLModel
+
+from app.db import models  # registers every table on SQLModel.metadata
+
+config = context.config
+target_metadata = SQLModel.metadata
+
+# Programmatic runs (app/db/migrate.py) pass their connection and keep the app's logging
+connection = config.attributes.get('connection')
+if connection is None and config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+
+def run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite can only alter tables by copying them
+        render_as_batch=connection.dialect.name == 'sqlite',
+        compare_type=True
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    context.configure(
+        url=models.engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"}
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+elif connection is not None:
+    run_migrations(connection)
+else:
+    with models.engine.connect() as connection:
+        run_migrations(connection)
@@ -0,0 +1,101 @@
+"""Baseline schema, as created by create_all before migrations
+
+Databases created before migrations existed already have exactly these
+tables and are stamped with this revision instead of running it.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sqlmodel.AutoString(), nullable=False),
+        sa.Column('first_name', sqlmodel.AutoString(), nullable=False),
+        sa.Column('last_name', sqlmodel.AutoString(), nullable=False),
+        sa.Column('password_hash', sqlmodel.AutoString(), nullable=False),
+        sa.Column('avatar_url', sqlmodel.AutoString(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('subscription_plan', sqlmodel.AutoString(), nullable=False),
+        sa.Column('subscription_status', sqlmodel.AutoString(), nullable=False),
+        sa.Column('resumes_used', sa.Integer(), nullable=False),
+        sa.Column('resumes_limit', sa.Integer(), nullable=False),
+        sa.Column('email_notifications', sa.Boolean(), nullable=False),
+        sa.Column('job_alerts', sa.Boolean(), nullable=False),
+        sa.Column('weekly_reports', sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_user_email', 'user', ['email'], unique=True)
+
+    op.create_table(
+        'resume',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sqlmodel.AutoString(), nullable=False),
+        sa.Column('email', sqlmodel.AutoString(), nullable=False),
+        sa.Column('role', sqlmodel.AutoString(), nullable=False),
+        sa.Column('file_path', sqlmodel.AutoString(), nullable=False),
+        sa.Column('uploaded_at', sa.DateTime(), nullable=False),
+        sa.Column('ats_score', sa.Float(), nullable=True),
+        sa.Column('status', sqlmodel.AutoString(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table(
+        'coverletter',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('resume_id', sa.Integer(), nullable=False),
+        sa.Column('file_path', sqlmodel.AutoString(), nullable=False),
+        sa.Column('uploaded_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['resume_id'], ['resume.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table(
+        'chatsession',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('resume_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_message_at', sa.DateTime(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(['resume_id'], ['resume.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table(
+        'chatmessage',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('session_id', sa.Integer(), nullable=False),
+        sa.Column('content', sqlmodel.AutoString(), nullable=False),
+        sa.Column('role', sqlmodel.AutoString(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['session_id'], ['chatsession.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('chatmessage')
+    op.drop_table('chatsession')
+    op.drop_table('coverletter')
+    op.drop_table('resume')
+    op.drop_index('ix_user_email', table_name='user')
+    op.drop_table('user')
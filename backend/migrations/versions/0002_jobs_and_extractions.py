@@ -0,0 +1,58 @@
+"""Extraction results and the background job queue
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 12:15:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resumeextraction',
+        sa.Column('resume_id', sa.Integer(), nullable=False),
+        sa.Column('text', sqlmodel.AutoString(), nullable=False),
+        sa.Column('structured', sqlmodel.AutoString(), nullable=False),
+        sa.Column('extracted_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['resume_id'], ['resume.id']),
+        sa.PrimaryKeyConstraint('resume_id')
+    )
+    op.create_table(
+        'job',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('kind', sqlmodel.AutoString(), nullable=False),
+        sa.Column('resume_id', sa.Integer(), nullable=True),
+        sa.Column('payload', sqlmodel.AutoString(), nullable=False),
+        sa.Column('status', sqlmodel.AutoString(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), nullable=False),
+        sa.Column('run_after', sa.DateTime(), nullable=False),
+        sa.Column('locked_by', sqlmodel.AutoString(), nullable=True),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sqlmodel.AutoString(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['resume_id'], ['resume.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_job_resume_id', 'job', ['resume_id'])
+    op.create_index('ix_job_status', 'job', ['status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_status', table_name='job')
+    op.drop_index('ix_job_resume_id', table_name='job')
+    op.drop_table('job')
+    op.drop_table('resumeextraction')
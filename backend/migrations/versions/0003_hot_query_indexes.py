@@ -0,0 +1,48 @@
+"""Indexes for the hot read paths
+
+- resume.uploaded_at: latest resume
+- resume.file_path, coverletter.file_path: blob reference counts
+- coverletter.resume_id: a resume's cover letter
+- chatmessage (session_id, created_at, id): a session's messages in order
+- chatsession (resume_id, created_at, id): a resume's sessions in order
+- job (status, run_after): claiming due jobs; replaces the status-only index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 12:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_resume_uploaded_at', 'resume', ['uploaded_at'])
+    op.create_index('ix_resume_file_path', 'resume', ['file_path'])
+    op.create_index('ix_coverletter_resume_id', 'coverletter', ['resume_id'])
+    op.create_index('ix_coverletter_file_path', 'coverletter', ['file_path'])
+    op.create_index('ix_chatmessage_session_id_created_at', 'chatmessage', ['session_id', 'created_at', 'id'])
+    op.create_index('ix_chatsession_resume_id_created_at', 'chatsession', ['resume_id', 'created_at', 'id'])
+    op.create_index('ix_job_status_run_after', 'job', ['status', 'run_after'])
+    op.drop_index('ix_job_status', table_name='job')
+
+
+def downgrade() -> None:
+    op.create_index('ix_job_status', 'job', ['status'])
+    op.drop_index('ix_job_status_run_after', table_name='job')
+    op.drop_index('ix_chatsession_resume_id_created_at', table_name='chatsession')
+    op.drop_index('ix_chatmessage_session_id_created_at', table_name='chatmessage')
+    op.drop_index('ix_coverletter_file_path', table_name='coverletter')
+    op.drop_index('ix_coverletter_resume_id', table_name='coverletter')
+    op.drop_index('ix_resume_file_path', table_name='resume')
+    op.drop_index('ix_resume_uploaded_at', table_name='resume')
@@ -0,0 +1,32 @@
+"""Keep the chat endpoint's resume on the session
+
+Adds ``chatsession.resume_snapshot``, the latest resume JSON sent to
+the chat endpoint for a session.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 13:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('chatsession') as batch:
+        batch.add_column(sa.Column('resume_snapshot', sqlmodel.AutoString(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('chatsession') as batch:
+        batch.drop_column('resume_snapshot')
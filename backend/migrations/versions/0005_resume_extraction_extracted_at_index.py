@@ -0,0 +1,31 @@
+"""Index resumeextraction.extracted_at
+
+The ranking index checks max(extracted_at) before every ranking to tell
+whether any resume was re-extracted; without the index that reads the
+whole table, extraction texts included.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 13:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_resumeextraction_extracted_at', 'resumeextraction', ['extracted_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resumeextraction_extracted_at', table_name='resumeextraction')
@@ -56,14 +56,23 @@ export const Chat: React.FC<ChatProps> = ({ resumeId }) => {
 
   const loadSessions = async () => {
     try {
-      const response = await fetch(`${apiUrl}/api/v1/chat/sessions/${resumeId}`);
-      if (!response.ok) throw new Error('Failed to load chat sessions');
-      
-      const data = await response.json();
-      setSessions(data);
-      
-      // Set current session to the most recent active session
-      const activeSession = data.find((s: ChatSession) => s.is_active);
+      // Pages come newest first (each page oldest first); prev_cursor pages back
+      let loaded: ChatSession[] = [];
+      let activeSession: ChatSession | undefined;
+      let before: string | null = null;
+      do {
+        const query: string = before ? `?before=${encodeURIComponent(before)}` : '';
+        const response = await fetch(`${apiUrl}/api/v1/chat/sessions/${resumeId}${query}`);
+        if (!response.ok) throw new Error('Failed to load chat sessions');
+
+        const data: { sessions: ChatSession[]; prev_cursor: string | null } = await response.json();
+        loaded = [...data.sessions, ...loaded];
+        // Most recent active session; older pages are only read until one is found
+        activeSession = [...data.sessions].reverse().find((s: ChatSession) => s.is_active);
+        before = data.prev_cursor;
+      } while (!activeSession && before);
+      setSessions(loaded);
+
       if (activeSession) {
         setCurrentSession(activeSession);
       }
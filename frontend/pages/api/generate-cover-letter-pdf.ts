@@ -1,8 +1,7 @@
 import type { NextApiRequest, NextApiResponse } from 'next';
 import formidable from 'formidable';
-import fs from 'fs';
-import path from 'path';
-import PDFDocument from 'pdfkit';
+import { Readable } from 'stream';
+import type { ReadableStream } from 'stream/web';
 
 export const config = {
   api: {
@@ -20,38 +19,40 @@ export default async function handler(
 
   try {
     const form = formidable();
-    const [fields, files] = await form.parse(req);
+    const [fields] = await form.parse(req);
     const content = fields.content?.[0];
+    const resumeId = fields.resume_id?.[0];
 
     if (!content) {
       return res.status(400).json({ message: 'No content provided' });
     }
 
-    // Create uploads directory if it doesn't exist
-    const uploadsDir = path.join(process.cwd(), 'public', 'uploads');
-    fs.mkdirSync(uploadsDir, { recursive: true });
-
-    // Generate unique filename
-    const timestamp = Date.now();
-    const filename = `generated-cover-letter-${timestamp}.pdf`;
-    const filepath = path.join(uploadsDir, filename);
-
-    // Create PDF
-    const doc = new PDFDocument();
-    const stream = fs.createWriteStream(filepath);
-
-    doc.pipe(stream);
-    doc.fontSize(12).text(content);
-    doc.end();
-
-    // Wait for the stream to finish
-    await new Promise<void>((resolve) => stream.on('finish', resolve));
+    // The backend renders the PDF and streams it back; nothing is written here
+    const backendUrl = process.env.BACKEND_URL || 'http://localhost:8000';
+    const backendResponse = await fetch(`${backendUrl}/api/v1/resumes/generate-cover-letter-pdf`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({
+        content,
+        resume_id: resumeId ? Number(resumeId) : undefined,
+      }),
+    });
+
+    if (!backendResponse.ok || !backendResponse.body) {
+      const data = await backendResponse.json().catch(() => ({ message: 'Failed to generate PDF' }));
+      return res.status(backendResponse.status || 500).json(data);
+    }
 
-    // Return the URL for the generated PDF
-    const fileUrl = `/uploads/${filename}`;
-    res.status(200).json({ url: fileUrl });
+    res.status(200);
+    for (const header of ['content-type', 'content-length', 'content-disposition', 'x-cover-letter-id']) {
+      const value = backendResponse.headers.get(header);
+      if (value) {
+        res.setHeader(header, value);
+      }
+    }
+    Readable.fromWeb(backendResponse.body as ReadableStream<Uint8Array>).pipe(res);
   } catch (error) {
     console.error('Error generating PDF:', error);
     res.status(500).json({ message: 'Failed to generate PDF' });
   }
-}
\ No newline at end of file
+}
@@ -51,6 +51,30 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
       throw new Error(`Failed to upload file: ${await uploadResponse.text()}`);
     }
 
+    const { resume_id: resumeId } = await uploadResponse.json() as { resume_id: number };
+
+    // Parsing runs as a background job; wait for it to finish
+    let status = 'queued';
+    for (let attempt = 0; attempt < 3 && (status === 'queued' || status === 'processing'); attempt++) {
+      const statusResponse = await fetch(
+        `${appConfig.apiUrl}/api/v1/resumes/${resumeId}/status?wait=20&since=${status}`,
+        { headers: { 'Accept': 'application/json' } }
+      );
+      if (!statusResponse.ok) break;
+      status = (await statusResponse.json() as { status: string }).status;
+    }
+
+    if (status === 'processed') {
+      const extractionResponse = await fetch(`${appConfig.apiUrl}/api/v1/resumes/${resumeId}/extraction`, {
+        headers: { 'Accept': 'application/json' },
+      });
+      if (extractionResponse.ok) {
+        const extraction = await extractionResponse.json() as { resume: Resume };
+        return res.status(200).json(extraction.resume);
+      }
+    }
+
+    // The backend could not parse the file; fall back to an empty resume
     const parsedResume: Resume = {
       contactInfo: {
         email: '',